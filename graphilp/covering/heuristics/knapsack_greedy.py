@@ -0,0 +1,231 @@
+import numpy as np
+from gurobipy import Model, GRB
+from scipy.sparse import csc_matrix, csr_matrix
+
+
+def _instance(S, W):
+    """ Get the coefficient matrix, the profits and the capacities of a knapsack instance as arrays
+    """
+    M = csc_matrix(S.M, dtype=float)
+    profits = np.asarray(S.get_set_weights('value', default=None), dtype=float)
+    capacities = np.broadcast_to(np.asarray(W, dtype=float), (M.shape[0],))
+
+    return M, profits, capacities
+
+
+def lp_relaxation(S, W):
+    r""" Solve the LP relaxation of the multidimensional knapsack problem
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+    :param W: capacity of each knapsack
+
+    :return: the LP bound, the LP solution, the reduced costs of the items, and the dual values of the capacities
+
+    LP:
+        .. math::
+            :nowrap:
+
+            \begin{align*}
+            \max w^{\top}x \\
+            \text{s.t.} &&\\
+            Mx \leq W && \text{(do not exceed capacity in any dimension)}\\
+            0 \leq x \leq 1\\
+            \end{align*}
+    """
+    M, profits, capacities = _instance(S, W)
+
+    m = Model("graphilp_max_knapsack_lp")
+    m.Params.OutputFlag = 0
+    x = m.addMVar(shape=len(profits), lb=0, ub=1, name="x")
+    constraints = m.addConstr(M @ x <= capacities, name="packing")
+    m.setObjective(profits @ x, GRB.MAXIMIZE)
+    m.optimize()
+
+    return m.ObjVal, x.X, x.RC, constraints.Pi
+
+
+def dynamic_programming(S, W):
+    """ Exact pseudo-polynomial algorithm for the knapsack problem with one dimension and integral sizes
+
+    The table of the best profits for all capacities is updated with one vectorised NumPy operation per item.
+    The choices are stored as a boolean table with one row per item, so the memory needed is
+    proportional to the number of items times the capacity.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem` with a single row in
+        its incidence matrix
+    :param W: capacity of the knapsack
+
+    :return: a list of items forming an optimal solution
+    """
+    M, profits, capacities = _instance(S, W)
+    if M.shape[0] != 1:
+        raise ValueError("Dynamic programming needs a knapsack problem with a single dimension.")
+
+    sizes = np.rint(M.toarray()[0]).astype(np.int64)
+    capacity = int(capacities[0])
+
+    # best[c]: maximal profit with total size at most c
+    best = np.zeros(capacity + 1)
+    taken = np.zeros((len(profits), capacity + 1), dtype=bool)
+
+    for item in range(len(profits)):
+        size = sizes[item]
+        if profits[item] <= 0 or size > capacity:
+            continue
+        if size <= 0:
+            taken[item, :] = True
+            best += profits[item]
+            continue
+        candidate = best[:-size] + profits[item]
+        improved = candidate > best[size:]
+        taken[item, size:] = improved
+        best[size:] = np.where(improved, candidate, best[size:])
+
+    # trace the choices back from the full capacity
+    solution = []
+    rest = capacity
+    for item in range(len(profits) - 1, -1, -1):
+        if taken[item, rest]:
+            solution.append(item)
+            rest -= max(sizes[item], 0)
+
+    return S.get_set_names()[solution[::-1]].tolist()
+
+
+def surrogate_greedy(S, W, multipliers=None):
+    """ Greedy heuristic for the multidimensional knapsack problem based on a surrogate relaxation
+
+    The constraints are aggregated into a single surrogate constraint with the given multipliers.
+    Items are then considered by decreasing ratio of profit and surrogate size and added to the knapsack
+    if they fit into all dimensions.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+    :param W: capacity of each knapsack
+    :param multipliers: non-negative weights of the constraints, by default the dual values of the LP relaxation
+
+    :return: a list of items that fit into the knapsack
+    """
+    M, profits, capacities = _instance(S, W)
+
+    if multipliers is None:
+        multipliers = lp_relaxation(S, W)[3]
+        # avoid ignoring constraints that are not tight in the LP
+        multipliers = multipliers + 1e-6 / np.maximum(capacities, 1)
+
+    surrogate_sizes = multipliers @ M
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(surrogate_sizes > 0, profits / surrogate_sizes, np.inf)
+
+    load = np.zeros(M.shape[0])
+    chosen = []
+    for item in np.argsort(-ratios, kind='stable'):
+        if profits[item] <= 0:
+            continue
+        rows = M.indices[M.indptr[item]:M.indptr[item + 1]]
+        new_load = load[rows] + M.data[M.indptr[item]:M.indptr[item + 1]]
+        if (new_load <= capacities[rows]).all():
+            load[rows] = new_load
+            chosen.append(item)
+
+    return S.get_set_names()[sorted(chosen)].tolist()
+
+
+def reduced_cost_fixing(S, W, lower_bound, lp=None):
+    """ Find items whose value is the same in all solutions better than a known solution
+
+    If forcing an item out of (into) the LP solution decreases the LP bound by its reduced cost to a
+    value below the profit of a known solution, the item is in (not in) every better solution.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+    :param W: capacity of each knapsack
+    :param lower_bound: the profit of a known solution
+    :param lp: the result of :py:func:`lp_relaxation` if already computed
+
+    :return: two arrays with the indices of the items fixed to zero and to one
+    """
+    if lp is None:
+        lp = lp_relaxation(S, W)
+    bound, x, reduced_costs, _ = lp
+
+    fixed_zero = np.flatnonzero((x < 1e-9) & (bound + reduced_costs < lower_bound - 1e-6))
+    fixed_one = np.flatnonzero((x > 1 - 1e-9) & (bound - reduced_costs < lower_bound - 1e-6))
+
+    return fixed_zero, fixed_one
+
+
+def core_heuristic(S, W, core_size=50, time_limit=10, warmstart=[], lp=None):
+    """ Solve the multidimensional knapsack problem restricted to a core of items
+
+    Items with large reduced costs in the LP relaxation rarely change their LP value in an optimal solution.
+    The core consists of the items with the smallest absolute reduced costs (including all fractional items).
+    All other items are fixed to their rounded-down LP values and the remaining ILP is solved with a time limit.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+    :param W: capacity of each knapsack
+    :param core_size: number of items in the core
+    :param time_limit: time limit in seconds for solving the core problem
+    :param warmstart: a list of items that fit into the knapsack
+    :param lp: the result of :py:func:`lp_relaxation` if already computed
+
+    :return: a list of items that fit into the knapsack
+    """
+    M, profits, capacities = _instance(S, W)
+    if lp is None:
+        lp = lp_relaxation(S, W)
+    _, x_lp, reduced_costs, _ = lp
+
+    core = np.zeros(len(profits), dtype=bool)
+    core[np.argsort(np.abs(reduced_costs), kind='stable')[:core_size]] = True
+    core |= (x_lp > 1e-9) & (x_lp < 1 - 1e-9)
+    fixed = np.floor(x_lp + 1e-9)
+
+    m = Model("graphilp_max_knapsack_core")
+    m.Params.OutputFlag = 0
+    m.Params.TimeLimit = time_limit
+    x = m.addMVar(shape=len(profits), vtype=GRB.BINARY, name="x")
+    x.LB = np.where(core, 0, fixed)
+    x.UB = np.where(core, 1, fixed)
+    m.addConstr(csr_matrix(M) @ x <= capacities, name="packing")
+    m.setObjective(profits @ x, GRB.MAXIMIZE)
+
+    # the warmstart is only used if it agrees with the fixed items
+    set_names = S.get_set_names()
+    if len(warmstart) > 0:
+        warmstart = set(warmstart)
+        start = np.array([name in warmstart for name in set_names], dtype=float)
+        if (start[~core] == fixed[~core]).all():
+            x.Start = start
+
+    m.optimize()
+    if m.SolCount == 0:
+        return []
+
+    return set_names[x.X > 0.5].tolist()
+
+
+def get_heuristic(S, W, max_table_size=10**8):
+    """ Heuristic for the multidimensional knapsack problem
+
+    For a single dimension with integral sizes and a dynamic programming table of at most max_table_size entries,
+    an optimal solution is computed by :py:func:`dynamic_programming`. Otherwise, the solution of
+    :py:func:`surrogate_greedy` with the dual values of the LP relaxation as multipliers is returned.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+    :param W: capacity of each knapsack
+    :param max_table_size: maximal number of items times capacity for using dynamic programming
+
+    :return: a list of items that fit into the knapsack
+
+    Example:
+        .. code-block::
+
+            items = knapsack_greedy.get_heuristic(S, W)
+            m = knapsack.create_model(S, W, warmstart=items, fix_variables=True)
+    """
+    M, profits, capacities = _instance(S, W)
+
+    if M.shape[0] == 1 and (M.data == np.rint(M.data)).all() and capacities[0] == np.rint(capacities[0]) \
+            and len(profits) * (capacities[0] + 1) <= max_table_size:
+        return dynamic_programming(S, W)
+
+    return surrogate_greedy(S, W)
@@ -1,4 +1,6 @@
-from numpy import ones
+from heapq import heapify, heappop, heappush
+from numpy import zeros
+from scipy.sparse import csc_matrix
 
 
 def get_heuristic(S, k=None):
@@ -8,6 +10,12 @@ def get_heuristic(S, k=None):
         In this case, the heuristic greedily approximates the maximal number of vertices that can
         be covered with at most k sets otherwise there is no limit on the number of sets.
 
+        The heuristic always picks the set with the lowest weight per newly covered element.
+        Since the number of newly covered elements of a set can only decrease during the run,
+        the ratios are kept in a priority queue and only updated when a set reaches the top of the queue
+        (lazy greedy). The incidence matrix is used in compressed sparse column (CSC) format so that
+        each update only touches the elements of one set.
+
         :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
         :param k: maximal number of sets to use
 
@@ -16,44 +24,48 @@ def get_heuristic(S, k=None):
 
     # set upper bound for number of sets to be chosen
     if k is None:
-        k = len(S.S)
+        k = S.M.shape[1]
 
     # abbreviations
-    set_names = list(S.S.keys())
-    set_index = range(len(S.S))
-    set_sizes = sum(S.M)
+    set_names = S.get_set_names()
+    weights = S.get_set_weights(default=None).tolist()
+    M = csc_matrix(S.M)
+    M.eliminate_zeros()
+    indptr, indices = M.indptr, M.indices
 
-    # which elements of the universe are not yet covered by the solution?
-    not_covered = ones((len(S.U),), dtype=int)
+    # which elements of the universe are already covered by the solution?
+    covered = zeros((M.shape[0],), dtype=bool)
+    num_not_covered = M.shape[0]
 
-    # all sets can still be used
-    sets = set(set_index)
+    # priority queue of weight per newly covered element (lower bounds for the current values)
+    queue = [(weights[_set] / (indptr[_set + 1] - indptr[_set]), _set)
+             for _set in range(len(set_names)) if indptr[_set + 1] > indptr[_set]]
+    heapify(queue)
 
     result = []
 
     # while there are elements to be covered and sets to choose from
-    while any(not_covered) and (len(result) < k) and len(sets) > 0:
+    while num_not_covered > 0 and (len(result) < k) and len(queue) > 0:
+        ratio, _set = heappop(queue)
 
-        # pick most efficient set and add it to the solution
-        chosen_set = min([(S.S[set_names[_set]]['weight'] / set_sizes[_set], _set) for _set in sets])[1]
-        result.append(chosen_set)
+        # update number of newly covered elements of the set
+        elements = indices[indptr[_set]:indptr[_set + 1]]
+        new_elements = elements[~covered[elements]]
 
-        # update which elements are not yet covered
-        not_covered = not_covered * (1 - S.M[:, chosen_set])
+        # all elements of the set are covered
+        if len(new_elements) == 0:
+            continue
 
-        # remove chosen set
-        sets.remove(chosen_set)
+        current_ratio = weights[_set] / len(new_elements)
 
-        # update set sizes
-        covered = list()
-        for _set in sets:
-            set_sizes[_set] = sum(not_covered & S.M[:, _set])
-            # if all elements of a set are covered
-            if set_sizes[_set] == 0:
-                covered.append(_set)
+        if current_ratio > ratio:
+            # the set is no longer the best choice, reinsert with its current value
+            heappush(queue, (current_ratio, _set))
+            continue
 
-        # remove covered sets
-        for _set in covered:
-            sets.remove(_set)
+        # pick most efficient set and add it to the solution
+        result.append(_set)
+        covered[new_elements] = True
+        num_not_covered -= len(new_elements)
 
-    return [set_names[s] for s in result]
+    return set_names[result].tolist()
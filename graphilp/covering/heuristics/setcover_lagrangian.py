@@ -0,0 +1,150 @@
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+from scipy.sparse import csc_matrix
+
+
+def _repair(by_set, by_element, x, reduced_costs):
+    """ Complete a partial solution to a cover by a greedy heuristic on the Lagrangian costs
+
+    :return: a boolean vector of the chosen sets
+    """
+    x = x.copy()
+    covered = (by_element @ x) > 0
+
+    # lazy greedy on the ratio of non-negative Lagrangian cost and newly covered elements
+    costs = np.maximum(reduced_costs, 0)
+    candidates = np.unique(by_element[~covered].indices)
+    queue = [(costs[_set] / (by_set.indptr[_set + 1] - by_set.indptr[_set]), _set) for _set in candidates]
+    heapify(queue)
+
+    while len(queue) > 0 and not covered.all():
+        ratio, _set = heappop(queue)
+        elements = by_set.indices[by_set.indptr[_set]:by_set.indptr[_set + 1]]
+        new_elements = elements[~covered[elements]]
+        if len(new_elements) == 0:
+            continue
+
+        current_ratio = costs[_set] / len(new_elements)
+        if current_ratio > ratio:
+            heappush(queue, (current_ratio, _set))
+            continue
+
+        x[_set] = True
+        covered[new_elements] = True
+
+    return x
+
+
+def _remove_redundant(by_set, by_element, x, weights):
+    """ Remove sets from a cover whose elements are all covered by other sets, most expensive sets first
+    """
+    x = x.copy()
+    count = by_element @ x.astype(np.int64)
+
+    chosen = np.flatnonzero(x)
+    for _set in chosen[np.argsort(-weights[chosen], kind='stable')]:
+        elements = by_set.indices[by_set.indptr[_set]:by_set.indptr[_set + 1]]
+        if (count[elements] > 1).all():
+            x[_set] = False
+            count[elements] -= 1
+
+    return x
+
+
+def get_heuristic(S, max_iter=1000, repair_interval=10, step_factor=2.0, patience=20):
+    r""" Lagrangian relaxation heuristic for the weighted set cover problem
+
+    Relaxing the covering constraints with multipliers :math:`u \geq 0` gives the Lagrangian lower bound
+
+    .. math::
+
+        L(u) = \sum_{e \in U} u_e + \sum_{s \in S} \min(0, w_s - \sum_{e \in s} u_e).
+
+    The multipliers are improved by subgradient optimisation. Every few iterations, the sets with negative
+    Lagrangian cost are completed to a cover by a greedy heuristic on the Lagrangian costs and redundant sets
+    are removed from the cover. All computations on the multipliers are vectorised over the sparse incidence
+    matrix. The search stops when the gap between the best cover and the best bound is closed (for integral
+    weights, a gap below one suffices), the step size becomes negligible, or after max_iter iterations.
+
+    The cover can be used as a warmstart for :py:func:`graphilp.covering.set_cover.create_model`,
+    the bound to assess its quality. Every element of the universe needs to be contained in at least one set.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+    :param max_iter: maximal number of subgradient iterations
+    :param repair_interval: number of iterations between two constructions of a cover
+    :param step_factor: initial factor of the subgradient step size
+    :param patience: number of iterations without improvement of the bound after which the step factor is halved
+
+    :return: a list of sets forming a cover and a lower bound on the weight of a minimum set cover
+
+    Example:
+        .. code-block::
+
+            cover, lower_bound = setcover_lagrangian.get_heuristic(S)
+            m = set_cover.create_model(S, warmstart=cover)
+    """
+    # abbreviations
+    set_names = S.get_set_names()
+    weights = S.get_set_weights().astype(float)
+    by_set = csc_matrix(S.M, dtype=float)
+    by_set.eliminate_zeros()
+    by_set.data[:] = 1
+    by_element = by_set.tocsr()
+    set_sizes = np.diff(by_set.indptr)
+
+    # initial multipliers: cheapest cost per element of the sets containing an element
+    ratios = weights / np.maximum(set_sizes, 1)
+    u = np.full(by_set.shape[0], np.inf)
+    np.minimum.at(u, by_set.indices, np.repeat(ratios, set_sizes))
+    u[np.isinf(u)] = 0
+
+    # upper bound from the cover of the initial multipliers
+    best_x = _remove_redundant(by_set, by_element,
+                               _repair(by_set, by_element, np.zeros(len(weights), dtype=bool), weights - u @ by_set),
+                               weights)
+    upper_bound = weights[best_x].sum()
+    lower_bound = 0.0
+
+    factor = step_factor
+    no_improvement = 0
+
+    # for integral weights, the optimum is the smallest integer above the lower bound
+    gap_tolerance = 1 - 1e-6 if np.all(weights == np.round(weights)) else 1e-6
+
+    for iteration in range(max_iter):
+        reduced_costs = weights - u @ by_set
+        x = reduced_costs < 0
+        value = u.sum() + reduced_costs[x].sum()
+
+        if value > lower_bound + 1e-9:
+            lower_bound = value
+            no_improvement = 0
+        else:
+            no_improvement += 1
+            if no_improvement >= patience:
+                factor /= 2
+                no_improvement = 0
+
+        # construct a cover from the Lagrangian solution
+        if iteration % repair_interval == 0:
+            cover = _remove_redundant(by_set, by_element, _repair(by_set, by_element, x, reduced_costs), weights)
+            if weights[cover].sum() < upper_bound:
+                best_x, upper_bound = cover, weights[cover].sum()
+
+        if upper_bound - lower_bound < gap_tolerance or factor < 1e-4:
+            break
+
+        # subgradient step, elements that are already covered with zero multiplier cannot decrease
+        subgradient = 1 - by_element @ x.astype(float)
+        subgradient[(u <= 0) & (subgradient < 0)] = 0
+        norm = subgradient @ subgradient
+        if norm == 0:
+            # the Lagrangian solution is a cover without overlap and hence optimal
+            best_x, upper_bound = x, weights[x].sum()
+            break
+
+        step = factor * (upper_bound - value) / norm
+        u = np.maximum(u + step * subgradient, 0)
+
+    return set_names[best_x].tolist(), min(lower_bound, upper_bound)
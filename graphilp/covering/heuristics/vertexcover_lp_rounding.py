@@ -1,4 +1,35 @@
-from gurobipy import Model, GRB, quicksum
+from graphilp.matching.hopcroft_karp import maximum_matching, konig_vertex_cover
+
+
+def crown_decomposition(adj):
+    r""" Half-integral optimal solution of the vertex cover LP (Nemhauser-Trotter decomposition)
+
+    Each vertex :math:`v` is split into a left copy :math:`v_L` and a right copy :math:`v_R` and each edge
+    :math:`\{u, v\}` into the edges :math:`\{u_L, v_R\}` and :math:`\{v_L, u_R\}` of the bipartite double cover.
+    For a minimum vertex cover :math:`C` of the double cover, computed by Hopcroft-Karp matching and
+    König's theorem, :math:`x_v = (|\{v_L, v_R\} \cap C|) / 2` is an optimal solution of the LP relaxation.
+
+    By the theorem of Nemhauser and Trotter, there is a minimum vertex cover containing all vertices with
+    :math:`x_v = 1` and no vertex with :math:`x_v = 0`. Only the vertices with :math:`x_v = 1/2` remain
+    to be decided.
+
+    :param adj: a dictionary mapping each vertex to an iterable of its neighbours (e.g., the adj attribute of
+        a NetworkX graph without self-loops)
+
+    :return: three lists with the vertices of LP value 0, 1/2, and 1
+    """
+    node_list = list(adj)
+    node_index = {node: pos for pos, node in enumerate(node_list)}
+    double_cover = [[node_index[nb] for nb in adj[node]] for node in node_list]
+
+    match_left, match_right = maximum_matching(double_cover, len(node_list))
+    cover_left, cover_right = konig_vertex_cover(double_cover, len(node_list), match_left, match_right)
+
+    parts = ([], [], [])
+    for pos, node in enumerate(node_list):
+        parts[cover_left[pos] + cover_right[pos]].append(node)
+
+    return parts
 
 
 def get_heuristic(G):
@@ -18,33 +49,20 @@ def get_heuristic(G):
             \min \sum_{v\in V} x_v\\
             \text{s.t.}&&\\
             \forall \{u, v\} \in E: x_u + x_v \geq 1 && \text{(at least one vertex in each edge is covered)}\\
-            \forall v \in V: & x_v \geq 0\\
-            \forall v \in V: & x_v \leq 1\\
+            \forall v \in V: & 0 \leq x_v \leq 1\\
             \end{align*}
-    """
-    # create model
-    m = Model("graphilp_min_vertex_cover")
-
-    # add continuous variables for the nodes
-    nodes = m.addVars(G.G.nodes())
-    m.update()
 
-    # set objective: minimise the sum of node values
-    m.setObjective(quicksum(nodes.values()), GRB.MINIMIZE)
-
-    # create constraints
-    # for every edge, at least one vertex must be in a vertex cover of G
-    for (u, v) in G.G.edges():
-        m.addConstr(nodes[u] + nodes[v] >= 1)
-
-    for node_var in nodes.values():
-        m.addConstr(node_var <= 1)
-        m.addConstr(node_var >= 0)
+        An optimal half-integral solution is computed combinatorially by
+        :py:func:`crown_decomposition` without calling an LP solver. Rounding up all vertices of value
+        1/2 gives a vertex cover of at most twice the optimal size.
+    """
+    adj = {node: [nb for nb in G.G.adj[node] if nb != node] for node in G.G.nodes()}
+    _, half, one = crown_decomposition(adj)
 
-    # solve model
-    m.optimize()
+    # vertices with a self-loop must be in the cover
+    loops = [node for node in G.G.nodes() if G.G.has_edge(node, node)]
 
-    # round the LP to get a valid vertex cover
-    warmstart = [node for node, node_var in nodes.items() if node_var.X >= 0.5]
+    chosen = set(half) | set(one) | set(loops)
+    warmstart = [node for node in G.G.nodes() if node in chosen]
 
     return warmstart
@@ -1,27 +1,55 @@
-def get_heuristic(G):
+def get_heuristic(G, order=None, prune=False):
     """ Approximate solution to the minimum vertex cover problem via maximal matching heuristic
 
-    This heuristic successively chooses an edge in the graph, adds its vertices to the vertex cover
-    and then deletes all edges adjacent to these vertices because they are already covered.
+    This heuristic successively chooses an edge in the graph whose vertices are both uncovered and adds
+    its vertices to the vertex cover. The chosen edges form a maximal matching, so the cover has at most
+    twice the size of a minimum vertex cover.
+
+    The edges are scanned once while a boolean array over the vertex indices keeps track of
+    the covered vertices, so the running time is linear in the size of the graph.
+
+    With order='degree', the vertices are scanned by decreasing degree and each uncovered vertex is matched with
+    its uncovered neighbour of highest degree. High degree vertices cover many edges, which tends to lead to
+    smaller maximal matchings. With prune=True, vertices all of whose neighbours are in the cover are removed from
+    the cover afterwards, lowest degree first.
 
     :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param order: None to scan the edges in the order of the graph, 'degree' to scan vertices by decreasing degree
+    :param prune: remove redundant vertices from the cover
 
     :return: a list of vertices forming a vertex cover of G
     """
-    warmstart = []
-    G_copy = G.G.copy()
+    node_list = list(G.G.nodes())
+    node_index = {node: pos for pos, node in enumerate(node_list)}
+    covered = bytearray(len(node_list))
 
-    # successively delete covered edges until all edges are covered
-    while G_copy.number_of_edges() > 0:
-        # choose an edge
-        edge = list(G_copy.edges())[0]
+    warmstart = []
 
-        # add vertices of the edge to vertex cover
-        for v in edge:
-            warmstart.append(v)
+    if order is None:
+        # scan all edges once
+        for u, v in G.G.edges():
+            iu, iv = node_index[u], node_index[v]
+            if not covered[iu] and not covered[iv]:
+                covered[iu] = covered[iv] = 1
+                warmstart.extend((u, v) if u != v else (u,))
+    elif order == 'degree':
+        degree = dict(G.G.degree())
+        for u in sorted(node_list, key=degree.get, reverse=True):
+            if covered[node_index[u]]:
+                continue
+            candidates = [v for v in G.G.adj[u] if not covered[node_index[v]]]
+            if len(candidates) > 0:
+                v = max(candidates, key=degree.get)
+                covered[node_index[u]] = covered[node_index[v]] = 1
+                warmstart.extend((u, v) if u != v else (u,))
+    else:
+        raise ValueError(f"Unknown order {order}.")
 
-        # remove all edges adjacent to the chosen edge
-        remove_edges = list(G_copy.edges(edge))
-        G_copy.remove_edges_from(remove_edges)
+    if prune:
+        degree = dict(G.G.degree())
+        for u in sorted(warmstart, key=degree.get):
+            if not G.G.has_edge(u, u) and all(covered[node_index[v]] for v in G.G.adj[u]):
+                covered[node_index[u]] = 0
+        warmstart = [u for u in warmstart if covered[node_index[u]]]
 
     return warmstart
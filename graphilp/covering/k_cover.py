@@ -1,13 +1,52 @@
 from gurobipy import Model, GRB
 import numpy as np
+from scipy.sparse import csr_matrix
 
 
-def create_model(S, k, warmstart=[]):
+def _identical_rows(M):
+    """ Group identical rows of a sparse matrix by hashing
+
+    :param M: a sparse matrix
+
+    :return: an array assigning each row the index of its class and the index of one row per class
+    """
+    M = csr_matrix(M, dtype=bool)
+    M.eliminate_zeros()
+    M.sort_indices()
+    sizes = np.diff(M.indptr)
+
+    # random linear hash of the row patterns
+    col_hash = np.random.default_rng(0).random(M.shape[1])
+    row_hash = M @ col_hash
+
+    _, first, labels = np.unique(np.stack((row_hash, sizes)), axis=1, return_index=True, return_inverse=True)
+    labels = labels.ravel()
+
+    # verify each row against the first row of its class, rows with hash collisions get a class of their own
+    row_of_entry = np.repeat(np.arange(M.shape[0]), sizes)
+    offset = np.arange(M.nnz) - M.indptr[row_of_entry]
+    first_entry = M.indptr[first[labels[row_of_entry]]] + offset
+    collided = np.unique(row_of_entry[M.indices != M.indices[first_entry]])
+    labels[collided] = len(first) + np.arange(len(collided))
+
+    # number the classes in the order of their first row
+    _, representatives, labels = np.unique(labels, return_index=True, return_inverse=True)
+    order = np.argsort(representatives)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    return rank[labels.ravel()], representatives[order]
+
+
+def create_model(S, k, warmstart=[], collapse_elements=False):
     r""" Greate an ILP for the k-cover problem
 
     :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
     :param k: maximal number of sets in solution
     :param warmstart: a list of sets forming a cover
+    :param collapse_elements: merge elements of the universe that are contained in exactly the same sets into
+        one element whose weight is the sum of their weights; the universe variables then belong to
+        the merged elements and S.element_classes maps each element to its merged element
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -32,9 +71,22 @@ def create_model(S, k, warmstart=[]):
     # Create model
     m = Model("graphilp_k_coverage")
 
+    # set weight vector
+    obj = S.get_element_weights()
+    M = S.M
+
+    # merge identical rows of the incidence matrix
+    if collapse_elements:
+        element_classes, representatives = _identical_rows(M)
+        S.set_element_classes(element_classes)
+        obj = np.bincount(element_classes, weights=obj, minlength=len(representatives))
+        M = M[representatives]
+    else:
+        S.set_element_classes(None)
+
     # Add variables for sets
-    len_S = len(S.S)
-    len_U = len(S.U)
+    len_S = M.shape[1]
+    len_U = M.shape[0]
     x = m.addMVar(shape=len_S, vtype=GRB.BINARY, name="x")
     S.set_system_vars(x)
     m.update()
@@ -44,11 +96,8 @@ def create_model(S, k, warmstart=[]):
     S.set_universe_vars(y)
     m.update()
 
-    # set weight vector
-    obj = np.array([val['weight'] for _set, val in S.U.items()])
-
     # Add constraints for covering
-    m.addConstr(S.M @ x >= y, name="covering")
+    m.addConstr(M @ x >= y, name="covering")
 
     # Add constraints for packing
     b = np.ones((len_S,), dtype=int)
@@ -59,21 +108,10 @@ def create_model(S, k, warmstart=[]):
 
     # set warmstart
     if len(warmstart) > 0:
-
-        for pos in range(len(S.U)):
-            y[pos].Start = 0
-
-        sets = list(S.S.keys())
-        for pos in range(len(sets)):
-            if sets[pos] in warmstart:
-                x[pos].Start = 1
-
-                covered = S.M[:, pos]
-                for element in range(len(covered)):
-                    if covered[element] > 0:
-                        y[element].Start = 1
-            else:
-                x[pos].Start = 0
+        warmstart = set(warmstart)
+        chosen = np.array([_set in warmstart for _set in S.get_set_names()], dtype=float)
+        x.Start = chosen
+        y.Start = (M @ chosen > 0).astype(float)
 
         m.update()
 
@@ -88,7 +126,6 @@ def extract_solution(S, model):
 
     :return: list of sets contained in the solution of the k-cover
     """
-    iterate = list(range(len(S.S)))
-    set_cover = [list(S.S.keys())[i] for i in iterate if S.system_variables.X[i] > 0.5]
+    set_cover = S.get_set_names()[S.system_variables.X > 0.5].tolist()
 
     return set_cover
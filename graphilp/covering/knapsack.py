@@ -1,12 +1,18 @@
 from gurobipy import Model, GRB
 from numpy import array
 
+from graphilp.covering.heuristics import knapsack_greedy
 
-def create_model(S, W):
+
+def create_model(S, W, warmstart=[], fix_variables=False):
     r""" Create an ILP for the multi-dimensional knapsack problem
 
     :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`.
     :param W: capacity of each knapsack
+    :param warmstart: a list of items that fit into the knapsack
+    :param fix_variables: fix items whose LP reduced costs prove that they do not change in solutions better
+        than the warmstart (see :py:func:`~graphilp.covering.heuristics.knapsack_greedy.reduced_cost_fixing`);
+        without warmstart, :py:func:`~graphilp.covering.heuristics.knapsack_greedy.get_heuristic` provides one
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -27,20 +33,37 @@ def create_model(S, W):
     # Create model
     m = Model("graphilp_max_knapsack")
 
+    # set weight vector
+    obj = S.get_set_weights('value', default=None)
+
     # Add variables
-    x = m.addMVar(shape=len(S.S), vtype=GRB.BINARY, name="x")
+    x = m.addMVar(shape=len(obj), vtype=GRB.BINARY, name="x")
     S.set_system_vars(x)
     m.update()
 
-    # set weight vector
-    obj = array([val['value'] for _set, val in S.S.items()])
-
     # Add constraints for covering
     m.addConstr(S.M @ x <= W, name="packing")
 
     # set optimisation objective: maximize weight of the set packing
     m.setObjective(obj @ x, GRB.MAXIMIZE)
 
+    # fix items by LP reduced costs with respect to a heuristic solution
+    if fix_variables:
+        if len(warmstart) == 0:
+            warmstart = knapsack_greedy.get_heuristic(S, W)
+        chosen = set(warmstart)
+        lower_bound = sum(value for name, value in zip(S.get_set_names(), obj) if name in chosen)
+        fixed_zero, fixed_one = knapsack_greedy.reduced_cost_fixing(S, W, lower_bound)
+        x[fixed_zero].UB = 0
+        x[fixed_one].LB = 1
+
+    # set warmstart
+    if len(warmstart) > 0:
+        warmstart = set(warmstart)
+        x.Start = array([name in warmstart for name in S.get_set_names()], dtype=float)
+
+    m.update()
+
     return m
 
 
@@ -52,7 +75,6 @@ def extract_solution(S, model):
 
     :return: list of items contained in the knapsack solution
     """
-    iterate = list(range(len(S.S)))
-    knapsack = [list(S.S.keys())[i] for i in iterate if S.system_variables.X[i] > 0.5]
+    knapsack = S.get_set_names()[S.system_variables.X > 0.5].tolist()
 
     return knapsack
@@ -1,12 +1,20 @@
 from gurobipy import Model, quicksum, GRB
 
+from graphilp.covering import vertexcover_bipartite
+from graphilp.packing.indset_reductions import IndependentSetKernel
 
-def create_model(G, weight='weight', warmstart=[]):
+
+def create_model(G, weight='weight', warmstart=[], kernelize=False, lp_reduction=False):
     r""" Create an ILP for the minimum vertex cover problem
 
     :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
     :param weight: name of the weight parameter in the node dictionary of the graph
     :param warmstart: a list of vertices forming a vertex cover of G
+    :param kernelize: reduce the graph with :py:class:`~graphilp.packing.indset_reductions.IndependentSetKernel`
+        first and build the ILP on the kernel; the objective value still refers to the whole graph
+        (only for graphs in which all vertices have the same weight)
+    :param lp_reduction: fix the vertices of LP value 0 and 1 in the Nemhauser-Trotter decomposition and build the ILP
+        only on the vertices of LP value 1/2 (can be combined with kernelize, same restriction on the weights)
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -24,26 +32,46 @@ def create_model(G, weight='weight', warmstart=[]):
     # Create model
     m = Model("graphilp_min_vertex_cover")
 
+    # reduce the graph
+    if kernelize or lp_reduction:
+        weights = {G.G.nodes[node].get(weight, 1) for node in G.G.nodes()}
+        if len(weights) > 1:
+            raise ValueError("Kernelization and LP reduction are only supported for vertex cover with uniform weights.")
+        node_weight = weights.pop() if len(weights) > 0 else 1
+
+        G.set_kernel(IndependentSetKernel(G.G, rules=kernelize, lp_reduction=lp_reduction))
+        graph = G.kernel.kernel
+        offset = node_weight * G.kernel.cover_offset()
+        weight_of = {node: node_weight for node in graph.nodes()}
+    else:
+        G.set_kernel(None)
+        graph = G.G
+        offset = 0
+        weight_of = {node: G.G.nodes()[node].get(weight, 1) for node in graph.nodes()}
+
     # Add variables for edges and nodes
-    G.set_node_vars(m.addVars(G.G.nodes(), vtype=GRB.BINARY))
+    G.set_node_vars(m.addVars(graph.nodes(), vtype=GRB.BINARY))
     m.update()
 
     nodes = G.node_variables
 
     # Create constraints
     # for every edge, at least one vertex must be in a vertex cover of G
-    for (u, v) in G.G.edges:
+    for (u, v) in graph.edges:
         m.addConstr(nodes[u] + nodes[v] >= 1)
 
     # set optimisation objective: minimize total node weight of the vertex cover
-    m.setObjective(quicksum([node_var * G.G.nodes()[node].get(weight, 1)
-                                       for node, node_var in nodes.items()]),
+    m.setObjective(quicksum([node_var * weight_of[node]
+                             for node, node_var in nodes.items()]) + offset,
                    GRB.MINIMIZE)
 
     # set warmstart
+    # (folded vertices of a kernel get no start value)
     if len(warmstart) > 0:
+        warmstart = set(warmstart)
         for node in nodes:
-            nodes[node].Start = node in warmstart
+            if node in G.G:
+                nodes[node].Start = node in warmstart
         m.update()
 
     return m
@@ -59,4 +87,31 @@ def extract_solution(G, model):
     """
     vertex_nodes = [node for node, node_var in G.node_variables.items() if node_var.X > 0.5]
 
+    # lift the solution of the kernel to the whole graph
+    if G.kernel is not None:
+        vertex_nodes = G.kernel.lift_vertex_cover(vertex_nodes)
+
     return vertex_nodes
+
+
+def solve(G, weight='weight', **kwargs):
+    """ Solve the minimum vertex cover problem, directly if the graph is bipartite
+
+    Bipartite graphs are detected in linear time and solved without an ILP by
+    :py:func:`~graphilp.covering.vertexcover_bipartite.get_vertex_cover`. For other graphs,
+    the ILP is created, optimised and the solution extracted.
+
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param weight: name of the weight parameter in the node dictionary of the graph
+    :param kwargs: further arguments for :py:func:`create_model` if an ILP is needed
+
+    :return: list of vertices of minimum vertex cover
+    """
+    cover = vertexcover_bipartite.get_vertex_cover(G, weight)
+    if cover is not None:
+        return cover
+
+    m = create_model(G, weight=weight, **kwargs)
+    m.optimize()
+
+    return extract_solution(G, m)
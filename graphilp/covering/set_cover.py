@@ -1,12 +1,17 @@
-from numpy import array, ones
+from numpy import array, arange, concatenate, ones, sort
 from gurobipy import Model, GRB
 
+from graphilp.covering import set_cover_presolve
 
-def create_model(S, warmstart=[]):
+
+def create_model(S, warmstart=[], presolve=False):
     r""" Greate an ILP for the set cover problem
 
     :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
     :param warmstart: a list of sets forming a cover
+    :param presolve: reduce the instance with :py:func:`~graphilp.covering.set_cover_presolve.presolve` first;
+        the ILP then only contains the remaining sets and elements and the weight of the forced sets is added
+        as a constant to the objective
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -28,32 +33,42 @@ def create_model(S, warmstart=[]):
     # Create model
     m = Model("graphilp_min_set_cover")
 
+    # set weight vector
+    obj = S.get_set_weights()
+    M = S.M
+
+    # reduce the instance
+    if presolve:
+        sets, elements, forced = set_cover_presolve.presolve(S)
+        S.set_presolved((sets, forced))
+        M = M[elements][:, sets]
+        forced_weight = obj[forced].sum()
+        obj = obj[sets]
+    else:
+        sets = arange(len(obj))
+        forced_weight = 0
+        S.set_presolved(None)
+
     # Add variables
-    len_x = len(S.S)
-    len_b = len(S.U)
+    len_x = len(sets)
+    len_b = M.shape[0]
     x = m.addMVar(shape=len_x, vtype=GRB.BINARY, name="x")
     S.set_system_vars(x)
     m.update()
 
     # add  vector b for the right-hand side
     b = ones((len_b,), dtype=int)
-    # set weight vector
-    obj = array([val.get('weight', 1) for _set, val in S.S.items()])
 
     # add constraints
-    m.addConstr(S.M @ x >= b, name="c")
+    m.addConstr(M @ x >= b, name="c")
 
     # set optimisation objective: minimize weight of the set cover
-    m.setObjective(obj @ x, GRB.MINIMIZE)
+    m.setObjective(obj @ x + forced_weight, GRB.MINIMIZE)
 
     # set warmstart
     if len(warmstart) > 0:
-        sets = list(S.S.keys())
-        for pos in range(len(sets)):
-            if sets[pos] in warmstart:
-                x[pos].Start = 1
-            else:
-                x[pos].Start = 0
+        warmstart = set(warmstart)
+        x.Start = array([name in warmstart for name in S.get_set_names()[sets]], dtype=float)
 
         m.update()
 
@@ -68,7 +83,14 @@ def extract_solution(S, model):
 
     :return: sets of the optimal set cover solution
     """
-    iterate = list(range(len(S.S)))
-    set_cover = [list(S.S.keys())[i] for i in iterate if S.system_variables.X[i] > 0.5]
+    set_names = S.get_set_names()
+    chosen = S.system_variables.X > 0.5
+
+    if S.presolved is None:
+        set_cover = set_names[chosen].tolist()
+    else:
+        # map sets of the reduced instance back to the original set names
+        sets, forced = S.presolved
+        set_cover = set_names[sort(concatenate((sets[chosen], forced)))].tolist()
 
     return set_cover
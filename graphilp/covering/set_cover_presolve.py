@@ -0,0 +1,187 @@
+import numpy as np
+from scipy.sparse import csc_matrix, coo_matrix
+
+
+def _duplicates(M, keys):
+    """ Find duplicate columns of a sparse matrix by hashing
+
+    :param M: a sparse matrix in CSC format with sorted indices
+    :param keys: a vector giving a preference among duplicates (lower is better)
+
+    :return: a boolean vector marking all columns that are duplicates of a preferred column
+    """
+    num_cols = M.shape[1]
+    sizes = np.diff(M.indptr)
+
+    # random linear hash of the column patterns
+    row_hash = np.random.default_rng(0).random(M.shape[0])
+    col_hash = M.T @ row_hash
+
+    order = np.lexsort((np.arange(num_cols), keys, sizes, col_hash))
+    duplicate = np.zeros(num_cols, dtype=bool)
+
+    same = (col_hash[order[1:]] == col_hash[order[:-1]]) & (sizes[order[1:]] == sizes[order[:-1]])
+    for pos in np.flatnonzero(same):
+        # verify candidates with identical hash values exactly against the first column of the run
+        second = order[pos + 1]
+        first = order[pos]
+        while duplicate[first]:
+            pos -= 1
+            first = order[pos]
+        if np.array_equal(M.indices[M.indptr[first]:M.indptr[first + 1]],
+                          M.indices[M.indptr[second]:M.indptr[second + 1]]):
+            duplicate[second] = True
+
+    return duplicate
+
+
+def _gather(M, columns):
+    """ Positions of the entries of the given columns of a CSC matrix (rows of a CSR matrix) in its index array
+    """
+    counts = np.diff(M.indptr)[columns]
+    starts = M.indptr[columns]
+
+    return np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+
+def _dominated(M, chunk_size=1 << 22):
+    """ Find columns of a 0/1 matrix without duplicate columns whose support is contained in another column
+
+    Every column containing column :math:`j` also contains the row of :math:`j` with the fewest entries,
+    so only the larger columns sharing this row are candidates. Candidates whose row signature
+    (the rows modulo 64 as a bit mask) is not a superset are skipped, the others are checked entry by entry.
+    The work is bounded by the sum of the number of entries of column :math:`j` times the number of
+    entries of its rarest row, which is usually much smaller than the product :math:`M^T M`. The columns
+    are processed in chunks such that this bound is at most chunk_size per chunk, which limits the memory.
+
+    :param M: a sparse matrix in CSC format
+    :param chunk_size: bound on the number of entries checked at once
+
+    :return: a sparse matrix in COO format whose entries (j, k) with j != k indicate that
+        column j is contained in column k
+    """
+    M = csc_matrix(M)
+    M.sort_indices()
+    num_rows, num_cols = M.shape
+    sizes = np.diff(M.indptr)
+    rows = M.indices.astype(np.int64)
+    cols = np.repeat(np.arange(num_cols), sizes)
+    nonempty = np.flatnonzero(sizes > 0)
+
+    # row with the fewest entries of each non-empty column
+    row_sizes = np.bincount(rows, minlength=num_rows)
+    by_row_size = np.lexsort((row_sizes[rows], cols))
+    rarest = rows[by_row_size[M.indptr[nonempty]]]
+
+    Mr = M.tocsr()
+    Mr.sort_indices()
+
+    # the row signature of a column contains the signature of every column contained in it
+    signature = np.zeros(num_cols, dtype=np.uint64)
+    np.bitwise_or.at(signature, cols, np.left_shift(np.uint64(1), (rows % 64).astype(np.uint64)))
+
+    # entries sorted by column and row for the exact check
+    keys = cols * num_rows + rows
+
+    pairs_j, pairs_k = [], []
+    work = np.cumsum(row_sizes[rarest] * sizes[nonempty])
+    start = 0
+    while start < len(nonempty):
+        done = work[start - 1] if start > 0 else 0
+        end = max(start + 1, int(np.searchsorted(work, done + chunk_size, side='right')))
+
+        # candidate pairs (j, k): column k shares the rarest row of column j, is larger and has a superset signature
+        cand_j = np.repeat(nonempty[start:end], row_sizes[rarest[start:end]])
+        cand_k = Mr.indices[_gather(Mr, rarest[start:end])]
+        candidate = (sizes[cand_k] > sizes[cand_j]) & ((signature[cand_j] & ~signature[cand_k]) == 0)
+        cand_j, cand_k = cand_j[candidate], cand_k[candidate]
+
+        # look up all entries of column j in column k
+        queries = np.repeat(cand_k, sizes[cand_j]) * num_rows + rows[_gather(M, cand_j)]
+        found = keys[np.minimum(np.searchsorted(keys, queries), len(keys) - 1)] == queries
+        pair = np.repeat(np.arange(len(cand_j)), sizes[cand_j])
+        contained = np.bincount(pair, weights=found, minlength=len(cand_j)) == sizes[cand_j]
+
+        pairs_j.append(cand_j[contained])
+        pairs_k.append(cand_k[contained])
+        start = end
+
+    pairs_j = np.concatenate(pairs_j) if pairs_j else np.zeros(0, dtype=np.int64)
+    pairs_k = np.concatenate(pairs_k) if pairs_k else np.zeros(0, dtype=np.int64)
+
+    return coo_matrix((np.ones(len(pairs_j), dtype=bool), (pairs_j, pairs_k)), shape=(num_cols, num_cols))
+
+
+def presolve(S):
+    r""" Reduce a set cover instance by domination and forced sets
+
+    The following reductions are applied until none of them changes the instance any more:
+
+    * **Forced sets:** if an element is contained in only one set, this set is part of every cover.
+      The set is fixed and all elements it contains are removed.
+    * **Element domination:** if the sets containing element :math:`u` form a superset of
+      the sets containing element :math:`v`, every cover of :math:`v` also covers :math:`u`,
+      so :math:`u` can be removed. Of identical elements, only one is kept.
+    * **Set domination:** if set :math:`s` is a subset of set :math:`t` (on the remaining elements)
+      and :math:`w_t \leq w_s`, set :math:`s` can be replaced by :math:`t` in any cover and is removed.
+      Of identical sets, only the cheapest one is kept. Sets without remaining elements are removed.
+
+    Duplicates are detected by hashing the columns of the sparse incidence matrix. For containment,
+    a column is only compared with the columns sharing its row with the fewest entries. The weights of the sets need to be non-negative.
+
+    :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+
+    :return: three arrays with the indices of the remaining sets, the remaining elements, and the forced sets
+    """
+    M = csc_matrix(S.M, dtype=bool)
+    M.eliminate_zeros()
+    weights = S.get_set_weights()
+
+    sets = np.arange(M.shape[1])
+    elements = np.arange(M.shape[0])
+    forced = []
+
+    changed = True
+    while changed:
+        changed = False
+        R = M[elements][:, sets].tocsc()
+        R.sort_indices()
+
+        # forced sets: unique cover of an element
+        row_sizes = np.diff(R.tocsr().indptr)
+        single = row_sizes == 1
+        if single.any():
+            forced_pos = np.unique(R.tocsr()[single].indices)
+            forced.extend(sets[forced_pos])
+            covered = np.asarray(R[:, forced_pos].sum(axis=1)).ravel() > 0
+            keep_sets = np.ones(len(sets), dtype=bool)
+            keep_sets[forced_pos] = False
+            sets, elements = sets[keep_sets], elements[~covered]
+            changed = True
+            continue
+
+        # elements: remove duplicates and elements dominated by another element
+        # (elements not contained in any set cannot be covered and are kept)
+        Rt = R.T.tocsc()
+        Rt.sort_indices()
+        remove = _duplicates(Rt, np.zeros(len(elements)))
+        remaining = np.flatnonzero(~remove & (row_sizes > 0))
+        contained = _dominated(Rt[:, remaining].tocsc())
+        remove[remaining[np.unique(contained.col)]] = True
+        if remove.any():
+            elements = elements[~remove]
+            changed = True
+            continue
+
+        # sets: remove empty sets, duplicates and sets dominated by a cheaper superset
+        set_weights = weights[sets]
+        remove = (np.diff(R.indptr) == 0) | _duplicates(R, set_weights)
+        remaining = np.flatnonzero(~remove)
+        contained = _dominated(R[:, remaining])
+        cheaper = set_weights[remaining[contained.col]] <= set_weights[remaining[contained.row]]
+        remove[remaining[contained.row[cheaper]]] = True
+        if remove.any():
+            sets = sets[~remove]
+            changed = True
+
+    return sets, elements, np.array(sorted(forced), dtype=int)
@@ -0,0 +1,82 @@
+from networkx import DiGraph, minimum_cut
+
+from graphilp.matching.hopcroft_karp import maximum_matching, konig_vertex_cover
+
+
+def bipartition(G):
+    """ Split the vertices of a graph into two sides such that every edge connects both sides
+
+    The graph is two-coloured by breadth-first search in time :math:`O(|V| + |E|)`.
+
+    :param G: a `NetworkX graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+
+    :return: two lists of vertices or None if the graph is not bipartite
+    """
+    side = {}
+    for start in G.nodes():
+        if start in side:
+            continue
+        side[start] = 0
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for v in G.adj[u]:
+                if v not in side:
+                    side[v] = 1 - side[u]
+                    queue.append(v)
+                elif side[v] == side[u]:
+                    return None
+
+    left = [node for node in G.nodes() if side[node] == 0]
+    right = [node for node in G.nodes() if side[node] == 1]
+
+    return left, right
+
+
+def get_vertex_cover(G, weight='weight', weighted=True):
+    """ Minimum weight vertex cover of a bipartite graph without an ILP
+
+    If all vertices have the same weight, a maximum matching is computed by the Hopcroft-Karp algorithm and
+    turned into a minimum vertex cover by König's theorem. Otherwise, the vertex cover is obtained from a minimum
+    cut separating a source connected to the left side from a sink connected to the right side, where the
+    capacities of the source and sink edges are the weights of the vertices and the edges of the graph
+    have infinite capacity.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param weight: name of the weight parameter in the node dictionary of the graph
+    :param weighted: use the vertex weights; if False, a minimum cardinality vertex cover is computed
+
+    :return: a list of vertices forming a minimum weight vertex cover or None if the graph is not bipartite
+    """
+    sides = bipartition(G.G)
+    if sides is None:
+        return None
+    left, right = sides
+
+    if weighted:
+        weights = {node: G.G.nodes[node].get(weight, 1) for node in G.G.nodes()}
+    else:
+        weights = {node: 1 for node in G.G.nodes()}
+
+    if len(set(weights.values())) <= 1:
+        right_index = {node: pos for pos, node in enumerate(right)}
+        adj = [[right_index[nb] for nb in G.G.adj[node]] for node in left]
+        match_left, match_right = maximum_matching(adj, len(right))
+        cover_left, cover_right = konig_vertex_cover(adj, len(right), match_left, match_right)
+        cover = {node for node, chosen in zip(left, cover_left) if chosen}
+        cover |= {node for node, chosen in zip(right, cover_right) if chosen}
+    else:
+        network = DiGraph()
+        source, sink = object(), object()
+        # source and sink are added explicitly since one side may be empty
+        network.add_nodes_from((source, sink))
+        network.add_edges_from((source, node, {'capacity': weights[node]}) for node in left)
+        network.add_edges_from((node, sink, {'capacity': weights[node]}) for node in right)
+        network.add_edges_from((u, v) for u in left for v in G.G.adj[u])
+        _, (source_side, _) = minimum_cut(network, source, sink)
+        cover = {node for node in left if node not in source_side}
+        cover |= {node for node in right if node in source_side}
+
+    return [node for node in G.G.nodes() if node in cover]
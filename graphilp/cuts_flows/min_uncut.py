@@ -1,5 +1,4 @@
 from gurobipy import Model, GRB, quicksum
-from networkx import complement
 
 
 def create_model(G):
@@ -34,14 +33,15 @@ def create_model(G):
 
     nodes = G.node_variables
 
-    GC = complement(G.G)
+    # edges of the complement graph
+    complement_edges = list(G.get_bitsets().non_edges())
 
-    edges = m.addVars(GC.edges(), vtype=GRB.BINARY)
+    edges = m.addVars(complement_edges, vtype=GRB.BINARY)
     m.update()
 
     # Create constraints
     # for every edge, the nodes must be separated in the complement graph
-    for (u, v) in GC.edges():
+    for (u, v) in complement_edges:
         m.addConstr(edges[(u, v)] <= nodes[v] + nodes[u])
         m.addConstr(edges[(u, v)] <= 2 - nodes[v] - nodes[u])
 
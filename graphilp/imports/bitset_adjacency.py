@@ -0,0 +1,123 @@
+from itertools import repeat
+
+import numpy as np
+
+
+class BitsetAdjacency:
+    """ Adjacency of a graph as packed bitsets
+
+    Vertex :math:`i` of the node list corresponds to bit :math:`i`, the neighbourhood of every vertex is stored in
+    a Python integer used as a bitset (self-loops are left out). Intersections, complements and popcounts of
+    neighbourhoods are then single operations on machine words instead of lookups of vertex pairs in
+    the edge set of the graph. The rows are built from NumPy boolean arrays packed into bytes.
+
+    :param G: a `NetworkX graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+    :param node_list: order of the vertices (default: order of the graph)
+
+    Example:
+        .. code-block::
+
+            bitsets = G.get_bitsets()
+            for u, v in bitsets.non_edges():
+                ...
+    """
+
+    def __init__(self, G, node_list=None):
+        self.node_list = list(G.nodes()) if node_list is None else list(node_list)
+        self.node_index = {node: pos for pos, node in enumerate(self.node_list)}
+        n = len(self.node_list)
+        self.all_bits = (1 << n) - 1
+
+        # vertices in an object array for fast selection by bit positions
+        self.node_array = np.empty(n, dtype=object)
+        for pos, node in enumerate(self.node_list):
+            self.node_array[pos] = node
+
+        self.rows = []
+        row = np.zeros(n, dtype=bool)
+        for node in self.node_list:
+            neighbours = [self.node_index[nb] for nb in G.adj[node] if nb != node]
+            row[neighbours] = True
+            self.rows.append(self._pack(row))
+            row[neighbours] = False
+
+    @staticmethod
+    def _pack(row):
+        return int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little')
+
+    def _indices(self, bits):
+        """ Positions of the bits set in a bitset
+        """
+        n = len(self.node_list)
+        packed = np.frombuffer(bits.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+
+        # only unpack the non-zero bytes, which is much faster for sparse bitsets
+        nonzero = np.flatnonzero(packed)
+        byte_pos, bit_pos = np.nonzero(np.unpackbits(packed[nonzero, None], axis=1, bitorder='little'))
+        return nonzero[byte_pos] * 8 + bit_pos
+
+    def bitset(self, nodes):
+        """ Bitset of a collection of vertices
+
+        :param nodes: an iterable of vertices
+
+        :return: a Python integer with the bits of the vertices set
+        """
+        row = np.zeros(len(self.node_list), dtype=bool)
+        row[[self.node_index[node] for node in nodes]] = True
+        return self._pack(row)
+
+    def nodes(self, bits):
+        """ Vertices of a bitset
+
+        :param bits: a Python integer used as bitset
+
+        :return: a list of vertices in the order of the node list
+        """
+        return self.node_array[self._indices(bits)].tolist()
+
+    def neighbours(self, node):
+        """ Bitset of the neighbours of a vertex
+
+        :param node: a vertex
+
+        :return: a Python integer used as bitset
+        """
+        return self.rows[self.node_index[node]]
+
+    def non_neighbours(self, node, within=None):
+        """ Vertices other than the given one that are not adjacent to it
+
+        :param node: a vertex
+        :param within: bitset of the vertices to consider (default: all vertices)
+
+        :return: a list of vertices in the order of the node list
+        """
+        pos = self.node_index[node]
+        bits = (self.all_bits if within is None else within) & ~self.rows[pos] & ~(1 << pos)
+        return self.nodes(bits)
+
+    def common_neighbours(self, u, v):
+        """ Number of common neighbours of two vertices
+
+        :param u: a vertex
+        :param v: a vertex
+
+        :return: the size of the intersection of both neighbourhoods
+        """
+        return (self.rows[self.node_index[u]] & self.rows[self.node_index[v]]).bit_count()
+
+    def non_edges(self, nodes=None):
+        """ Pairs of distinct vertices not connected by an edge
+
+        Each pair :math:`(u, v)` is returned once, with :math:`u` before :math:`v` in the node list.
+
+        :param nodes: restrict the pairs to these vertices (default: all vertices)
+
+        :return: a generator of pairs of vertices
+        """
+        within = self.all_bits if nodes is None else self.bitset(nodes)
+        for pos in self._indices(within).tolist():
+            # only later vertices, so that each pair is returned once
+            later = within & ~self.rows[pos] & ~((2 << pos) - 1)
+            yield from zip(repeat(self.node_list[pos]), self.nodes(later))
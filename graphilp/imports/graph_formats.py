@@ -1,6 +1,9 @@
 from networkx import Graph
+import gzip
 import re
 
+import numpy as np
+
 
 def edges_to_networkx(path):
     """
@@ -36,6 +39,50 @@ def edges_to_networkx(path):
     return G
 
 
+def edges_chunks(path, chunk_size=2**24):
+    """
+    Streams the edges of an .edges file (`Network Repository format <http://networkrepository.com>`__) in chunks.
+
+    Unlike :py:func:`edges_to_networkx`, the graph is never held in memory: the file is read in blocks of about
+    chunk_size bytes and the end points of the edges in each block are returned as two NumPy integer arrays.
+    Lines starting with % or # are skipped, columns after the first two (e.g., weights) are ignored.
+    All edge lines are expected to have the same number of columns.
+
+    :param path: path to .edges file (may be gzipped)
+    :type path: str
+    :param chunk_size: approximate number of bytes read at once
+    :type chunk_size: int
+    :returns: a generator of pairs of NumPy arrays with the first and second end points of the edges
+
+    Example:
+        for u, v in edges_chunks("huge_graph.edges"):
+            ...
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    num_columns = None
+
+    with opener(path, "rb") as input_file:
+        while True:
+            block = input_file.read(chunk_size)
+            if len(block) == 0:
+                break
+            # complete the last line of the block
+            block += input_file.readline()
+
+            if b'%' in block or b'#' in block:
+                block = b'\n'.join(line for line in block.split(b'\n')
+                                   if not line.lstrip().startswith((b'%', b'#')))
+
+            tokens = block.split()
+            if len(tokens) == 0:
+                continue
+            if num_columns is None:
+                num_columns = len(next(line for line in block.splitlines() if len(line.split()) > 0).split())
+
+            yield (np.array(tokens[0::num_columns], dtype=np.int64),
+                   np.array(tokens[1::num_columns], dtype=np.int64))
+
+
 def stp_to_networkx(path):
     """
     Creates a NetworkX Graph from an .stp file (`SteinLib format <http://steinlib.zib.de/format.php>`__).
@@ -1,3 +1,6 @@
+from graphilp.imports.bitset_adjacency import BitsetAdjacency
+
+
 class ILPGraph:
     """ Wrapper class for graph instances and variables of a related integer linear program
     """
@@ -8,6 +11,38 @@ class ILPGraph:
         :param G: a `NetworkX graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
         """
         self.G = G
+        self.bitsets = None
+        self.kernel = None
+        self.clique_system = None
+
+    def get_bitsets(self):
+        """ Get the adjacency of the graph as packed bitsets
+
+        The :py:class:`~graphilp.imports.bitset_adjacency.BitsetAdjacency` is computed on first use and kept
+        until a new graph is set. It does not reflect later changes of the NetworkX graph.
+
+        :return: a :py:class:`~graphilp.imports.bitset_adjacency.BitsetAdjacency`
+        """
+        if self.bitsets is None:
+            self.bitsets = BitsetAdjacency(self.G)
+
+        return self.bitsets
+
+    def set_kernel(self, kernel):
+        """ Set the kernel of the graph on which a model is built
+
+        :param kernel: an :py:class:`~graphilp.packing.indset_reductions.IndependentSetKernel`
+            or None if the model is built on the whole graph
+        """
+        self.kernel = kernel
+
+    def set_clique_system(self, S):
+        """ Set the set system of enumerated cliques on which a model is built
+
+        :param S: an :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem` whose elements are the vertices
+            and whose sets are the cliques, or None if the model is built on the graph
+        """
+        self.clique_system = S
 
     def set_edge_vars(self, variables):
         """ Set the dictionary of edge variables
@@ -1,9 +1,136 @@
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+from scipy.sparse import csc_matrix
+
+
+def _to_array(names):
+    """ Convert a collection of names into a NumPy array of objects without unpacking tuples
+    """
+    return np.fromiter(names, dtype=object, count=len(names))
+
+
+class _AttributeView(Mapping):
+    """ Read-only dictionary view of names and weights stored in arrays
+
+    Maps each name to a dictionary holding its weight under the given key, like the dictionaries
+    used for ILPSetSystem.S and ILPSetSystem.U.
+    """
+
+    def __init__(self, names, weights, key):
+        self.names = names
+        self.weights = weights
+        self.key = key
+        self.index = None
+
+    def __getitem__(self, name):
+        if self.index is None:
+            self.index = {name: pos for pos, name in enumerate(self.names)}
+        return {self.key: self.weights[self.index[name]].item()}
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
 class ILPSetSystem:
     """ Wrapper class for set systems (undirected hyper graphs)
 
     Joint representation of set system instances and variables of a related integer linear program
     """
 
+    @classmethod
+    def from_records(cls, records, element_weights=None, weight='weight'):
+        """ Create a set system from a stream of sets in one pass
+
+        The incidence matrix is built as a compressed sparse column (CSC) matrix with int32 indices.
+        Names and weights of sets and elements are kept in NumPy arrays. The dictionaries S and U are
+        replaced by read-only views of these arrays.
+
+        :param records: an iterable of triples (set name, elements, weight); the elements are either an iterable
+            of elements or a dictionary mapping elements to their coefficients in the incidence matrix
+        :param element_weights: an optional dictionary of weights of the elements of the universe (default 1)
+        :param weight: the key under which the weights of the sets are accessible in S, e.g., 'value' for knapsack
+
+        :return: an :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+
+        Example:
+            .. code-block::
+
+                S = ILPSetSystem.from_records([('a', [1, 2], 3.0), ('b', [2, 3], 1.0)])
+        """
+        element_index = {}
+        set_names = []
+        set_weights = array('d')
+        indptr = array('q', [0])
+        indices = array('i')
+        data = None
+
+        for name, elements, set_weight in records:
+            set_names.append(name)
+            set_weights.append(set_weight)
+
+            if isinstance(elements, Mapping):
+                if data is None:
+                    # coefficients other than one: store all entries explicitly
+                    data = array('d', [1.0]) * len(indices)
+                data.extend(elements.values())
+                elements = elements.keys()
+            elif data is not None:
+                elements = list(elements)
+                data.extend([1.0] * len(elements))
+
+            for element in elements:
+                indices.append(element_index.setdefault(element, len(element_index)))
+            indptr.append(len(indices))
+
+        indptr = np.frombuffer(indptr, dtype=np.int64)
+        if indptr[-1] < np.iinfo(np.int32).max:
+            indptr = indptr.astype(np.int32)
+        indices = np.frombuffer(indices, dtype=np.int32)
+        data = np.ones(len(indices), dtype=np.int8) if data is None else np.frombuffer(data, dtype=np.float64)
+
+        M = csc_matrix((data, indices, indptr), shape=(len(element_index), len(set_names)), copy=False)
+        if element_weights is not None:
+            element_weights = [element_weights.get(element, 1) for element in element_index]
+
+        return cls.from_arrays(M, np.frombuffer(set_weights, dtype=np.float64), set_names=set_names,
+                               element_names=list(element_index), element_weights=element_weights, weight=weight)
+
+    @classmethod
+    def from_arrays(cls, M, set_weights, set_names=None, element_names=None, element_weights=None, weight='weight'):
+        """ Create a set system from an incidence matrix and arrays of weights and names
+
+        The arrays are used without building dictionaries. The dictionaries S and U are
+        replaced by read-only views of these arrays.
+
+        :param M: the incidence matrix of the set system (elements as rows and sets as columns)
+        :param set_weights: the weights of the sets
+        :param set_names: the names of the sets (default 0, 1, 2, ...)
+        :param element_names: the names of the elements of the universe (default 0, 1, 2, ...)
+        :param element_weights: the weights of the elements of the universe (default 1)
+        :param weight: the key under which the weights of the sets are accessible in S, e.g., 'value' for knapsack
+
+        :return: an :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+        """
+        num_elements, num_sets = M.shape
+        if set_names is None:
+            set_names = range(num_sets)
+        if element_names is None:
+            element_names = range(num_elements)
+        if element_weights is None:
+            element_weights = np.ones(num_elements)
+
+        S = cls()
+        S.set_system(_AttributeView(_to_array(set_names), np.asarray(set_weights), weight))
+        S.set_universe(_AttributeView(_to_array(element_names), np.asarray(element_weights, dtype=float), 'weight'))
+        S.set_inc_matrix(M)
+
+        return S
+
     def set_universe(self, U):
         """ Set the universe of the set system
 
@@ -26,6 +153,24 @@ class ILPSetSystem:
         :param M: the incidence matrix of the set system
         """
         self.M = M
+        self.presolved = None
+        self.element_classes = None
+
+    def set_presolved(self, presolved):
+        """ Set the reduction of the set system used by a presolved model
+
+        :param presolved: a pair of the indices of the remaining sets and the indices of the sets fixed to be in
+            the solution, or None if the model uses the whole set system
+        """
+        self.presolved = presolved
+
+    def set_element_classes(self, element_classes):
+        """ Set the classes of identical elements used by a model with merged elements
+
+        :param element_classes: an array mapping each element of the universe to the index of its merged element,
+            or None if the model uses the elements of the universe
+        """
+        self.element_classes = element_classes
 
     def set_system_vars(self, variables):
         """ Set the dictionary of indicator variables for the elements of the system
@@ -40,3 +185,46 @@ class ILPSetSystem:
         :param variables: a dictionary with variable names as keys and gurobipy variables as values
         """
         self.universe_variables = variables
+
+    def get_set_names(self):
+        """ Get the names of the sets in the order of the columns of the incidence matrix
+
+        :return: a NumPy array of set names
+        """
+        if isinstance(self.S, _AttributeView):
+            return self.S.names
+        return _to_array(list(self.S.keys()))
+
+    def get_set_weights(self, key='weight', default=1):
+        """ Get the weights of the sets in the order of the columns of the incidence matrix
+
+        :param key: name of the weight in the dictionaries of the sets, e.g., 'value' for knapsack
+        :param default: weight of sets without this key (None if the key is required)
+
+        :return: a NumPy array of weights
+        """
+        if isinstance(self.S, _AttributeView) and self.S.key == key:
+            return self.S.weights
+        return _get_weights(self.S, key, default)
+
+    def get_element_weights(self, key='weight', default=1):
+        """ Get the weights of the elements of the universe in the order of the rows of the incidence matrix
+
+        :param key: name of the weight in the dictionaries of the elements
+        :param default: weight of elements without this key (None if the key is required)
+
+        :return: a NumPy array of weights
+        """
+        if isinstance(self.U, _AttributeView) and self.U.key == key:
+            return self.U.weights
+        return _get_weights(self.U, key, default)
+
+
+def _get_weights(items, key, default):
+    """ Collect weights from a dictionary of dictionaries (or ones if the items are not a dictionary)
+    """
+    if not isinstance(items, Mapping):
+        return np.ones(len(items))
+    if default is None:
+        return np.array([val[key] for val in items.values()])
+    return np.array([val.get(key, default) for val in items.values()])
@@ -0,0 +1,111 @@
+from array import array
+import gzip
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from graphilp.imports.ilpsetsystem import ILPSetSystem
+
+
+def _tokens(path):
+    """ Read the whitespace separated tokens of a (possibly gzipped) text file one by one
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, "rt") as input_file:
+        for line in input_file:
+            yield from line.split()
+
+
+def _read_array(tokens, length, typecode):
+    """ Read a given number of tokens into a compact array
+    """
+    convert = int if typecode in 'iq' else float
+    return array(typecode, (convert(next(tokens)) for _ in range(length)))
+
+
+def scp_to_ilpsetsystem(path):
+    """
+    Creates an ILPSetSystem from a set cover file in `OR-Library format <http://people.brunel.ac.uk/~mastjjb/jeb/orlib/scpinfo.html>`__.
+
+    The scp* files list the number of rows (elements) and columns (sets), the cost of each column,
+    and for each row the number of columns covering it followed by these columns (numbered from 1).
+    The file is read token by token into the arrays of a compressed sparse row (CSR) incidence matrix,
+    so that the memory needed is close to the size of the final matrix. Sets are named 0, 1, 2, ...
+    in the order of the columns in the file.
+
+    :param path: path to scp file (may be gzipped)
+    :type path: str
+    :returns: an :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem` for
+        :py:mod:`~graphilp.covering.set_cover` or :py:mod:`~graphilp.covering.k_cover`
+
+    Example:
+        S = scp_to_ilpsetsystem("scp41.txt")
+    """
+    tokens = _tokens(path)
+
+    num_rows, num_cols = int(next(tokens)), int(next(tokens))
+    costs = np.frombuffer(_read_array(tokens, num_cols, 'd'), dtype=np.float64)
+
+    indptr = array('q', [0])
+    indices = array('i')
+    for _ in range(num_rows):
+        row_size = int(next(tokens))
+        indices.extend(int(next(tokens)) - 1 for _ in range(row_size))
+        indptr.append(len(indices))
+
+    indptr = np.frombuffer(indptr, dtype=np.int64)
+    if indptr[-1] < np.iinfo(np.int32).max:
+        indptr = indptr.astype(np.int32)
+    indices = np.frombuffer(indices, dtype=np.int32)
+
+    M = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(num_rows, num_cols), copy=False)
+
+    return ILPSetSystem.from_arrays(M, costs)
+
+
+def mknap_to_ilpsetsystem(path):
+    """
+    Creates ILPSetSystems from a multidimensional knapsack file in `OR-Library format <http://people.brunel.ac.uk/~mastjjb/jeb/orlib/mknapinfo.html>`__.
+
+    The mknap1 and mknapcb* files start with the number of problems. Each problem lists the number of
+    items and constraints, the optimal value (zero if unknown), the profit of each item,
+    the coefficients of each constraint, and the capacities of the constraints.
+    The files are read token by token and zero coefficients are not stored. Items are named 0, 1, 2, ...
+
+    :param path: path to mknap file (may be gzipped)
+    :type path: str
+    :returns: a list with a triple for each problem: an :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
+        for :py:mod:`~graphilp.covering.knapsack`, a NumPy array of capacities, and the optimal value
+
+    Example:
+        problems = mknap_to_ilpsetsystem("mknapcb1.txt")
+        S, W, opt = problems[0]
+        m = knapsack.create_model(S, W)
+    """
+    tokens = _tokens(path)
+    problems = []
+
+    for _ in range(int(next(tokens))):
+        num_items, num_constraints = int(next(tokens)), int(next(tokens))
+        optimum = float(next(tokens))
+        profits = np.frombuffer(_read_array(tokens, num_items, 'd'), dtype=np.float64)
+
+        indptr = array('q', [0])
+        indices = array('i')
+        data = array('d')
+        for _ in range(num_constraints):
+            for item in range(num_items):
+                coefficient = float(next(tokens))
+                if coefficient != 0:
+                    indices.append(item)
+                    data.append(coefficient)
+            indptr.append(len(indices))
+
+        capacities = np.frombuffer(_read_array(tokens, num_constraints, 'd'), dtype=np.float64)
+
+        M = csr_matrix((np.frombuffer(data, dtype=np.float64), np.frombuffer(indices, dtype=np.int32),
+                        np.frombuffer(indptr, dtype=np.int64)), shape=(num_constraints, num_items), copy=False)
+
+        problems.append((ILPSetSystem.from_arrays(M, profits, weight='value'), capacities, optimum))
+
+    return problems
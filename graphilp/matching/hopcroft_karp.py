@@ -0,0 +1,114 @@
+def maximum_matching(adj, num_right):
+    r""" Maximum cardinality matching in a bipartite graph by the Hopcroft-Karp algorithm
+
+    The left vertices are numbered 0, ..., len(adj) - 1 and the right vertices 0, ..., num_right - 1.
+    Each phase computes the layers of alternating paths from the unmatched left vertices by a
+    breadth-first search and augments along a maximal set of vertex-disjoint shortest augmenting paths found by
+    iterative depth-first searches. The running time is :math:`O(|E| \sqrt{|V|})`.
+
+    :param adj: a list containing the list of right neighbours of each left vertex
+    :param num_right: number of right vertices
+
+    :return: two lists giving the partner of each left and each right vertex (-1 if unmatched)
+    """
+    num_left = len(adj)
+    match_left = [-1] * num_left
+    match_right = [-1] * num_right
+
+    # greedy initial matching
+    for u in range(num_left):
+        for v in adj[u]:
+            if match_right[v] < 0:
+                match_left[u] = v
+                match_right[v] = u
+                break
+
+    while True:
+        # breadth-first search from all unmatched left vertices
+        dist = [-1] * num_left
+        queue = [u for u in range(num_left) if match_left[u] < 0]
+        for u in queue:
+            dist[u] = 0
+        found = False
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for v in adj[u]:
+                w = match_right[v]
+                if w < 0:
+                    found = True
+                elif dist[w] < 0:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+
+        if not found:
+            break
+
+        # depth-first searches along the layers
+        position = [0] * num_left
+        for root in range(num_left):
+            if match_left[root] >= 0:
+                continue
+
+            stack = [root]
+            edges = []
+            while len(stack) > 0:
+                u = stack[-1]
+                if position[u] == len(adj[u]):
+                    # no augmenting path through u in this phase
+                    dist[u] = -1
+                    stack.pop()
+                    if len(edges) > 0:
+                        edges.pop()
+                    continue
+
+                v = adj[u][position[u]]
+                position[u] += 1
+                w = match_right[v]
+
+                if w < 0:
+                    # augment along the path of the stack
+                    edges.append(v)
+                    for x, y in zip(stack, edges):
+                        match_left[x] = y
+                        match_right[y] = x
+                    break
+
+                if dist[w] == dist[u] + 1:
+                    stack.append(w)
+                    edges.append(v)
+
+    return match_left, match_right
+
+
+def konig_vertex_cover(adj, num_right, match_left, match_right):
+    """ Minimum vertex cover of a bipartite graph from a maximum matching by König's theorem
+
+    Let :math:`Z` be the set of vertices reachable from unmatched left vertices by alternating paths.
+    Then the left vertices not in :math:`Z` and the right vertices in :math:`Z` form a minimum vertex cover.
+
+    :param adj: a list containing the list of right neighbours of each left vertex
+    :param num_right: number of right vertices
+    :param match_left: the partner of each left vertex in a maximum matching (-1 if unmatched)
+    :param match_right: the partner of each right vertex in a maximum matching (-1 if unmatched)
+
+    :return: two lists of booleans indicating the left and right vertices in the cover
+    """
+    reached_left = [partner < 0 for partner in match_left]
+    reached_right = [False] * num_right
+
+    queue = [u for u in range(len(adj)) if reached_left[u]]
+    head = 0
+    while head < len(queue):
+        u = queue[head]
+        head += 1
+        for v in adj[u]:
+            if not reached_right[v]:
+                reached_right[v] = True
+                w = match_right[v]
+                if w >= 0 and not reached_left[w]:
+                    reached_left[w] = True
+                    queue.append(w)
+
+    return [not reached for reached in reached_left], reached_right
@@ -0,0 +1,222 @@
+from collections import OrderedDict
+from networkx import Graph, DiGraph, dijkstra_predecessor_and_distance, single_source_dijkstra_path_length
+from networkx import astar_path, astar_path_length, NetworkXNoPath
+from itertools import combinations, permutations
+
+
+def is_complete(G):
+    """ Check whether every vertex of a graph is connected to all other vertices
+
+    Self-loops are ignored. In a directed graph, both arcs between any two vertices are needed.
+
+    :param G: a `NetworkX graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+
+    :return: True if the graph is complete
+    """
+    n = G.number_of_nodes()
+
+    return all(len(G.adj[node]) - (node in G.adj[node]) == n - 1 for node in G.nodes())
+
+
+class DistanceOracle:
+    """ Cache for shortest path distances and paths in an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+
+    Shortest path trees are computed by Dijkstra's algorithm once per source vertex and kept
+    in a least recently used (LRU) cache. The memory budget limits the total number of vertices
+    stored in all cached shortest path trees; trees that have not been used for the longest time
+    are evicted first.
+
+    Optionally, distances from a number of landmark vertices are precomputed. Queries from sources
+    without a cached shortest path tree are then answered by a goal-directed A* search using the
+    landmark distances and the triangle inequality (ALT) instead of computing a full shortest path tree.
+
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param memory_budget: maximal total number of vertices in all cached shortest path trees
+        (None for no limit)
+    :param landmarks: number of landmarks to precompute for goal-directed search
+
+    Example:
+        .. code-block::
+
+            oracle = DistanceOracle(G, weight='length', memory_budget=10**7)
+
+            warmstart, lower_bound = steiner_metric_closure.get_heuristic(G, terminals, oracle=oracle)
+    """
+
+    def __init__(self, G, weight='weight', memory_budget=None, landmarks=0):
+        self.G = G
+        self.weight = weight
+        self.memory_budget = memory_budget
+        self.directed = G.G.is_directed()
+
+        # source -> (predecessors, distances)
+        self.trees = OrderedDict()
+        self.cache_size = 0
+
+        self.landmarks = []
+        self.landmark_dist = []
+        self.landmark_dist_reverse = []
+
+        if landmarks > 0:
+            self._select_landmarks(landmarks)
+
+    def _select_landmarks(self, num_landmarks):
+        """ Choose landmarks by farthest selection and compute the distances from them
+        """
+        reverse = self.G.G.reverse(copy=False) if self.directed else None
+        candidate = next(iter(self.G.G.nodes()), None)
+
+        while candidate is not None and len(self.landmarks) < num_landmarks:
+            self.landmarks.append(candidate)
+            self.landmark_dist.append(single_source_dijkstra_path_length(self.G.G, candidate, weight=self.weight))
+            if self.directed:
+                self.landmark_dist_reverse.append(single_source_dijkstra_path_length(reverse, candidate,
+                                                                                     weight=self.weight))
+
+            # next landmark: vertex farthest away from all landmarks chosen so far
+            candidate = None
+            best = -1
+            for node, dist in self.landmark_dist[0].items():
+                closest = min(d.get(node, float('inf')) for d in self.landmark_dist)
+                if closest > best and node not in self.landmarks:
+                    candidate, best = node, closest
+
+    def _lower_bound(self, node, target):
+        """ Lower bound on the distance from node to target derived from the landmark distances
+        """
+        bound = 0
+        for pos, dist in enumerate(self.landmark_dist):
+            if node in dist and target in dist:
+                bound = max(bound, dist[target] - dist[node])
+                if self.directed:
+                    dist_reverse = self.landmark_dist_reverse[pos]
+                    if node in dist_reverse and target in dist_reverse:
+                        bound = max(bound, dist_reverse[node] - dist_reverse[target])
+                else:
+                    bound = max(bound, dist[node] - dist[target])
+
+        return bound
+
+    def shortest_path_tree(self, source):
+        """ Get the shortest path tree from a source vertex
+
+        :param source: a vertex of the graph
+
+        :return: a dictionary of predecessors and a dictionary of distances from source
+        """
+        if source in self.trees:
+            self.trees.move_to_end(source)
+            return self.trees[source]
+
+        tree = dijkstra_predecessor_and_distance(self.G.G, source, weight=self.weight)
+        self.trees[source] = tree
+        self.cache_size += len(tree[1])
+
+        # evict least recently used trees until the memory budget is met
+        while (self.memory_budget is not None) and (self.cache_size > self.memory_budget) and len(self.trees) > 1:
+            _, (_, evicted_dist) = self.trees.popitem(last=False)
+            self.cache_size -= len(evicted_dist)
+
+        return tree
+
+    def _cached_source(self, source, target):
+        """ Find a cached shortest path tree answering a query and whether it has to be reversed
+        """
+        if source in self.trees:
+            self.trees.move_to_end(source)
+            return source, False
+        if not self.directed and target in self.trees:
+            self.trees.move_to_end(target)
+            return target, True
+
+        return None, False
+
+    def distance(self, source, target):
+        """ Get the length of a shortest path between two vertices
+
+        :param source: a vertex of the graph
+        :param target: a vertex of the graph
+
+        :return: the distance from source to target (infinity if target cannot be reached)
+        """
+        cached, reverse = self._cached_source(source, target)
+
+        if cached is None:
+            if len(self.landmarks) > 0:
+                try:
+                    return astar_path_length(self.G.G, source, target,
+                                             heuristic=self._lower_bound, weight=self.weight)
+                except NetworkXNoPath:
+                    return float('inf')
+            cached = source
+
+        _, dist = self.shortest_path_tree(cached)
+
+        return dist.get(source if reverse else target, float('inf'))
+
+    def path(self, source, target):
+        """ Get a shortest path between two vertices
+
+        :param source: a vertex of the graph
+        :param target: a vertex of the graph
+
+        :return: a list of vertices forming a shortest path from source to target
+        """
+        cached, reverse = self._cached_source(source, target)
+
+        if cached is None:
+            if len(self.landmarks) > 0:
+                return astar_path(self.G.G, source, target, heuristic=self._lower_bound, weight=self.weight)
+            cached = source
+
+        pred, dist = self.shortest_path_tree(cached)
+        end = source if reverse else target
+        if end not in dist:
+            raise NetworkXNoPath(f"No path between {source} and {target}.")
+
+        path = [end]
+        while path[-1] != cached:
+            path.append(pred[path[-1]][0])
+
+        return path if reverse else path[::-1]
+
+    def paths(self, pairs):
+        """ Get shortest paths between pairs of vertices
+
+        :param pairs: a list of pairs of vertices
+
+        :return: a dictionary mapping each pair of vertices to a shortest path between them given as a list of
+            vertices (None if there is no path)
+        """
+        path_map = {}
+        for s, t in pairs:
+            try:
+                path_map[(s, t)] = self.path(s, t)
+            except NetworkXNoPath:
+                path_map[(s, t)] = None
+
+        return path_map
+
+    def metric_closure(self, nodes):
+        """ Create the metric closure of a set of vertices
+
+        The metric closure is a complete graph on the given vertices in which each edge is weighted by
+        the length of a shortest path between its end points in the underlying graph.
+        Pairs of vertices not connected by a path are not connected in the metric closure.
+
+        :param nodes: a list of vertices of the graph
+
+        :return: a `NetworkX Graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+            (directed if the underlying graph is directed) with edge attribute 'weight' giving the distances
+        """
+        closure_graph = DiGraph() if self.directed else Graph()
+        closure_graph.add_nodes_from(nodes)
+
+        pairs = permutations(nodes, 2) if self.directed else combinations(nodes, 2)
+        for u, v in pairs:
+            distance = self.distance(u, v)
+            if distance < float('inf'):
+                closure_graph.add_edge(u, v, weight=distance)
+
+        return closure_graph
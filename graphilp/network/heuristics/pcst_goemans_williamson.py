@@ -0,0 +1,416 @@
+import gc
+from contextlib import contextmanager
+from heapq import heapify, heappush, heappop
+from math import inf, nan
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, shortest_path
+
+
+def _find(parent, delta, x):
+    """ Find the root of x in a weighted union-find structure and compress the path
+
+    The sum of the deltas along the path from x to its root is preserved by the compression.
+    """
+    path = []
+    while parent[x] != x:
+        path.append(x)
+        x = parent[x]
+
+    # compress path: every node on the path points directly to the root
+    acc = 0.0
+    for y in reversed(path):
+        acc += delta[y]
+        delta[y] = acc
+        parent[y] = x
+
+    return x
+
+
+def _strong_pruning(num_nodes, node_prize, forest, forced):
+    """ Find the subtree of the Goemans-Williamson forest with the highest net worth
+
+    Each tree of the forest is rooted at an arbitrary vertex. A subtree of maximal net worth
+    that is topmost at vertex v is obtained by adding all child subtrees with positive net worth.
+    The solution must contain at least one edge since isolated vertices cannot be represented in
+    the PCST models.
+    """
+    if len(forest) == 0:
+        return []
+
+    forest_u, forest_v, forest_cost, forest_edge = (np.array(column) for column in zip(*forest))
+
+    # root the trees by attaching one vertex of each tree to a virtual root num_nodes
+    adjacency = csr_matrix((np.ones(len(forest)), (forest_u, forest_v)), shape=(num_nodes, num_nodes))
+    _, labels = connected_components(adjacency, directed=False)
+    _, roots = np.unique(labels, return_index=True)
+    rows = np.concatenate((forest_u, forest_v, np.full(len(roots), num_nodes)))
+    cols = np.concatenate((forest_v, forest_u, roots))
+    rooted = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(num_nodes + 1, num_nodes + 1))
+    depth, parent = shortest_path(rooted, unweighted=True, indices=num_nodes, return_predecessors=True)
+    depth = depth.astype(np.int64)
+
+    # every tree edge connects a vertex with its parent
+    child = np.where(parent[forest_v] == forest_u, forest_v, forest_u)
+    parent_cost = np.zeros(num_nodes + 1)
+    parent_cost[child] = forest_cost
+    parent_edge = np.zeros(num_nodes + 1, dtype=np.int64)
+    parent_edge[child] = forest_edge
+
+    # penalty values for the pruning: forced terminals must not be pruned
+    big = sum(node_prize) + forest_cost.sum() + 1.0
+    down = np.append(np.array(node_prize), 0.0)
+    down[list(forced)] = big
+
+    # bottom-up level by level: the net worth of the best subtree hanging below a vertex is complete
+    # once all its descendants are processed and is then passed on to its parent
+    best_child = np.full(num_nodes + 1, -np.inf)
+    level_order = np.argsort(depth, kind='stable')
+    level_bounds = np.searchsorted(depth[level_order], np.arange(depth.max() + 2))
+    for level in range(depth.max(), 1, -1):
+        nodes = level_order[level_bounds[level]:level_bounds[level + 1]]
+        gain = down[nodes] - parent_cost[nodes]
+        np.add.at(down, parent[nodes], np.maximum(gain, 0.0))
+        np.maximum.at(best_child, parent[nodes], gain)
+
+    # candidates with at least one edge and v as topmost vertex
+    candidate = np.where(best_child > 0, down, down + best_child)
+    best_root = int(np.argmax(candidate))
+
+    # collect the edges of the best subtree
+    gain = down - parent_cost
+    children_order = np.argsort(parent[:num_nodes], kind='stable')
+    children_bounds = np.searchsorted(parent[children_order], np.arange(num_nodes + 1))
+
+    solution = []
+    stack = [best_root]
+    while stack:
+        v = stack.pop()
+        children = children_order[children_bounds[v]:children_bounds[v + 1]]
+        chosen = children[gain[children] > 0]
+        if v == best_root and len(chosen) == 0:
+            chosen = children[[np.argmax(gain[children])]]
+        solution.extend(parent_edge[chosen].tolist())
+        stack.extend(chosen.tolist())
+
+    return solution
+
+
+@contextmanager
+def _gc_paused():
+    """ Pause the cyclic garbage collector (no reference cycles are created while it is paused)
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _grow_forest(edge_u, edge_v, edge_cost, budget):
+    """ Grow moats around clusters until all clusters are inactive and return the forest of tight edges
+
+    Vertices and edges are given by their positions, an edge by its end points and cost. The forest
+    is a list of tuples (u, v, cost, e) for each tight edge e = (u, v).
+    """
+    n = len(budget)
+    ends_u, ends_v, costs = np.array(edge_u, dtype=np.int64), np.array(edge_v, dtype=np.int64), np.array(edge_cost)
+
+    # weighted union-find: the load of vertex v (sum of all moats containing it) is the sum of
+    # the deltas on the path to its root plus the growth of the root cluster
+    parent = list(range(n))
+    delta = [0.0] * n
+    size = [1] * n
+
+    # cluster information stored at the root of each cluster
+    active = [b > 0 for b in budget]
+    growth = [0.0] * n          # growth of the root counter up to start
+    moat_sum = [0.0] * n        # total moat of the cluster and its sub-clusters up to start
+    start = [0.0] * n           # time since which the values above are growing
+    deactivation = [b if b > 0 else 0.0 for b in budget]
+    budget_sum = budget[:]
+
+    # each edge has two parts, one per end point, with the time at which they become tight if only
+    # the clusters active at the start grow
+    is_active = np.array(active, dtype=bool)
+    active_u, active_v = is_active[ends_u], is_active[ends_v]
+    both = active_u & active_v
+    time_u = np.where(both, costs / 2, np.where(active_u, costs, 0.0))
+    time_v = np.where(both, costs / 2, np.where(active_v, costs, 0.0))
+
+    # a heap entry is stale if its key is not the current key of the part
+    # (NaN for parts that are no longer needed)
+    part_key = np.stack((time_u, time_v), axis=1).reshape(-1)
+    part_node = np.stack((ends_u, ends_v), axis=1).reshape(-1)
+
+    # parts sorted by vertex and time, the parts of vertex v are parts[first[v]:first[v + 1]]
+    order = np.lexsort((part_key, part_node))
+    first = np.searchsorted(part_node[order], np.arange(n + 1)).tolist()
+    sorted_keys, parts = part_key[order].tolist(), order.tolist()
+
+    # each cluster has a heap of edge part events with times relative to an offset,
+    # initially the sorted list of the parts at its vertex
+    # for inactive clusters, the heap is frozen at the deactivation time
+    # vertices that have never been active keep their parts outside of the heaps since these
+    # are all due as soon as the vertex is merged
+    heaps = [list(zip(sorted_keys[first[v]:first[v + 1]], parts[first[v]:first[v + 1]])) if active[v] else []
+             for v in range(n)]
+    never_active = [not a for a in active]
+    offset = [0.0] * n
+
+    part_key = part_key.tolist()
+
+    # an edge is tight if its slack is below a tolerance relative to its cost
+    tolerance = (1e-9 * np.maximum(1.0, costs)).tolist()
+
+    def next_time(c):
+        # time of the next edge part event of a cluster or of its deactivation
+        heap = heaps[c]
+        while heap and heap[0][0] != part_key[heap[0][1]]:
+            heappop(heap)
+        if heap and heap[0][0] + offset[c] < deactivation[c]:
+            return heap[0][0] + offset[c]
+        return deactivation[c]
+
+    # global event queue of the active clusters, stale entries are detected as for the edge parts
+    event_time = [next_time(v) if active[v] else nan for v in range(n)]
+    events = [(event_time[v], v) for v in range(n) if active[v]]
+    heapify(events)
+
+    # edge parts of the current cluster that are due at the current time, these are evaluated before
+    # any other event without passing through the heap (marked by a key of -inf)
+    due = []
+
+    forest = []
+
+    while events:
+        t, c = heappop(events)
+        if t != event_time[c]:
+            continue
+
+        # process the events of cluster c until another cluster has an earlier event
+        while True:
+            heap = heaps[c]
+            if due:
+                p = due.pop()
+                if part_key[p] != -inf:
+                    continue
+            else:
+                t = next_time(c)
+                if events and t > events[0][0]:
+                    event_time[c] = t
+                    heappush(events, (t, c))
+                    break
+
+                if not heap or heap[0][0] + offset[c] > deactivation[c]:
+                    # the cluster has used up its budget
+                    active[c] = False
+                    growth[c] += t - start[c]
+                    moat_sum[c] += t - start[c]
+                    deactivation[c] = t
+                    event_time[c] = nan
+                    break
+
+                _, p = heappop(heap)
+            e = p >> 1
+            u, v = edge_u[e], edge_v[e]
+            # after path compression, the parent is usually the root already
+            ru, rv = parent[u], parent[v]
+            if parent[ru] != ru:
+                ru = _find(parent, delta, u)
+            if parent[rv] != rv:
+                rv = _find(parent, delta, v)
+
+            if ru == rv:
+                # edge inside a cluster: drop the other part as well
+                part_key[p ^ 1] = nan
+                continue
+
+            # loads of the end points: path deltas plus the growth of the root
+            load = growth[ru] + growth[rv] + (delta[u] if u != ru else 0.0) + (delta[v] if v != rv else 0.0)
+            if active[ru]:
+                load += t - start[ru]
+            if active[rv]:
+                load += t - start[rv]
+            slack = edge_cost[e] - load
+
+            if ru != c:
+                ru, rv = rv, ru
+
+            if slack > tolerance[e]:
+                # edge not yet tight: reschedule both edge parts
+                p_other = p ^ 1
+                if active[rv]:
+                    key = t + slack / 2 - offset[ru]
+                    part_key[p_other] = t + slack / 2 - offset[rv]
+                    heappush(heaps[rv], (part_key[p_other], p_other))
+                    if t + slack / 2 < event_time[rv]:
+                        event_time[rv] = t + slack / 2
+                        heappush(events, (event_time[rv], rv))
+                else:
+                    key = t + slack - offset[ru]
+                    # the other part fires immediately once the other cluster becomes active again
+                    # (unless it already does so)
+                    if not part_key[p_other] <= deactivation[rv] - offset[rv]:
+                        part_key[p_other] = deactivation[rv] - offset[rv]
+                        heappush(heaps[rv], (part_key[p_other], p_other))
+                part_key[p] = key
+                heappush(heap, (key, p))
+                continue
+
+            # edge is tight: merge clusters (cluster c is active)
+            forest.append((u, v, edge_cost[e], e))
+            part_key[p ^ 1] = nan
+
+            growth[ru] += t - start[ru]
+            moat_sum[ru] += t - start[ru]
+            start[ru] = t
+
+            if never_active[rv]:
+                # a vertex that has never been active joins cluster c and has no load yet
+                never_active[rv] = False
+                parent[rv] = ru
+                delta[rv] = -growth[ru]
+                size[ru] += 1
+                c_offset = offset[ru]
+
+                for q in parts[first[rv]:first[rv + 1]]:
+                    if part_key[q] != 0.0:
+                        continue
+                    w = edge_v[q >> 1] if q & 1 == 0 else edge_u[q >> 1]
+                    if never_active[w] and edge_cost[q >> 1] > tolerance[q >> 1]:
+                        # no load on either end point yet: the edge becomes tight after growing by its cost
+                        part_key[q] = t + edge_cost[q >> 1] - c_offset
+                        heappush(heap, (part_key[q], q))
+                        continue
+                    rw = parent[w]
+                    if parent[rw] != rw:
+                        rw = _find(parent, delta, w)
+                    if rw == ru:
+                        # edges between both clusters are inside the merged cluster now and are dropped
+                        part_key[q] = part_key[q ^ 1] = nan
+                    else:
+                        part_key[q] = -inf
+                        due.append(q)
+            else:
+                if active[rv]:
+                    growth[rv] += t - start[rv]
+                    moat_sum[rv] += t - start[rv]
+                else:
+                    # shift frozen heap into the time frame of active clusters
+                    offset[rv] += t - deactivation[rv]
+                start[rv] = t
+
+                if size[ru] < size[rv]:
+                    ru, rv = rv, ru
+
+                parent[rv] = ru
+                delta[rv] = growth[rv] - growth[ru]
+                size[ru] += size[rv]
+
+                # meld heaps by inserting the smaller into the larger one
+                big_heap, small_heap = heaps[ru], heaps[rv]
+                big_offset, small_offset = offset[ru], offset[rv]
+                if len(big_heap) < len(small_heap):
+                    big_heap, small_heap = small_heap, big_heap
+                    big_offset, small_offset = small_offset, big_offset
+                for key, q in small_heap:
+                    if key == part_key[q]:
+                        w = edge_v[q >> 1] if q & 1 == 0 else edge_u[q >> 1]
+                        rw = parent[w]
+                        if parent[rw] != rw:
+                            rw = _find(parent, delta, w)
+                        if rw == ru:
+                            # edges between both clusters are inside the merged cluster now and are dropped
+                            part_key[q] = part_key[q ^ 1] = nan
+                        elif key + small_offset <= t:
+                            part_key[q] = -inf
+                            due.append(q)
+                        else:
+                            key += small_offset - big_offset
+                            part_key[q] = key
+                            heappush(big_heap, (key, q))
+                heaps[ru], offset[ru] = big_heap, big_offset
+                heaps[rv] = []
+
+                moat_sum[ru] += moat_sum[rv]
+                active[ru] = True
+                active[rv] = False
+                event_time[rv] = nan
+
+            budget_sum[ru] += budget_sum[rv]
+            deactivation[ru] = t + max(0.0, budget_sum[ru] - moat_sum[ru])
+
+            # continue with the merged cluster, its pending event is outdated
+            event_time[ru] = nan
+            c = ru
+
+    return forest
+
+
+def get_heuristic(G, forced_terminals=[], weight='weight', prize='prize'):
+    r""" Approximation to the prize collecting Steiner tree problem by the Goemans-Williamson algorithm
+
+    Grows moats around clusters of vertices as in the primal-dual algorithm of
+    `Goemans and Williamson <https://doi.org/10.1137/S0097539793242618>`__ (1995).
+    Every cluster is active as long as its prize budget is not used up.
+    Whenever an edge between two clusters becomes tight, they are merged and the edge is added
+    to a forest. The events at which edges become tight are maintained in a priority queue per cluster,
+    so that each event only affects the clusters involved (cf. Hegde, Indyk, Schmidt (2015):
+    `A nearly-linear time framework for graph-structured sparsity <http://proceedings.mlr.press/v37/hegde15.html>`__).
+
+    Finally, the forest is pruned by strong pruning: the subtree with the highest net worth,
+    i.e., total prize minus total edge cost, is chosen as the solution.
+
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param forced_terminals: list of terminals that have to be connected
+    :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param prize: name of the argument in the vertex dictionary of the graph used to store vertex prize values
+
+    :return: a list of edges forming the approximate solution and its net worth
+
+    Example:
+        .. code-block::
+
+            warmstart, net_worth = pcst_goemans_williamson.get_heuristic(G)
+
+            m = pcst_linear.create_model(G, warmstart=warmstart)
+    """
+    node_list = list(G.G.nodes())
+    node_index = {node: i for i, node in enumerate(node_list)}
+    n = len(node_list)
+
+    forced = {node_index[t] for t in forced_terminals if t in node_index}
+
+    node_prize = [float(value) for _, value in G.G.nodes(data=prize, default=0)]
+
+    edge_u = []
+    edge_v = []
+    edge_cost = []
+    for u, v, cost in G.G.edges(data=weight, default=1):
+        if u == v:
+            continue
+        edge_u.append(node_index[u])
+        edge_v.append(node_index[v])
+        edge_cost.append(float(cost))
+
+    # forced terminals get a prize large enough to never become inactive
+    big = sum(node_prize) + sum(edge_cost) + 1.0
+    budget = [big if v in forced else node_prize[v] for v in range(n)]
+
+    # the heaps consist of many small objects, which would trigger repeated full garbage collections
+    # traversing the whole graph
+    with _gc_paused():
+        forest = _grow_forest(edge_u, edge_v, edge_cost, budget)
+
+    solution_edges = _strong_pruning(n, node_prize, forest, forced)
+
+    solution = [(node_list[edge_u[e]], node_list[edge_v[e]]) for e in solution_edges]
+    solution_nodes = {node_index[u] for e in solution for u in e}
+    net_worth = (sum(node_prize[v] for v in solution_nodes)
+                 - sum(edge_cost[e] for e in solution_edges))
+
+    return solution, net_worth
@@ -1,8 +1,9 @@
-from networkx import Graph, dijkstra_path_length, dijkstra_path, minimum_spanning_tree
-from itertools import combinations
+from networkx import minimum_spanning_tree
+from graphilp.network.distance_oracle import DistanceOracle
+from graphilp.network.parallel_paths import ParallelShortestPaths
 
 
-def get_heuristic(G, terminals, weight='weight'):
+def get_heuristic(G, terminals, weight='weight', oracle=None, processes=None):
     """ Approximation to the Steiner tree problem by metric closure
 
     Creates a minimum weight spanning tree in the metric closure of terminals in the graph.
@@ -11,38 +12,55 @@ def get_heuristic(G, terminals, weight='weight'):
     :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
     :param terminals: a list of vertices that need to be connected by the Steiner tree
     :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param oracle: a :py:class:`~graphilp.network.distance_oracle.DistanceOracle` for G caching shortest paths
+        between calls (if None, shortest paths are computed from scratch)
+    :param processes: if given and no oracle is used, the shortest path searches are distributed over
+        this many worker processes by :py:class:`~graphilp.network.parallel_paths.ParallelShortestPaths`
 
     :return: a list of edges forming the approximate solution and a lower bound on the optimal solution
 
     Example:
         .. code-block::
 
-            warmstart, lower_bound = steiner_metric_closure.getHeuristic(G, terminals)
+            warmstart, lower_bound = steiner_metric_closure.get_heuristic(G, terminals)
 
             m = create_model(G, terminals, weight='length', warmstart=warmstart, lower_bound=lower_bound)
     """
-    # create a graph (called the metric closure) with all terminals as vertices,
-    # distance of a shortest path between each pair of terminals,
-    # and actual shortest paths
-    closure_edges = []
-    for p in combinations(terminals, 2):
-        distance = dijkstra_path_length(G.G, p[0], p[1], weight='length')
-        path = dijkstra_path(G.G, p[0], p[1], weight='length')
-        closure_edges.append((p[0], p[1], {'weight': distance, 'path': path}))
-
-    closure_graph = Graph()
-    closure_graph.add_edges_from(closure_edges)
+    if oracle is None and processes is not None:
+        with ParallelShortestPaths(G, weight=weight, processes=processes) as engine:
+            return _metric_closure_tree(engine, terminals)
+
+    if oracle is None:
+        oracle = DistanceOracle(G, weight=weight)
+
+    return _metric_closure_tree(oracle, terminals)
+
+
+def _metric_closure_tree(shortest_paths, terminals):
+    """ Compute a spanning tree in the metric closure of the terminals and expand it to a Steiner tree
+
+    :param shortest_paths: an object providing the methods metric_closure and paths,
+        e.g., a :py:class:`~graphilp.network.distance_oracle.DistanceOracle`
+    :param terminals: a list of vertices that need to be connected by the Steiner tree
+
+    :return: a list of edges forming the approximate solution and a lower bound on the optimal solution
+    """
+    # create a graph (called the metric closure) with all terminals as vertices
+    # and the distance of a shortest path between each pair of terminals
+    closure_graph = shortest_paths.metric_closure(terminals)
 
     # compute a minimum weight spanning tree
     min_span = minimum_spanning_tree(closure_graph)
 
-    # add all edges from paths represented by the edges in the spanning tree to warmstart
+    # add all edges from shortest paths represented by the edges in the spanning tree to warmstart
     # also computes the total length of the warmstart
+    path_map = shortest_paths.paths(list(min_span.edges()))
+
     warmstart = []
     lower_bound = 0.0
 
     for e in min_span.edges():
-        path = min_span.edges[e]['path']
+        path = path_map[e]
         lower_bound += min_span.edges[e]['weight']
         for u, v in zip(path, path[1:]):
             warmstart.append((u, v))
@@ -1,10 +1,11 @@
 from networkx import minimum_spanning_tree, subgraph_view, eulerian_circuit
 from graphilp.matching import perfect
 from graphilp.imports import networkx as nximp
+from graphilp.network.distance_oracle import DistanceOracle, is_complete
 from gurobipy import GRB
 
 
-def get_heuristic(G, weight='weight'):
+def get_heuristic(G, weight='weight', oracle=None):
     """ Approximation to TSP by `Christofides's algorithm <https://en.wikipedia.org/wiki/Christofides_algorithm>`__
 
     Creates a TSP tour from a minimum weight spanning tree by applying a minimum weight perfect matching
@@ -14,8 +15,14 @@ def get_heuristic(G, weight='weight'):
 
     This is a 3/2-approximation to the metric TSP and hence also gives a lower bound.
 
+    If G is not a complete graph, the heuristic works on the metric closure of G in which any two vertices
+    are connected by an edge weighted by the length of a shortest path between them. In this case,
+    the tour visits the vertices in the returned order along shortest paths which can be obtained from the oracle.
+
     :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
     :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param oracle: a :py:class:`~graphilp.network.distance_oracle.DistanceOracle` for G used
+        if G is not complete (if None, a new oracle is created)
 
     :return: a list of edges forming the approximate solution and a lower bound on the optimal solution
 
@@ -27,6 +34,13 @@ def get_heuristic(G, weight='weight'):
             m = create_model(G, warmstart=warmstart, lower_bound=lower_bound)
 
     """
+    # on graphs that are not complete, work on the metric closure
+    if not is_complete(G.G):
+        if oracle is None:
+            oracle = DistanceOracle(G, weight=weight)
+        G = nximp.read(oracle.metric_closure(list(G.G.nodes())))
+        weight = 'weight'
+
     # compute minimum spanning tree
     T = minimum_spanning_tree(G.G, weight=weight)
 
@@ -36,9 +50,10 @@ def get_heuristic(G, weight='weight'):
     # work on the subgraph of G induced by the nodes of odd degree in the spanning tree
     odd_sub = G.G.subgraph(odd_degree)
 
-    # retain only those edges which are not part of the spanning tree
+    # retain only those edges which are not part of the spanning tree (and no self-loops)
     odd_sub_min_T = subgraph_view(odd_sub,
-                                  filter_edge=lambda u, v: ((u, v) not in T.edges()) and ((v, u) not in T.edges()))
+                                  filter_edge=lambda u, v: u != v and ((u, v) not in T.edges())
+                                  and ((v, u) not in T.edges()))
 
     # find a minimum weight perfect matching on the resulting subgraph
     ilpG = nximp.read(odd_sub_min_T)
@@ -74,7 +89,7 @@ def get_heuristic(G, weight='weight'):
         pos += 1
 
     # close tour
-    final_tour.append((final_tour[-1][1], 0))
+    final_tour.append((final_tour[-1][1], tour[0][0]))
 
     # We get a 3/2 approximation, so 2/3 of its value would be a lower bound
     # 19/30 is a somewhat careful version
@@ -1,13 +1,30 @@
-def get_heuristic(G, weight='weight'):
+from graphilp.imports import networkx as nximp
+from graphilp.network.distance_oracle import DistanceOracle, is_complete
+
+
+def get_heuristic(G, weight='weight', oracle=None):
     """ Nearest neighbour heuristic for TSP
 
     Create a tour by greedily moving to the nearest neighbour that has not yet been visited in each step.
 
+    If G is not a complete graph, the heuristic works on the metric closure of G in which any two vertices
+    are connected by an edge weighted by the length of a shortest path between them. In this case,
+    the tour visits the vertices in the returned order along shortest paths which can be obtained from the oracle.
+
     :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
     :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param oracle: a :py:class:`~graphilp.network.distance_oracle.DistanceOracle` for G used
+        if G is not complete (if None, a new oracle is created)
 
     :return: a list of edges forming the approximate solution and its length
     """
+    # on graphs that are not complete, work on the metric closure
+    if not is_complete(G.G):
+        if oracle is None:
+            oracle = DistanceOracle(G, weight=weight)
+        G = nximp.read(oracle.metric_closure(list(G.G.nodes())))
+        weight = 'weight'
+
     first = list(G.G.nodes())[0]
     current = first
     length = 0.0
@@ -0,0 +1,220 @@
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from itertools import combinations, permutations
+
+import numpy as np
+from networkx import Graph, DiGraph
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+# compressed sparse row representation of the graph attached to shared memory in each worker process
+_worker_csr = None
+_worker_memory = []
+
+
+def _init_worker(blocks, num_nodes):
+    """ Attach a worker process to the shared memory blocks holding the graph
+    """
+    global _worker_csr
+    global _worker_memory
+
+    arrays = []
+    for name, length, dtype in blocks:
+        memory = SharedMemory(name=name)
+        _worker_memory.append(memory)
+        arrays.append(np.ndarray((length,), dtype=dtype, buffer=memory.buf))
+
+    indptr, indices, data = arrays
+    _worker_csr = csr_matrix((data, indices, indptr), shape=(num_nodes, num_nodes), copy=False)
+
+
+def _distances(sources, targets):
+    """ Compute the distances from a chunk of sources to all targets
+    """
+    dist = dijkstra(_worker_csr, directed=True, indices=sources)
+
+    return dist[:, targets]
+
+
+def _paths(source, targets):
+    """ Compute shortest paths from a source to a list of targets as lists of vertex indices
+    """
+    _, pred = dijkstra(_worker_csr, directed=True, indices=source, return_predecessors=True)
+
+    paths = []
+    for target in targets:
+        if target != source and pred[target] < 0:
+            paths.append(None)
+            continue
+        path = [target]
+        while path[-1] != source:
+            path.append(int(pred[path[-1]]))
+        paths.append(path[::-1])
+
+    return paths
+
+
+def graph_to_csr(G, weight='weight'):
+    """ Convert a graph into arrays of a compressed sparse row (CSR) adjacency matrix
+
+    Undirected edges are stored in both directions. For parallel edges, the minimal weight is kept.
+    Edges of weight zero are kept as explicit entries.
+
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+
+    :return: a list of the vertices giving their indices and the arrays indptr, indices, and data of the CSR matrix
+    """
+    node_list = list(G.G.nodes())
+    node_index = {node: i for i, node in enumerate(node_list)}
+    n = len(node_list)
+
+    m = G.G.number_of_edges()
+    rows = np.empty(m, dtype=np.int64)
+    cols = np.empty(m, dtype=np.int64)
+    data = np.empty(m, dtype=np.float64)
+
+    for pos, (u, v, w) in enumerate(G.G.edges(data=weight, default=1)):
+        rows[pos] = node_index[u]
+        cols[pos] = node_index[v]
+        data[pos] = w
+
+    if not G.G.is_directed():
+        rows, cols = np.concatenate((rows, cols)), np.concatenate((cols, rows))
+        data = np.concatenate((data, data))
+
+    # sort by row, column and weight and keep the lightest of parallel edges
+    order = np.lexsort((data, cols, rows))
+    rows, cols, data = rows[order], cols[order], data[order]
+    keep = np.ones(len(rows), dtype=bool)
+    keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+    rows, cols, data = rows[keep], cols[keep], data[keep]
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+    return node_list, indptr, cols.astype(np.int32), data
+
+
+class ParallelShortestPaths:
+    """ Shortest path computations distributed over a pool of worker processes
+
+    The graph is converted into a compressed sparse row (CSR) adjacency matrix whose arrays are placed
+    in shared memory. Worker processes access these arrays read-only instead of receiving pickled copies
+    of the graph. Single-source shortest path searches are distributed over the workers and only
+    the requested distances and paths are sent back.
+
+    The object should be used as a context manager so that the worker processes and the shared memory
+    are released after use.
+
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param processes: number of worker processes (None for the number of CPUs)
+    :param chunk_size: number of sources handled by a worker in one task
+
+    Example:
+        .. code-block::
+
+            with ParallelShortestPaths(G, weight='length', processes=8) as engine:
+                closure_graph = engine.metric_closure(terminals)
+    """
+
+    def __init__(self, G, weight='weight', processes=None, chunk_size=16):
+        self.directed = G.G.is_directed()
+        self.chunk_size = chunk_size
+
+        self.node_list, indptr, indices, data = graph_to_csr(G, weight)
+        self.node_index = {node: i for i, node in enumerate(self.node_list)}
+
+        # copy CSR arrays to shared memory
+        self.memory = []
+        blocks = []
+        for array in (indptr, indices, data):
+            memory = SharedMemory(create=True, size=max(1, array.nbytes))
+            shared = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+            shared[:] = array
+            self.memory.append(memory)
+            blocks.append((memory.name, len(array), array.dtype))
+
+        self.pool = Pool(processes, initializer=_init_worker, initargs=(blocks, len(self.node_list)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ Stop the worker processes and release the shared memory
+        """
+        self.pool.terminate()
+        self.pool.join()
+
+        for memory in self.memory:
+            memory.close()
+            memory.unlink()
+        self.memory = []
+
+    def distance_matrix(self, sources, targets):
+        """ Compute the distances between two lists of vertices
+
+        :param sources: a list of vertices of the graph
+        :param targets: a list of vertices of the graph
+
+        :return: a NumPy array of distances with one row per source and one column per target
+            (infinity if the target cannot be reached)
+        """
+        source_idx = [self.node_index[s] for s in sources]
+        target_idx = [self.node_index[t] for t in targets]
+
+        chunks = [source_idx[pos:pos + self.chunk_size] for pos in range(0, len(source_idx), self.chunk_size)]
+        results = self.pool.starmap(_distances, [(chunk, target_idx) for chunk in chunks])
+
+        if len(results) == 0:
+            return np.zeros((0, len(targets)))
+
+        return np.vstack(results)
+
+    def metric_closure(self, nodes):
+        """ Create the metric closure of a set of vertices
+
+        See :py:meth:`graphilp.network.distance_oracle.DistanceOracle.metric_closure`.
+
+        :param nodes: a list of vertices of the graph
+
+        :return: a `NetworkX Graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+            (directed if the underlying graph is directed) with edge attribute 'weight' giving the distances
+        """
+        dist = self.distance_matrix(nodes, nodes)
+
+        closure_graph = DiGraph() if self.directed else Graph()
+        closure_graph.add_nodes_from(nodes)
+
+        pairs = permutations(range(len(nodes)), 2) if self.directed else combinations(range(len(nodes)), 2)
+        closure_graph.add_edges_from((nodes[i], nodes[j], {'weight': dist[i, j]})
+                                     for i, j in pairs if dist[i, j] < np.inf)
+
+        return closure_graph
+
+    def paths(self, pairs):
+        """ Compute shortest paths between pairs of vertices
+
+        :param pairs: a list of pairs of vertices
+
+        :return: a dictionary mapping each pair of vertices to a shortest path between them given as a list of
+            vertices (None if there is no path)
+        """
+        targets_by_source = {}
+        for s, t in pairs:
+            targets_by_source.setdefault(s, []).append(t)
+
+        tasks = [(self.node_index[s], [self.node_index[t] for t in targets])
+                 for s, targets in targets_by_source.items()]
+        results = self.pool.starmap(_paths, tasks)
+
+        path_map = {}
+        for (s, targets), paths in zip(targets_by_source.items(), results):
+            for t, path in zip(targets, paths):
+                path_map[(s, t)] = None if path is None else [self.node_list[i] for i in path]
+
+        return path_map
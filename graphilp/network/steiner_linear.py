@@ -119,40 +119,51 @@ def create_model(G, terminals, weight='weight', warmstart=[], lower_bound=None):
 
     # set warmstart
     if len(warmstart) > 0:
+        _set_warmstart(G, warmstart)
+        m.update()
 
-        # Initialise warmstart by excluding all edges and vertices from solution:
-        for edge_var in edges.values():
-            edge_var.Start = 0
+    return m
 
-        for node_var in nodes.values():
-            node_var.Start = 0
 
-        for label_var in labels.values():
-            label_var.Start = 1
+def _set_warmstart(G, warmstart):
+    """ Set the start values of all variables of a Steiner tree model from a list of edges
 
-        # Include all edges and vertices from the warmstart in the solution
-        # and set vertex labels:
-        start_node = warmstart[0][0]
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph` with the variables of the model
+    :param warmstart: a list of edges forming a tree in G connecting all terminals
+    """
+    edges = G.edge_variables
+    nodes = G.node_variables
+    labels = G.label_variables
 
-        warmstart_tree = nx.Graph()
-        warmstart_tree.add_edges_from(warmstart)
+    # Initialise warmstart by excluding all edges and vertices from solution:
+    for edge_var in edges.values():
+        edge_var.Start = 0
 
-        label = {start_node: 1}
-        labels[start_node].Start = 1
-        bfs = nx.bfs_edges(warmstart_tree, start_node)
+    for node_var in nodes.values():
+        node_var.Start = 0
 
-        for e in bfs:
-            label[e[1]] = label[e[0]] + 1
-            labels[e[1]].Start = label[e[1]]
+    for label_var in labels.values():
+        label_var.Start = 1
 
-            edges[e].Start = 1
+    # Include all edges and vertices from the warmstart in the solution
+    # and set vertex labels:
+    start_node = warmstart[0][0]
 
-            nodes[e[0]].Start = 1
-            nodes[e[1]].Start = 1
+    warmstart_tree = nx.Graph()
+    warmstart_tree.add_edges_from(warmstart)
 
-        m.update()
+    label = {start_node: 1}
+    labels[start_node].Start = 1
+    bfs = nx.bfs_edges(warmstart_tree, start_node)
 
-    return m
+    for e in bfs:
+        label[e[1]] = label[e[0]] + 1
+        labels[e[1]].Start = label[e[1]]
+
+        edges[e].Start = 1
+
+        nodes[e[0]].Start = 1
+        nodes[e[1]].Start = 1
 
 
 def extract_solution(G, model):
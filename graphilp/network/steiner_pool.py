@@ -0,0 +1,103 @@
+from gurobipy import quicksum
+
+from graphilp.network import steiner_linear
+from graphilp.network.distance_oracle import DistanceOracle
+from graphilp.network.heuristics import steiner_metric_closure
+
+
+class SteinerPool:
+    """ Solver for repeated Steiner tree queries on a fixed network
+
+    The model of :py:func:`graphilp.network.steiner_linear.create_model` is built only once.
+    For each query, only the lower bounds of the node variables are changed to require the terminals
+    to be part of the solution, the warmstart is reset and the model is optimised again.
+    Shortest paths needed for the metric closure heuristic are cached between queries
+    by a :py:class:`~graphilp.network.distance_oracle.DistanceOracle`.
+
+    :param G: a weighted :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param weight: name of the argument in the edge dictionary of the graph used to store edge cost
+    :param oracle: a :py:class:`~graphilp.network.distance_oracle.DistanceOracle` for G
+        (if None, an oracle without memory limit is created)
+
+    Example:
+        .. code-block::
+
+            pool = SteinerPool(G, weight='length')
+
+            for terminals in requests:
+                tree = pool.solve(terminals)
+    """
+
+    def __init__(self, G, weight='weight', oracle=None):
+        self.G = G
+        self.weight = weight
+        self.terminals = []
+
+        # create model without terminals
+        self.model = steiner_linear.create_model(G, [], weight=weight)
+
+        # lower bound on the solution length; its right-hand side is set per query
+        self.lower_bound_constr = self.model.addConstr(
+            quicksum([edge_var * G.G.edges[edge][weight] for edge, edge_var in G.edge_variables.items()]) >= 0)
+
+        self.model.update()
+
+        # shortest paths for the metric closure heuristic are cached between queries
+        self.oracle = oracle if oracle is not None else DistanceOracle(G, weight=weight)
+
+    def get_heuristic(self, terminals):
+        """ Approximation to the Steiner tree problem by metric closure using cached shortest paths
+
+        See :py:func:`graphilp.network.heuristics.steiner_metric_closure.get_heuristic`.
+
+        :param terminals: a list of vertices that need to be connected by the Steiner tree
+
+        :return: a list of edges forming the approximate solution and a lower bound on the optimal solution
+        """
+        return steiner_metric_closure.get_heuristic(self.G, terminals, weight=self.weight, oracle=self.oracle)
+
+    def set_terminals(self, terminals, warmstart=[], lower_bound=None):
+        """ Prepare the model for a new set of terminals
+
+        :param terminals: a list of vertices that need to be connected by the Steiner tree
+        :param warmstart: a list of edges forming a tree in G connecting all terminals
+        :param lower_bound: give a known lower bound to the solution length
+        """
+        nodes = self.G.node_variables
+
+        # release terminals of the previous query and require the new ones
+        for node in self.terminals:
+            nodes[node].LB = 0
+
+        self.terminals = [node for node in terminals if node in nodes]
+
+        for node in self.terminals:
+            nodes[node].LB = 1
+
+        self.lower_bound_constr.RHS = lower_bound if lower_bound else 0
+
+        # discard previous solution and warmstart
+        self.model.reset(1)
+
+        if len(warmstart) > 0:
+            steiner_linear._set_warmstart(self.G, warmstart)
+
+        self.model.update()
+
+    def solve(self, terminals, use_heuristic=True):
+        """ Find a minimum Steiner tree for a set of terminals
+
+        :param terminals: a list of vertices that need to be connected by the Steiner tree
+        :param use_heuristic: use the metric closure heuristic for a warmstart and a lower bound
+
+        :return: the edges of an optimal Steiner tree connecting all terminals in G
+        """
+        if use_heuristic:
+            warmstart, lower_bound = self.get_heuristic([t for t in terminals if t in self.G.node_variables])
+        else:
+            warmstart, lower_bound = [], None
+
+        self.set_terminals(terminals, warmstart, lower_bound)
+        self.model.optimize()
+
+        return steiner_linear.extract_solution(self.G, self.model)
@@ -1,13 +1,60 @@
 from gurobipy import Model, GRB, quicksum
 from itertools import product
-from networkx import non_edges
 
+import numpy as np
+from scipy.sparse import csc_matrix
 
-def create_model(G, clique_size):
+from graphilp.imports.ilpsetsystem import ILPSetSystem
+from graphilp.packing import set_packing
+
+
+def k_cliques(G, clique_size, max_cliques=10**6):
+    """ List all cliques with a given number of vertices
+
+    Each clique is found once by extending it only by common neighbours later in the node order.
+    The neighbours of each vertex later in the order are kept as sets, so that the work is proportional to the
+    number of smaller cliques contained in the cliques found.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param clique_size: number of vertices of the cliques
+    :param max_cliques: maximal number of cliques to enumerate
+
+    :return: a list of cliques, each given as a list of positions in the node list of G
+
+    :raises ValueError: if there are more than max_cliques cliques
+    """
+    node_index = {node: pos for pos, node in enumerate(G.G.nodes())}
+    later = [{node_index[nb] for nb in G.G.adj[node] if node_index[nb] > pos} for node, pos in node_index.items()]
+
+    cliques = []
+
+    # stack of partial cliques and their candidates for extension
+    stack = [([pos], later[pos]) for pos in reversed(range(len(later)))]
+    while stack:
+        clique, candidates = stack.pop()
+        if len(clique) == clique_size:
+            cliques.append(clique)
+            if len(cliques) > max_cliques:
+                raise ValueError(f"More than {max_cliques} cliques of size {clique_size}.")
+            continue
+
+        for pos in sorted(candidates):
+            # only later vertices, so that each clique is found once
+            extension = candidates & later[pos]
+            if len(extension) >= clique_size - len(clique) - 1:
+                stack.append((clique + [pos], extension))
+
+    return cliques
+
+
+def create_model(G, clique_size, enumerate_cliques=False, max_cliques=10**6):
     r""" Create an ILP for the clique packing problem
 
     :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
     :param clique_size: size of the clique to be packed
+    :param enumerate_cliques: enumerate all cliques of the given size and pack them with
+        :py:mod:`~graphilp.packing.set_packing` instead of assigning vertices to clique slots
+    :param max_cliques: maximal number of cliques to enumerate (see :py:func:`k_cliques`)
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -40,8 +87,14 @@ def create_model(G, clique_size):
             \forall c \in C: \sum_{v \in V} a_{cv} - k y_c = 0 && \text{(chosen cliques need to have k members)}\\
             \forall c \in C: \forall v \in V: y_c - a_{cv} \geq 0
             && \text{(cluster with } \geq 1 \text { vertex needs to be chosen as clique)}\\
+            \forall c \in C \setminus \{0\}: y_{c-1} - y_c \geq 0 && \text{(use the cliques in order of their index)}\\
             \end{align*}
 
+        With enumerate_cliques, all cliques of size :math:`k` are enumerated and form the sets of a
+        set packing problem whose elements are the vertices. This avoids the symmetry of the clique indices
+        and needs one variable per clique and one constraint per vertex, which is much smaller for small :math:`k`
+        on sparse graphs.
+
     Example:
             .. list-table::
                :widths: 50 50
@@ -52,6 +105,18 @@ def create_model(G, clique_size):
 
                    How many vertex disjoint tetrahedra can you pack in a grid graph?
     """
+    if enumerate_cliques:
+        cliques = k_cliques(G, clique_size, max_cliques)
+        indices = np.array(cliques, dtype=np.int64).reshape(-1)
+        indptr = np.arange(0, len(indices) + 1, clique_size)
+        M = csc_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr),
+                       shape=(G.G.number_of_nodes(), len(cliques)))
+        G.set_clique_system(ILPSetSystem.from_arrays(M, np.ones(len(cliques)),
+                                                     element_names=list(G.G.nodes())))
+        return set_packing.create_model(G.clique_system)
+
+    G.set_clique_system(None)
+
     # create model
     m = Model("graphilp_clique_packing")
 
@@ -73,7 +138,7 @@ def create_model(G, clique_size):
         m.addConstr(quicksum([cluster_assignment[(c, v)] for c in range(max_clusters)]) <= 1)
 
     # clique condition: vertices not connected by an egde cannot be in the same clique
-    for u, v in non_edges(G.G):
+    for u, v in G.get_bitsets().non_edges():
         for c in range(max_clusters):
             m.addConstr(cluster_assignment[(c, u)] + cluster_assignment[(c, v)] <= 1)
 
@@ -87,6 +152,10 @@ def create_model(G, clique_size):
         for v in G.G.nodes():
             m.addConstr(cluster_choice[c] - cluster_assignment[(c, v)] >= 0)
 
+    # break the symmetry between clique indices
+    for c in range(1, max_clusters):
+        m.addConstr(cluster_choice[c - 1] - cluster_choice[c] >= 0)
+
     m.update()
 
     # set optimisation objective: pack as many cliques as possible
@@ -106,6 +175,15 @@ def extract_solution(G, model):
     :returns: a dictionary mapping vertices to cliques
     """
     cliques = {v: 0 for v in G.G.nodes()}
+
+    if G.clique_system is not None:
+        node_list = list(G.G.nodes())
+        M = G.clique_system.M
+        for number, c in enumerate(set_packing.extract_solution(G.clique_system, model)):
+            for pos in M.indices[M.indptr[c]:M.indptr[c + 1]]:
+                cliques[node_list[pos]] = number + 1
+        return cliques
+
     for k, v in G.cluster_assignment.items():
         if v.X > 0.5:
             cliques[k[1]] = k[0]+1
@@ -0,0 +1,222 @@
+from random import Random
+from time import perf_counter
+
+
+class _IndependentSet:
+    """ Independent set with constant time insertions, removals and access to free vertices
+
+    The solution vertices and the free vertices (not in the solution and without solution neighbours) are kept
+    in lists together with the position of each vertex, the tightness of a vertex is its number of
+    solution neighbours. If a list is given as log, all insertions and removals are recorded so that they can
+    be undone.
+    """
+
+    def __init__(self, adj):
+        self.adj = adj
+        n = len(adj)
+        self.in_solution = [False] * n
+        self.tightness = [0] * n
+        self.solution, self.solution_pos = [], [-1] * n
+        self.free, self.free_pos = list(range(n)), list(range(n))
+        self.log = None
+
+    @staticmethod
+    def _add_to(items, positions, v):
+        positions[v] = len(items)
+        items.append(v)
+
+    @staticmethod
+    def _remove_from(items, positions, v):
+        pos = positions[v]
+        last = items.pop()
+        if last != v:
+            items[pos] = last
+            positions[last] = pos
+        positions[v] = -1
+
+    def insert(self, v):
+        """ Insert a free vertex into the solution
+        """
+        if self.log is not None:
+            self.log.append((True, v))
+        self.in_solution[v] = True
+        self._remove_from(self.free, self.free_pos, v)
+        self._add_to(self.solution, self.solution_pos, v)
+        for u in self.adj[v]:
+            self.tightness[u] += 1
+            if self.free_pos[u] >= 0:
+                self._remove_from(self.free, self.free_pos, u)
+
+    def remove(self, v):
+        """ Remove a vertex from the solution
+        """
+        if self.log is not None:
+            self.log.append((False, v))
+        self.in_solution[v] = False
+        self._remove_from(self.solution, self.solution_pos, v)
+        self._add_to(self.free, self.free_pos, v)
+        for u in self.adj[v]:
+            self.tightness[u] -= 1
+            if self.tightness[u] == 0 and not self.in_solution[u]:
+                self._add_to(self.free, self.free_pos, u)
+
+    def undo(self):
+        """ Undo all recorded insertions and removals and stop recording
+        """
+        log, self.log = self.log, None
+        for inserted, v in reversed(log):
+            if inserted:
+                self.remove(v)
+            else:
+                self.insert(v)
+
+    def force(self, v):
+        """ Insert a vertex into the solution and remove its solution neighbours
+        """
+        for u in self.adj[v]:
+            if self.in_solution[u]:
+                self.remove(u)
+        self.insert(v)
+
+    def two_improvement(self, x):
+        """ Try to replace a solution vertex by two non-adjacent neighbours that are only adjacent to it
+        """
+        candidates = [u for u in self.adj[x] if self.tightness[u] == 1]
+        if len(candidates) < 2:
+            return None
+
+        for pos, u in enumerate(candidates):
+            neighbours = set(self.adj[u])
+            for w in candidates[pos + 1:]:
+                if w not in neighbours:
+                    self.remove(x)
+                    self.insert(u)
+                    self.insert(w)
+                    return u, w
+
+        return None
+
+
+def _local_search(solution, candidates, rng):
+    """ Apply insertions of free vertices and (1,2)-swaps until a local optimum is reached
+    """
+    while True:
+        while len(solution.free) > 0:
+            v = solution.free[rng.randrange(len(solution.free))]
+            solution.insert(v)
+            candidates.append(v)
+
+        if len(candidates) == 0:
+            return
+
+        x = candidates.pop()
+        if not solution.in_solution[x]:
+            continue
+
+        swap = solution.two_improvement(x)
+        if swap is not None:
+            candidates.extend(swap)
+            # solution vertices next to vertices that became 1-tight may allow a swap now
+            for y in solution.adj[x]:
+                if solution.tightness[y] == 1 and not solution.in_solution[y]:
+                    candidates.extend(z for z in solution.adj[y] if solution.in_solution[z])
+
+
+def get_heuristic(G, time_limit=10, max_iter=None, seed=0, warmstart=[]):
+    """ Iterated local search for the maximum independent set problem (Andrade, Resende, and Werneck)
+
+    Starting from a greedy solution (minimum degree first) or a given independent set, the local search
+    inserts free vertices and applies (1,2)-swaps, which replace a solution vertex by two non-adjacent
+    neighbours whose only solution neighbour it is. Each iteration perturbs the current solution by forcing
+    one (occasionally more) random vertices into it and runs the local search again. Worse solutions are
+    accepted with a probability that decreases with the distance to the current and the best solution.
+
+    The graph is stored as lists of integer neighbours; the solution and the free vertices are kept in
+    arrays with position indices so that every insertion and removal takes time proportional to the degree.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param time_limit: time budget in seconds
+    :param max_iter: maximal number of perturbations (None for no limit)
+    :param seed: seed of the random number generator
+    :param warmstart: an independent set to start from
+
+    :return: a list of vertices forming an independent set
+
+    :raises ValueError: if the warmstart is not an independent set
+
+    Example:
+        .. code-block::
+
+            ind_set = indset_local_search.get_heuristic(G, time_limit=60)
+            m = max_indset.create_model(G, warmstart=ind_set)
+    """
+    start_time = perf_counter()
+    rng = Random(seed)
+
+    node_list = list(G.G.nodes())
+    node_index = {node: pos for pos, node in enumerate(node_list)}
+    adj = [[node_index[nb] for nb in G.G.adj[node] if nb != node] for node in node_list]
+
+    solution = _IndependentSet(adj)
+
+    # vertices with a self-loop can never be inserted
+    insertable = [True] * len(node_list)
+    num_insertable = len(node_list)
+    for node in node_list:
+        if G.G.has_edge(node, node):
+            v = node_index[node]
+            insertable[v] = False
+            num_insertable -= 1
+            solution._remove_from(solution.free, solution.free_pos, v)
+            solution.tightness[v] = len(node_list) + 1
+
+    if len(warmstart) > 0:
+        for v in {node_index[node] for node in warmstart}:
+            # a vertex that is not free has a self-loop or a neighbour in the warmstart
+            if solution.free_pos[v] < 0:
+                raise ValueError("The warmstart is not an independent set.")
+            solution.insert(v)
+    else:
+        for v in sorted(range(len(adj)), key=lambda v: len(adj[v])):
+            if solution.free_pos[v] >= 0:
+                solution.insert(v)
+
+    _local_search(solution, list(solution.solution), rng)
+    best = list(solution.solution)
+    current_size = len(best)
+
+    iteration = 0
+    while perf_counter() - start_time < time_limit and (max_iter is None or iteration < max_iter):
+        iteration += 1
+        if len(solution.solution) == num_insertable:
+            break
+        solution.log = []
+
+        # force one vertex into the solution, sometimes more
+        num_forced = 1
+        while rng.random() < 1 / (2 * max(current_size, 1)):
+            num_forced += 1
+        candidates = []
+        for _ in range(num_forced):
+            v = rng.randrange(len(adj))
+            while solution.in_solution[v] or not insertable[v]:
+                v = rng.randrange(len(adj))
+            solution.force(v)
+            candidates.extend(nb for u in adj[v] for nb in adj[u] if solution.in_solution[nb])
+
+        _local_search(solution, candidates, rng)
+        new_size = len(solution.solution)
+
+        if new_size > len(best):
+            best = list(solution.solution)
+
+        # accept worse solutions with decreasing probability
+        delta = current_size - new_size
+        if delta > 0 and rng.random() > 1 / (1 + delta * (len(best) - new_size)):
+            # restore the previous solution
+            solution.undo()
+        else:
+            solution.log = None
+            current_size = new_size
+
+    return [node_list[v] for v in sorted(best)]
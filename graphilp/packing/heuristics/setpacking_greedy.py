@@ -1,4 +1,6 @@
-from numpy import ones
+from heapq import heapify, heappop
+from numpy import zeros
+from scipy.sparse import csc_matrix
 
 
 def get_heuristic(S):
@@ -7,36 +9,46 @@ def get_heuristic(S):
     Iteratively add the set with highest size-to-weight ratio which does not contain an element
     that is already covered to the solution.
 
+    The sets are kept in a priority queue ordered by their ratio. The incidence matrix is used both in
+    compressed sparse column (CSC) and compressed sparse row (CSR) format: when a set is picked,
+    only the sets sharing one of its elements are marked as conflicting. Hence, the running time
+    is proportional to the number of non-zero entries of the incidence matrix (up to the priority queue).
+
     :param S: a weighted :py:class:`~graphilp.imports.ilpsetsystem.ILPSetSystem`
 
     :return: a list of disjoint sets of the set system
     """
     # abbreviations
-    set_names = list(S.S.keys())
-    set_index = range(len(S.S))
-    set_sizes = sum(S.M)
+    set_names = S.get_set_names()
+    weights = S.get_set_weights(default=None).tolist()
+    by_set = csc_matrix(S.M)
+    by_set.eliminate_zeros()
+    by_element = by_set.tocsr()
 
-    # which elements of the universe are not yet covered by the solution?
-    not_covered = ones((len(S.U),), dtype=int)
+    # sets conflicting with a set in the solution
+    blocked = zeros((len(set_names),), dtype=bool)
 
-    # all sets can still be used
-    sets = set(set_index)
+    # priority queue of all sets by efficiency
+    queue = [((by_set.indptr[_set + 1] - by_set.indptr[_set]) / weights[_set], _set)
+             for _set in range(len(set_names))]
+    heapify(queue)
 
     # start with an empty result
     result = []
 
-    # while there are still
-    while len(sets) > 0:
+    # while there are still sets that can be added
+    while len(queue) > 0:
 
         # pick most efficient set
-        chosen_set = min([(set_sizes[_set] / S.S[set_names[_set]]['weight'], _set) for _set in sets])[1]
-        result.append(chosen_set)
+        _, chosen_set = heappop(queue)
+        if blocked[chosen_set]:
+            continue
 
-        # update which elements are not yet covered
-        not_covered = not_covered * (1 - S.M[:, chosen_set])
+        result.append(chosen_set)
+        blocked[chosen_set] = True
 
-        # remove all sets covering an element already covered by a set in the solution
-        remove_sets = {_set for _set in set_index if sum((1 - not_covered) * S.M[:, _set]) > 0}
-        sets = sets.difference(remove_sets)
+        # block all sets sharing an element with the chosen set
+        for element in by_set.indices[by_set.indptr[chosen_set]:by_set.indptr[chosen_set + 1]]:
+            blocked[by_element.indices[by_element.indptr[element]:by_element.indptr[element + 1]]] = True
 
-    return [set_names[s] for s in result]
+    return set_names[result].tolist()
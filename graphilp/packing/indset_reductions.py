@@ -0,0 +1,273 @@
+from collections import deque
+from itertools import count
+
+from networkx import Graph
+
+from graphilp.covering.heuristics.vertexcover_lp_rounding import crown_decomposition
+
+
+class FoldedVertex:
+    """ A vertex of the kernel that replaces several vertices of the original graph
+    """
+    _ids = count()
+
+    def __init__(self):
+        self.id = next(FoldedVertex._ids)
+
+    def __repr__(self):
+        return f"FoldedVertex({self.id})"
+
+
+class IndependentSetKernel:
+    r""" Reduce a graph for the maximum independent set and minimum vertex cover problems
+
+    The following rules are applied until none of them changes the graph any more:
+
+    * **Degree zero:** an isolated vertex is part of a maximum independent set.
+    * **Degree one:** a vertex of degree one is part of a maximum independent set, its neighbour is not.
+    * **Degree two:** a vertex :math:`v` of degree two whose neighbours :math:`u, w` are adjacent is part of a
+      maximum independent set. If :math:`u` and :math:`w` are not adjacent, the three vertices are folded into
+      a new vertex adjacent to :math:`N(u) \cup N(w) \setminus \{v\}`; if the new vertex is in a maximum
+      independent set of the reduced graph, :math:`u` and :math:`w` are in the original one, otherwise :math:`v` is.
+    * **Twin:** two non-adjacent vertices :math:`u, v` of degree three with the same neighbours are part of a
+      maximum independent set if their neighbourhood contains an edge. Otherwise, the five vertices are folded into
+      a new vertex adjacent to the neighbours of the common neighbourhood; if the new vertex is in a maximum
+      independent set of the reduced graph, the common neighbours are in the original one, otherwise :math:`u, v` are.
+    * **Domination and unconfined vertices:** a vertex :math:`v` is removed if some maximum independent set
+      does not contain it. This holds in particular if :math:`N[u] \subseteq N[v]` for a neighbour :math:`u`
+      (domination) and more generally if :math:`v` is unconfined in the sense of Xiao and Nagamochi.
+
+    With lp_reduction, the Nemhauser-Trotter decomposition (see
+    :py:func:`~graphilp.covering.heuristics.vertexcover_lp_rounding.crown_decomposition`) is applied at
+    the fixed point: vertices of LP value 1 are removed, vertices of LP value 0 are put into the independent set,
+    and only the vertices of value 1/2 remain. This is repeated together with the rules until nothing changes.
+
+    Vertices with a self-loop cannot be part of an independent set and are removed first.
+    All decisions are recorded in a log, which is replayed backwards to lift a solution of the kernel
+    to a solution of the original graph.
+
+    :param G: a `NetworkX graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+    :param rules: apply the reduction rules
+    :param lp_reduction: apply the Nemhauser-Trotter reduction
+
+    Example:
+        .. code-block::
+
+            reduction = IndependentSetKernel(G)
+            kernel_solution = solve(reduction.kernel)
+            ind_set = reduction.lift_independent_set(kernel_solution)
+    """
+
+    def __init__(self, G, rules=True, lp_reduction=False):
+        self.nodes = list(G.nodes())
+        self.adj = {node: set(G.adj[node]) - {node} for node in G.nodes()}
+        self.log = []
+        self.offset = 0
+
+        # vertices with a self-loop are in every vertex cover
+        for node in [node for node in G.nodes() if G.has_edge(node, node)]:
+            self._exclude(node)
+
+        if rules:
+            self._reduce()
+
+        while lp_reduction:
+            zero, _, one = crown_decomposition(self.adj)
+            if len(zero) == 0 and len(one) == 0:
+                break
+
+            # vertices of LP value 0 only have neighbours of LP value 1
+            for node in one:
+                self._exclude(node)
+            for node in zero:
+                self._include(node)
+
+            if rules:
+                self._reduce()
+
+        self.kernel = Graph()
+        self.kernel.add_nodes_from(self.adj)
+        self.kernel.add_edges_from((u, v) for u, neighbours in self.adj.items() for v in neighbours)
+        del self.adj
+
+    def _remove(self, node):
+        """ Remove a vertex from the graph and return its former neighbours
+        """
+        neighbours = self.adj.pop(node)
+        for nb in neighbours:
+            self.adj[nb].discard(node)
+
+        return neighbours
+
+    def _include(self, node):
+        """ Put a vertex into the independent set and remove it together with its neighbours
+        """
+        self.log.append(('include', node))
+        self.offset += 1
+        affected = set()
+        for nb in self._remove(node):
+            affected |= self._remove(nb)
+
+        return affected
+
+    def _exclude(self, node):
+        """ Remove a vertex that is not part of the independent set
+        """
+        self.log.append(('exclude', node))
+
+        return self._remove(node)
+
+    def _fold(self, removed, neighbours, log_entry, gain):
+        """ Replace a set of vertices by a new vertex adjacent to the given neighbours
+        """
+        for node in removed:
+            self._remove(node)
+
+        new_node = FoldedVertex()
+        self.adj[new_node] = set(neighbours)
+        for nb in neighbours:
+            self.adj[nb].add(new_node)
+
+        self.log.append(log_entry + (new_node,))
+        self.offset += gain
+
+        return set(neighbours) | {new_node}
+
+    def _unconfined(self, node):
+        """ Check whether a vertex is unconfined (Xiao and Nagamochi)
+        """
+        S = {node}
+        neighbourhood = set(self.adj[node])
+
+        while True:
+            best = None
+            for u in neighbourhood:
+                if len(self.adj[u] & S) == 1:
+                    outside = self.adj[u] - S - neighbourhood
+                    if best is None or len(outside) < len(best):
+                        best = outside
+                        if len(best) == 0:
+                            return True
+            if best is None or len(best) > 1:
+                return False
+
+            w = next(iter(best))
+            S.add(w)
+            neighbourhood |= self.adj[w]
+            neighbourhood -= S
+
+    def _apply_rules(self, node):
+        """ Apply the first applicable rule to a vertex and return the vertices whose neighbourhood changed
+        """
+        neighbours = self.adj[node]
+        degree = len(neighbours)
+
+        if degree <= 1:
+            return self._include(node)
+
+        if degree == 2:
+            u, w = neighbours
+            if w in self.adj[u]:
+                return self._include(node)
+            return self._fold((node, u, w), (self.adj[u] | self.adj[w]) - {node, u, w},
+                              ('fold', node, u, w), 1)
+
+        if degree == 3:
+            # look for a twin among the neighbours of the neighbours
+            a = next(iter(neighbours))
+            for twin in self.adj[a]:
+                if twin != node and len(self.adj[twin]) == 3 and self.adj[twin] == neighbours:
+                    if any(self.adj[x] & neighbours for x in neighbours):
+                        self.log.append(('include', twin))
+                        self.offset += 1
+                        return self._include(node) | self._remove(twin)
+                    outer = set().union(*(self.adj[x] for x in neighbours)) - {node, twin}
+                    return self._fold((node, twin) + tuple(neighbours), outer,
+                                      ('twin', node, twin, tuple(neighbours)), 2)
+
+        if self._unconfined(node):
+            return self._exclude(node)
+
+        return None
+
+    def _reduce(self):
+        """ Apply the reduction rules until a fixed point is reached
+        """
+        queue = deque(self.adj)
+        queued = set(self.adj)
+
+        while len(queue) > 0:
+            node = queue.popleft()
+            queued.discard(node)
+            if node not in self.adj:
+                continue
+
+            affected = self._apply_rules(node)
+            if affected is None:
+                continue
+
+            # vertices at distance up to two of a change may become reducible
+            candidates = set()
+            for x in affected:
+                if x in self.adj:
+                    candidates.add(x)
+                    candidates |= self.adj[x]
+            for x in candidates:
+                if x not in queued:
+                    queued.add(x)
+                    queue.append(x)
+
+    def lift_independent_set(self, ind_set):
+        """ Lift an independent set of the kernel to the original graph
+
+        The size of the lifted set is the size of the given set plus the offset of the reduction,
+        so maximum independent sets of the kernel yield maximum independent sets of the graph.
+
+        :param ind_set: a list of vertices forming an independent set of the kernel
+
+        :return: a list of vertices forming an independent set of the original graph
+        """
+        solution = set(ind_set)
+
+        for entry in reversed(self.log):
+            if entry[0] == 'include':
+                solution.add(entry[1])
+            elif entry[0] == 'fold':
+                _, v, u, w, new_node = entry
+                if new_node in solution:
+                    solution.discard(new_node)
+                    solution |= {u, w}
+                else:
+                    solution.add(v)
+            elif entry[0] == 'twin':
+                _, u, v, neighbours, new_node = entry
+                if new_node in solution:
+                    solution.discard(new_node)
+                    solution |= set(neighbours)
+                else:
+                    solution |= {u, v}
+
+        return list(solution)
+
+    def lift_vertex_cover(self, cover):
+        """ Lift a vertex cover of the kernel to the original graph
+
+        The lifted cover consists of all vertices not in the lifted independent set of the kernel vertices
+        outside the cover. Its size is the size of the given cover plus :py:meth:`cover_offset`.
+
+        :param cover: a list of vertices forming a vertex cover of the kernel
+
+        :return: a list of vertices forming a vertex cover of the original graph
+        """
+        cover = set(cover)
+        ind_set = set(self.lift_independent_set([node for node in self.kernel.nodes() if node not in cover]))
+
+        return [node for node in self.nodes if node not in ind_set]
+
+    def cover_offset(self):
+        """ Get the difference between the size of a lifted vertex cover and the size of the cover of the kernel
+
+        :return: the number of vertices of the original graph minus the offset and the number of kernel vertices
+            (folded vertices of the kernel included)
+        """
+        return len(self.nodes) - self.offset - self.kernel.number_of_nodes()
@@ -0,0 +1,214 @@
+import numpy as np
+from networkx import Graph
+
+from graphilp.imports.graph_formats import edges_chunks
+
+UNDECIDED, IN_SET, EXCLUDED = 0, 1, 2
+
+
+class SemiExternalGraph:
+    r""" Independent sets and vertex covers of graphs too large for memory (semi-external model)
+
+    Only a constant number of NumPy arrays indexed by the vertex ids is kept in memory, the edges are read again
+    from the .edges file (see :py:func:`~graphilp.imports.graph_formats.edges_chunks`) in each pass.
+    Vertex ids have to be non-negative integers, the arrays have the length of the largest id plus one.
+
+    Every vertex has a status: undecided, in the independent set, or excluded from it (i.e., in the vertex cover).
+    Vertices with a self-loop are excluded from the start. :py:meth:`reduce` decides vertices by exact
+    reduction rules, the remaining undecided vertices form the residual graph which can be loaded by
+    :py:meth:`residual_graph` and solved by :py:mod:`~graphilp.packing.max_indset` or
+    :py:mod:`~graphilp.covering.min_vertexcover`.
+
+    :param path: path to .edges file (may be gzipped)
+    :param chunk_size: approximate number of bytes read at once
+
+    Example:
+        .. code-block::
+
+            S = SemiExternalGraph("huge_graph.edges")
+            S.reduce()
+            warmstart = S.greedy_independent_set(residual=True).tolist()
+            G = imp_nx.read(S.residual_graph())
+            m = max_indset.create_model(G, kernelize=True, warmstart=warmstart)
+            m.optimize()
+            ind_set = S.lift_independent_set(max_indset.extract_solution(G, m))
+    """
+
+    def __init__(self, path, chunk_size=2**24):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.passes = 0
+
+        # first pass: degrees and self-loops
+        degree = np.zeros(0, dtype=np.int64)
+        loops = []
+        for u, v in self.edges():
+            size = max(u.max(), v.max()) + 1
+            if size > len(degree):
+                degree = np.concatenate((degree, np.zeros(max(size, 2 * len(degree)) - len(degree), dtype=np.int64)))
+            np.add.at(degree, u, 1)
+            np.add.at(degree, v, 1)
+            loops.append(u[u == v])
+
+        self.present = degree > 0
+        size = np.flatnonzero(self.present)[-1] + 1 if self.present.any() else 0
+        self.present = self.present[:size]
+        self.degree = degree[:size]
+
+        self.status = np.full(size, UNDECIDED, dtype=np.int8)
+        self.status[~self.present] = EXCLUDED
+        self.status[np.concatenate(loops + [np.zeros(0, dtype=np.int64)])] = EXCLUDED
+
+    def edges(self, residual=False):
+        """ Read the edges of the graph in chunks
+
+        :param residual: only return edges between undecided vertices
+
+        :return: a generator of pairs of NumPy arrays with the end points of the edges
+        """
+        self.passes += 1
+        for u, v in edges_chunks(self.path, self.chunk_size):
+            if residual:
+                both = (self.status[u] == UNDECIDED) & (self.status[v] == UNDECIDED)
+                u, v = u[both], v[both]
+            yield u, v
+
+    def reduce(self, max_passes=100):
+        """ Decide vertices of degree at most one in the residual graph
+
+        An isolated vertex and a vertex with a single neighbour are contained in some maximum independent set.
+        They are put into the independent set and their neighbours are excluded. Each pass over the file
+        computes the degrees and, for vertices of degree one, the neighbour in the residual graph and applies
+        the rules to all such vertices at once, until no rule applies or max_passes is reached.
+
+        :param max_passes: maximal number of passes over the file
+
+        :return: the number of undecided vertices
+        """
+        for _ in range(max_passes):
+            degree = np.zeros(len(self.status), dtype=np.int64)
+            neighbour = np.zeros(len(self.status), dtype=np.int64)
+            for u, v in self.edges(residual=True):
+                np.add.at(degree, u, 1)
+                np.add.at(degree, v, 1)
+                neighbour[u] = v
+                neighbour[v] = u
+
+            undecided = self.status == UNDECIDED
+            isolated = np.flatnonzero(undecided & (degree == 0))
+            single = np.flatnonzero(undecided & (degree == 1))
+            partner = neighbour[single]
+
+            # of two adjacent vertices of degree one, the smaller one is taken
+            keep = (degree[partner] != 1) | (partner > single)
+            single, partner = single[keep], partner[keep]
+
+            if len(isolated) == 0 and len(single) == 0:
+                break
+
+            self.status[isolated] = IN_SET
+            self.status[single] = IN_SET
+            self.status[partner] = EXCLUDED
+
+        return int(np.count_nonzero(self.status == UNDECIDED))
+
+    def greedy_independent_set(self, residual=False, seed=0):
+        """ Greedy maximal independent set choosing vertices of minimum degree first
+
+        The vertices are ranked by degree with random tie-breaking. In each pass, undecided neighbours of
+        the vertices chosen in the previous pass are excluded, and undecided vertices without an undecided
+        neighbour of lower rank are chosen. This yields the same set as choosing the undecided vertices one by
+        one in the order of their rank, and for random tie-breaking, the number of passes is usually small.
+        Vertices already decided by :py:meth:`reduce` keep their status.
+
+        :param residual: only return the vertices of the residual graph
+        :param seed: seed of the random tie-breaking
+
+        :return: a NumPy array of vertices forming an independent set
+        """
+        rng = np.random.default_rng(seed)
+        rank = self.degree * len(self.degree) + rng.permutation(len(self.degree))
+
+        status = self.status.copy()
+        while np.any(status == UNDECIDED):
+            blocked = np.zeros(len(status), dtype=bool)
+            for u, v in self.edges():
+                # neighbours of the vertices chosen in previous passes
+                status[v[(status[u] == IN_SET) & (status[v] == UNDECIDED)]] = EXCLUDED
+                status[u[(status[v] == IN_SET) & (status[u] == UNDECIDED)]] = EXCLUDED
+
+                both = (status[u] == UNDECIDED) & (status[v] == UNDECIDED)
+                u, v = u[both], v[both]
+                blocked[np.where(rank[u] > rank[v], u, v)] = True
+
+            status[(status == UNDECIDED) & ~blocked] = IN_SET
+
+        chosen = status == IN_SET
+        if residual:
+            chosen &= self.status == UNDECIDED
+
+        return np.flatnonzero(chosen)
+
+    def matching_vertex_cover(self, seed=0):
+        """ Vertex cover from a maximal matching of the residual graph
+
+        The matched vertices together with all excluded vertices form a vertex cover, which has at most twice
+        the size of a minimum vertex cover if no vertices have been decided yet. The matching is computed in
+        a single pass: in each chunk, the edges are given random priorities and edges of lowest priority
+        at both end points are matched until no edge with two unmatched end points remains.
+
+        :param seed: seed of the random priorities
+
+        :return: a NumPy array of vertices forming a vertex cover
+        """
+        rng = np.random.default_rng(seed)
+        matched = np.zeros(len(self.status), dtype=bool)
+        lowest = np.full(len(self.status), np.iinfo(np.int64).max, dtype=np.int64)
+
+        for u, v in self.edges(residual=True):
+            priority = rng.permutation(len(u))
+            while True:
+                free = ~matched[u] & ~matched[v]
+                u, v, priority = u[free], v[free], priority[free]
+                if len(u) == 0:
+                    break
+
+                np.minimum.at(lowest, u, priority)
+                np.minimum.at(lowest, v, priority)
+                chosen = (lowest[u] == priority) & (lowest[v] == priority)
+                matched[u[chosen]] = True
+                matched[v[chosen]] = True
+                lowest[u] = lowest[v] = np.iinfo(np.int64).max
+
+        return np.flatnonzero(self.present & ((self.status == EXCLUDED) | matched))
+
+    def residual_graph(self):
+        """ Load the graph induced by the undecided vertices
+
+        :return: a `NetworkX Graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+        """
+        G = Graph()
+        G.add_nodes_from(np.flatnonzero(self.status == UNDECIDED).tolist())
+        for u, v in self.edges(residual=True):
+            G.add_edges_from(zip(u.tolist(), v.tolist()))
+
+        return G
+
+    def lift_independent_set(self, ind_set):
+        """ Turn an independent set of the residual graph into one of the whole graph
+
+        :param ind_set: an independent set of the residual graph
+
+        :return: a NumPy array of vertices forming an independent set
+        """
+        return np.union1d(np.flatnonzero(self.status == IN_SET), np.asarray(ind_set, dtype=np.int64))
+
+    def lift_vertex_cover(self, cover):
+        """ Turn a vertex cover of the residual graph into one of the whole graph
+
+        :param cover: a vertex cover of the residual graph
+
+        :return: a NumPy array of vertices forming a vertex cover
+        """
+        excluded = np.flatnonzero(self.present & (self.status == EXCLUDED))
+        return np.union1d(excluded, np.asarray(cover, dtype=np.int64))
@@ -1,10 +1,18 @@
 from gurobipy import Model, GRB, quicksum
 
+from graphilp.covering import vertexcover_bipartite
+from graphilp.packing.indset_reductions import IndependentSetKernel
 
-def create_model(G):
+
+def create_model(G, kernelize=False, lp_reduction=False, warmstart=[]):
     r""" Create an ILP for the maximum independet set problem
 
     :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param kernelize: reduce the graph with :py:class:`~graphilp.packing.indset_reductions.IndependentSetKernel`
+        first and build the ILP on the kernel; the objective value still refers to the whole graph
+    :param lp_reduction: fix the vertices of LP value 0 and 1 in the Nemhauser-Trotter decomposition and build the ILP
+        only on the vertices of LP value 1/2 (can be combined with kernelize)
+    :param warmstart: a list of vertices forming an independent set of G
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -25,18 +33,37 @@ def create_model(G):
     # Create model
     m = Model("graphilp_max_ind_set")
 
+    # reduce the graph
+    if kernelize or lp_reduction:
+        G.set_kernel(IndependentSetKernel(G.G, rules=kernelize, lp_reduction=lp_reduction))
+        graph = G.kernel.kernel
+        offset = G.kernel.cover_offset()
+    else:
+        G.set_kernel(None)
+        graph = G.G
+        offset = 0
+
     # Add variables for edges and nodes
-    G.set_node_vars(m.addVars(G.G.nodes(), vtype=GRB.BINARY))
+    G.set_node_vars(m.addVars(graph.nodes(), vtype=GRB.BINARY))
     m.update()
     nodes = G.node_variables
 
     # Create constraints
     # for every edge, at least one vertex must be in a vertex cover of G
-    for (u, v) in G.G.edges:
+    for (u, v) in graph.edges:
         m.addConstr(nodes[u] + nodes[v] >= 1)
 
     # set optimisation objective: minimize cardinality of the vertex cover
-    m.setObjective(quicksum(nodes), GRB.MINIMIZE)
+    m.setObjective(quicksum(nodes.values()) + offset, GRB.MINIMIZE)
+
+    # set warmstart
+    # (the variables indicate the vertex cover, folded vertices of a kernel get no start value)
+    if len(warmstart) > 0:
+        warmstart = set(warmstart)
+        for node in nodes:
+            if node in G.G:
+                nodes[node].Start = node not in warmstart
+        m.update()
 
     return m
 
@@ -51,4 +78,31 @@ def extract_solution(G, model):
     """
     ind_set = [node for node, node_var in G.node_variables.items() if node_var.X < 0.5]
 
+    # lift the solution of the kernel to the whole graph
+    if G.kernel is not None:
+        ind_set = G.kernel.lift_independent_set(ind_set)
+
     return ind_set
+
+
+def solve(G, **kwargs):
+    """ Solve the maximum independent set problem, directly if the graph is bipartite
+
+    For bipartite graphs, the complement of a minimum vertex cover computed by
+    :py:func:`~graphilp.covering.vertexcover_bipartite.get_vertex_cover` is returned without an ILP.
+    For other graphs, the ILP is created, optimised and the solution extracted.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param kwargs: further arguments for :py:func:`create_model` if an ILP is needed
+
+    :returns: a list of vertices comprising a maximum independent set
+    """
+    cover = vertexcover_bipartite.get_vertex_cover(G, weighted=False)
+    if cover is not None:
+        cover = set(cover)
+        return [node for node in G.G.nodes() if node not in cover]
+
+    m = create_model(G, **kwargs)
+    m.optimize()
+
+    return extract_solution(G, m)
@@ -27,16 +27,16 @@ def create_model(S, warmstart=[]):
     # Create model
     m = Model("graphilp_max_set_packing")
 
+    # set weight vector
+    obj = S.get_set_weights()
+
     # Add variables
-    x = m.addMVar(shape=len(S.S), vtype=GRB.BINARY, name="x")
+    x = m.addMVar(shape=len(obj), vtype=GRB.BINARY, name="x")
     S.set_system_vars(x)
     m.update()
 
     # Add vector b for the right-hand side
-    b = ones((len(S.U),), dtype=int)
-
-    # set weight vector
-    obj = array([val.get('weight', 1) for _set, val in S.S.items()])
+    b = ones((S.M.shape[0],), dtype=int)
 
     # Add constraints
     m.addConstr(S.M @ x <= b, name="c")
@@ -46,12 +46,8 @@ def create_model(S, warmstart=[]):
 
     # set warmstart
     if len(warmstart) > 0:
-        sets = list(S.S.keys())
-        for pos in range(len(sets)):
-            if sets[pos] in warmstart:
-                x[pos].Start = 1
-            else:
-                x[pos].Start = 0
+        warmstart = set(warmstart)
+        x.Start = array([name in warmstart for name in S.get_set_names()], dtype=float)
 
     m.update()
 
@@ -66,7 +62,6 @@ def extract_solution(S, model):
 
     :return: a list of sets comprising a set packing
     """
-    iterate = list(range(len(S.S)))
-    set_cover = [list(S.S.keys())[i] for i in iterate if S.system_variables.X[i] > 0.5]
+    set_packing = S.get_set_names()[S.system_variables.X > 0.5].tolist()
 
-    return set_cover
+    return set_packing
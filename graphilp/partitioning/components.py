@@ -0,0 +1,182 @@
+from importlib import import_module
+from multiprocessing import get_context
+from networkx import connected_components
+
+from graphilp.imports import networkx as nximp
+from graphilp.partitioning.heuristics import vertex_coloring_dsatur
+from graphilp.sub_super.heuristics import clique_greedy
+
+
+def _trivial_vertex_cover(G, weight='weight', **kwargs):
+    """ Minimum vertex cover of a graph with at most two vertices
+    """
+    if G.number_of_edges() == 0:
+        return []
+    u, v = list(G.nodes())
+
+    return [u] if G.nodes[u].get(weight, 1) <= G.nodes[v].get(weight, 1) else [v]
+
+
+def _trivial_ind_set(G, **kwargs):
+    """ Maximum independent set of a graph with at most two vertices
+    """
+    return list(G.nodes())[:1] if G.number_of_edges() > 0 else list(G.nodes())
+
+
+def _trivial_dom_set(G, **kwargs):
+    """ Minimum dominating set of a graph with at most two vertices
+    """
+    return list(G.nodes())[:1] if G.number_of_edges() > 0 else list(G.nodes())
+
+
+def _trivial_coloring(G, **kwargs):
+    """ Minimum vertex colouring of a graph with at most two vertices
+    """
+    node_to_col = {node: pos if G.number_of_edges() > 0 else 0 for pos, node in enumerate(G.nodes())}
+
+    return _colors_to_nodes(node_to_col), node_to_col
+
+
+def _direct_coloring(G, **kwargs):
+    """ Heuristic vertex colouring if it uses no more colours than there are vertices in a clique, None otherwise
+    """
+    col_to_node, node_to_col = vertex_coloring_dsatur.get_heuristic(G)
+    if len(col_to_node) <= len(clique_greedy.get_heuristic(G)):
+        return col_to_node, node_to_col
+
+    return None
+
+
+def _trivial_matching(G, weight='weight', **kwargs):
+    """ Maximum weight matching of a graph with at most two vertices
+    """
+    return [e for e in G.edges() if G.edges[e].get(weight, 1) > 0]
+
+
+def _colors_to_nodes(node_to_col):
+    """ Invert a mapping from vertices to colours
+    """
+    col_to_node = {}
+    for node, color in node_to_col.items():
+        col_to_node.setdefault(color, []).append(node)
+
+    return col_to_node
+
+
+def _merge_lists(solutions):
+    """ Merge solutions given as lists of vertices or edges
+    """
+    return [x for solution in solutions for x in solution]
+
+
+def _merge_colorings(solutions):
+    """ Merge vertex colourings of different components reusing the same colours in each component
+    """
+    node_to_col = {}
+    for _, component_node_to_col in solutions:
+        # relabel colours of each component to 0, 1, 2, ...
+        relabel = {color: pos for pos, color in enumerate(sorted(set(component_node_to_col.values())))}
+        for node, color in component_node_to_col.items():
+            node_to_col[node] = relabel[color]
+
+    return _colors_to_nodes(node_to_col), node_to_col
+
+
+# supported problems: module name -> (solver for components with at most two vertices, merge function,
+# solver returning an optimal solution without an ILP or None if an ILP is needed)
+SUPPORTED_PROBLEMS = {
+    'graphilp.covering.min_vertexcover': (_trivial_vertex_cover, _merge_lists, None),
+    'graphilp.packing.max_indset': (_trivial_ind_set, _merge_lists, None),
+    'graphilp.covering.min_dom_set': (_trivial_dom_set, _merge_lists, None),
+    'graphilp.partitioning.min_vertex_coloring': (_trivial_coloring, _merge_colorings, _direct_coloring),
+    'graphilp.matching.maxweight': (_trivial_matching, _merge_lists, None)
+}
+
+
+def _solve_components(module_name, components, kwargs):
+    """ Solve a list of components one after the other, with an ILP if no direct solution is available
+    """
+    problem = import_module(module_name)
+    solve_direct = SUPPORTED_PROBLEMS[module_name][2]
+    solutions = []
+
+    for component in components:
+        optG = nximp.read(component)
+        if solve_direct is not None:
+            solution = solve_direct(optG, **kwargs)
+            if solution is not None:
+                solutions.append(solution)
+                continue
+
+        m = problem.create_model(optG, **kwargs)
+        m.Params.OutputFlag = 0
+        m.Params.Threads = 1
+        m.optimize()
+        solutions.append(problem.extract_solution(optG, m))
+
+    return solutions
+
+
+def solve(G, problem, processes=None, chunk_size=16, **kwargs):
+    """ Solve a problem separately on each connected component of a graph
+
+    For problems whose solution on a disconnected graph is the union of the solutions on its
+    connected components, the graph is split into its components. Components with at most two vertices
+    are solved directly. For the remaining components, an ILP is created and solved in a pool of
+    worker processes, unless a heuristic solution is provably optimal (for vertex colouring, if it uses
+    no more colours than there are vertices in a clique). The solutions are merged into the format of
+    the problem's extract_solution function.
+
+    Supported problems are
+    :py:mod:`~graphilp.covering.min_vertexcover`,
+    :py:mod:`~graphilp.packing.max_indset`,
+    :py:mod:`~graphilp.covering.min_dom_set`,
+    :py:mod:`~graphilp.partitioning.min_vertex_coloring`, and
+    :py:mod:`~graphilp.matching.maxweight`.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param problem: the module of a supported problem, e.g., graphilp.covering.min_vertexcover
+    :param processes: number of worker processes (None for the number of CPUs, 1 to solve in this process)
+    :param chunk_size: number of components sent to a worker process at once
+    :param kwargs: further arguments passed on to the problem's create_model function,
+        e.g., weight (a warmstart cannot be used)
+
+    :return: a solution in the format of the problem's extract_solution function
+
+    Example:
+        .. code-block::
+
+            from graphilp.covering import min_vertexcover
+
+            cover = components.solve(G, min_vertexcover, processes=8)
+    """
+    module_name = problem.__name__
+    if module_name not in SUPPORTED_PROBLEMS:
+        raise ValueError(f"Solving by components is not supported for {module_name}.")
+
+    solve_trivial, merge, _ = SUPPORTED_PROBLEMS[module_name]
+
+    solutions = []
+    components = []
+
+    for nodes in connected_components(G.G):
+        component = G.G.subgraph(nodes)
+        if len(nodes) <= 2:
+            solutions.append(solve_trivial(component, **kwargs))
+        else:
+            components.append(component.copy())
+
+    # larger components first to balance the load of the workers
+    components.sort(key=len, reverse=True)
+    chunks = [components[pos:pos + chunk_size] for pos in range(0, len(components), chunk_size)]
+
+    if processes == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            solutions.extend(_solve_components(module_name, chunk, kwargs))
+    else:
+        with get_context('spawn').Pool(processes) as pool:
+            for chunk_solutions in pool.starmap(_solve_components, [(module_name, chunk, kwargs)
+                                                                    for chunk in chunks]):
+                solutions.extend(chunk_solutions)
+
+    return merge(solutions)
@@ -0,0 +1,65 @@
+from heapq import heappush, heappop
+
+
+def get_heuristic(G):
+    r""" DSATUR colouring heuristic (Brélaz)
+
+    The vertices are coloured one by one with the smallest colour not used by their neighbours. The next vertex
+    is always one with the largest number of different colours among its neighbours (saturation), ties are
+    broken by the larger degree. The uncoloured vertices are kept in a bucket queue indexed by saturation
+    with a heap ordered by degree in each bucket; a vertex whose saturation grows is pushed into the next bucket
+    and its old entry is skipped later, so that the running time is :math:`O((|V| + |E|) \log |V|)`.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :return: two dictionaries: {color_1:[list_of_color_1_nodes], ...} and {node_1:color_of_node_1, ...}
+
+    Example:
+        .. code-block::
+
+            col_to_node, node_to_col = vertex_coloring_dsatur.get_heuristic(G)
+            m = min_vertex_coloring.create_model(G, warmstart=node_to_col)
+    """
+    node_list = list(G.G.nodes())
+    node_index = {node: pos for pos, node in enumerate(node_list)}
+    adj = [[node_index[nb] for nb in G.G.adj[node] if nb != node] for node in node_list]
+
+    neighbour_colors = [set() for _ in node_list]
+    color = [-1] * len(node_list)
+
+    # buckets[s] is a heap of (-degree, vertex) for the uncoloured vertices of saturation s
+    buckets = [[(-len(adj[v]), v) for v in range(len(node_list))]]
+    buckets[0].sort()
+    max_saturation = 0
+
+    for _ in range(len(node_list)):
+        # find the uncoloured vertex of maximum saturation, skipping outdated entries
+        while True:
+            bucket = buckets[max_saturation]
+            if len(bucket) == 0:
+                max_saturation -= 1
+                continue
+            _, v = heappop(bucket)
+            if color[v] < 0 and len(neighbour_colors[v]) == max_saturation:
+                break
+
+        # smallest colour not used by a neighbour
+        c = 0
+        while c in neighbour_colors[v]:
+            c += 1
+        color[v] = c
+
+        for u in adj[v]:
+            if color[u] < 0 and c not in neighbour_colors[u]:
+                neighbour_colors[u].add(c)
+                saturation = len(neighbour_colors[u])
+                if saturation == len(buckets):
+                    buckets.append([])
+                heappush(buckets[saturation], (-len(adj[u]), u))
+                max_saturation = max(max_saturation, saturation)
+
+    node_to_col = {node: color[pos] for pos, node in enumerate(node_list)}
+    col_to_node = {}
+    for node, node_color in node_to_col.items():
+        col_to_node.setdefault(node_color, []).append(node)
+
+    return col_to_node, node_to_col
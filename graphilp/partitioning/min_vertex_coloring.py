@@ -1,19 +1,42 @@
+from itertools import count
+
 from gurobipy import Model, GRB, quicksum
 
+from graphilp.partitioning.heuristics import vertex_coloring_dsatur
+from graphilp.sub_super.heuristics import clique_greedy
+
+
+def _relabel(node_to_col, clique):
+    """ Relabel the colours of a (partial) colouring such that the i-th clique vertex gets colour i
+
+    Colours of vertices outside the clique fill the remaining labels 0, 1, 2, ... in increasing order.
+    """
+    relabel = {node_to_col[node]: pos for pos, node in enumerate(clique) if node in node_to_col}
+    free_labels = (pos for pos in count() if pos not in relabel.values())
+    for color in sorted(set(node_to_col.values()) - relabel.keys()):
+        relabel[color] = next(free_labels)
+
+    return {node: relabel[color] for node, color in node_to_col.items()}
 
-def create_model(G, bound_num_colors=-1, warmstart={}):
+
+def create_model(G, bound_num_colors=-1, warmstart={}, fix_clique=True):
     r"""
     Create an ILP for minimum vertex colouring.
 
     :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
     :param bound_num_colors: an upper bound on the number of colours needed in a minimum vertex colouring
     :param warmstart: a dictionary mapping vertices to colours such that connected vertices have different colours
+    :param fix_clique: find a clique with :py:func:`~graphilp.sub_super.heuristics.clique_greedy.get_heuristic` and
+        fix the colours of its vertices to :math:`1, 2, \ldots` to break the symmetry between the colours
+        (at most :math:`H` of them)
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`__
 
     ILP:
-        We allow for up to :math:`H` colours to be used in the solution (if no better bound is given
-        by bound_num_colors, assume :math:`H=|V|`) and introduce variables :math:`w_i` indicating whether
+        We allow for up to :math:`H` colours to be used in the solution (if no bound is given
+        by bound_num_colors, :math:`H` is the number of colours of the warmstart or, without warmstart,
+        of a colouring by :py:func:`~graphilp.partitioning.heuristics.vertex_coloring_dsatur.get_heuristic`,
+        which is then used as warmstart) and introduce variables :math:`w_i` indicating whether
         colour :math:`i` is used in the solution. Variables :math:`x_{vi}` indicate whether colour :math:`i`
         is assigned to vertex :math:`v`.
 
@@ -32,6 +55,12 @@ def create_model(G, bound_num_colors=-1, warmstart={}):
             \text{(only assign colour } i \text{ if colour } i-1 \text{ is assigned)}
             \end{align*}
 
+        With fix_clique, the :math:`i`-th vertex of a clique :math:`K` is fixed to colour :math:`i`, which also
+        implies :math:`w_i = 1` for :math:`i \leq |K|`. If :math:`|K|` equals the number of colours of a heuristic
+        colouring, that colouring is optimal; :py:func:`solve` and
+        :py:func:`~graphilp.partitioning.components.solve` return it without building an ILP,
+        while this function always builds the ILP.
+
     Examples:
         .. list-table::
            :widths: 50 50
@@ -56,14 +85,19 @@ def create_model(G, bound_num_colors=-1, warmstart={}):
     nodes = G.G.nodes()
     edges = G.G.edges()
 
+    if bound_num_colors < 0 and len(warmstart) == 0:
+        _, warmstart = vertex_coloring_dsatur.get_heuristic(G)
+
+    # colour the vertices of a clique with the first colours
+    clique = clique_greedy.get_heuristic(G) if fix_clique else []
+    if len(warmstart) > 0:
+        warmstart = _relabel(warmstart, clique)
+
     # add decision variables
     if bound_num_colors > -1:
         max_number_colors = bound_num_colors
     else:
-        if len(warmstart) > 0:
-            max_number_colors = len(set(warmstart.values()))
-        else:
-            max_number_colors = G.G.number_of_nodes()
+        max_number_colors = len(set(warmstart.values()))
 
     color_used_vars = m.addVars(max_number_colors, name='color_used', vtype=GRB.BINARY)
 
@@ -88,6 +122,12 @@ def create_model(G, bound_num_colors=-1, warmstart={}):
     for i in range(1, len(color_used_vars)):
         m.addConstr(color_used_vars[i] <= color_used_vars[i-1])  # only assign color i if color i-1 is assigned already
 
+    # break symmetry: fix the colours of the clique vertices
+    # (a bound below the clique size makes the model infeasible anyway)
+    for color, node in enumerate(clique[:max_number_colors]):
+        node_color_vars[node, color].LB = 1
+        color_used_vars[color].LB = 1
+
     m.update()
 
     # set warmstart
@@ -98,8 +138,10 @@ def create_model(G, bound_num_colors=-1, warmstart={}):
         for var in node_color_vars.values():
             var.Start = 0
 
+        # a partial warmstart may use labels beyond the number of colours after relabelling
         for node, node_color in warmstart.items():
-            node_color_vars[node, node_color].Start = 1
+            if node_color < max_number_colors:
+                node_color_vars[node, node_color].Start = 1
 
         m.update()
 
@@ -132,3 +174,26 @@ def extract_solution(G, model):
                 col_to_node.get(color).append(node)
 
     return col_to_node, node_to_col
+
+
+def solve(G, **kwargs):
+    """ Solve the minimum vertex colouring problem, without an ILP if the heuristic bounds meet
+
+    A colouring is computed by :py:func:`~graphilp.partitioning.heuristics.vertex_coloring_dsatur.get_heuristic`
+    and a clique by :py:func:`~graphilp.sub_super.heuristics.clique_greedy.get_heuristic`. If both have the same
+    size, the colouring is optimal and returned directly. Otherwise, the ILP is created with the colouring as
+    warmstart, optimised and the solution extracted.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param kwargs: further arguments for :py:func:`create_model` if an ILP is needed
+
+    :return: a dictionary mapping colours to lists of vertices and a dictionary mapping vertices to colours
+    """
+    col_to_node, node_to_col = vertex_coloring_dsatur.get_heuristic(G)
+    if len(col_to_node) <= len(clique_greedy.get_heuristic(G)):
+        return col_to_node, node_to_col
+
+    m = create_model(G, warmstart=node_to_col, **kwargs)
+    m.optimize()
+
+    return extract_solution(G, m)
@@ -0,0 +1,82 @@
+import networkx as nx
+
+
+def _core_numbers(G):
+    """ Core number of every vertex, ignoring self-loops
+    """
+    if nx.number_of_selfloops(G) > 0:
+        G = G.copy()
+        G.remove_edges_from(list(nx.selfloop_edges(G)))
+
+    return nx.core_number(G)
+
+
+def core_vertices(G, k):
+    """ Vertices of the k-core of a graph
+
+    The k-core is the largest subgraph in which every vertex has at least k neighbours.
+    A clique with more than k vertices lies completely inside the k-core.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param k: minimum degree in the core
+
+    :return: a list of the vertices in the k-core
+    """
+    core = _core_numbers(G.G)
+
+    return [node for node in G.G.nodes() if core[node] >= k]
+
+
+def prune(G, warmstart=[]):
+    """ Restrict a graph to the vertices that can be part of a clique larger than a given one
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param warmstart: a list of vertices forming a clique (default: a clique found by :py:func:`get_heuristic`)
+
+    :return: the subgraph of G induced by the :math:`(|K| - 1)`-core, where :math:`K` is the clique,
+        and the clique
+    """
+    if len(warmstart) == 0:
+        warmstart = get_heuristic(G)
+
+    return G.G.subgraph(core_vertices(G, len(warmstart) - 1)), warmstart
+
+
+def get_heuristic(G):
+    """ Greedy clique heuristic in degeneracy order
+
+    The vertices are visited by decreasing core number. Starting from each vertex, a clique is grown greedily by
+    adding the common neighbour of largest core number (ties broken by degree). Since a vertex of core number
+    c lies in no clique with more than c + 1 vertices, the search stops as soon as c + 1 does not exceed
+    the size of the best clique found so far, and neighbours of too small core number are never considered.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+
+    :return: a list of vertices forming a clique
+
+    Example:
+        .. code-block::
+
+            clique = clique_greedy.get_heuristic(G)
+            m = max_clique_pack.create_model(G, warmstart=clique, prune=True)
+    """
+    core = _core_numbers(G.G)
+    degree = dict(G.G.degree())
+
+    best = []
+    for v in sorted(G.G.nodes(), key=lambda node: (-core[node], -degree[node])):
+        if core[v] + 1 <= len(best):
+            break
+
+        clique = [v]
+        candidates = {u for u in G.G.adj[v] if u != v and core[u] >= len(best)}
+        while len(candidates) > 0:
+            u = max(candidates, key=lambda node: (core[node], degree[node]))
+            clique.append(u)
+            candidates.intersection_update(G.G.adj[u])
+            candidates.discard(u)
+
+        if len(clique) > len(best):
+            best = clique
+
+    return best
@@ -0,0 +1,103 @@
+from time import perf_counter
+
+from graphilp.imports.bitset_adjacency import BitsetAdjacency
+
+
+def _colour_classes(candidates, adj, min_colour):
+    """ Greedy colouring of the candidate vertices giving an upper bound for the cliques among them
+
+    The colour classes are built one after the other by taking the candidate of lowest index that is not
+    adjacent to the vertices already in the class. Only vertices whose colour is at least min_colour are
+    returned, since the other ones cannot lead to a larger clique.
+
+    :return: the vertices in order of non-decreasing colour and their colours
+    """
+    order, colours = [], []
+    uncoloured = candidates
+    colour = 0
+    while uncoloured:
+        colour += 1
+        remaining = uncoloured
+        while remaining:
+            lowest = remaining & -remaining
+            v = lowest.bit_length() - 1
+            uncoloured ^= lowest
+            remaining ^= lowest
+            remaining &= ~adj[v]
+            if colour >= min_colour:
+                order.append(v)
+                colours.append(colour)
+
+    return order, colours
+
+
+def get_max_clique(G, time_limit=None):
+    r""" Maximum clique by combinatorial branch and bound with colouring bounds (MCQ)
+
+    The vertices are numbered by non-increasing degree and the neighbourhood of each vertex is stored as a bitset
+    in a Python integer, so that candidate sets are intersected with a single operation. In each node of
+    the search, the candidates are coloured greedily (Tomita and Seki); as vertices of the same colour are
+    pairwise non-adjacent, a clique contains at most one vertex of each colour. The candidates are branched on
+    in order of decreasing colour and the search stops as soon as the size of the current clique plus the colour
+    of the next candidate does not exceed the size of the best clique found so far.
+
+    Self-loops are ignored. Unlike the ILPs in :py:mod:`~graphilp.sub_super.max_clique_pack` and
+    :py:mod:`~graphilp.sub_super.max_clique_cover`, no constraint is created for the non-adjacent pairs, so that
+    dense graphs with thousands of vertices can be handled.
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param time_limit: time budget in seconds (None for no limit); if it is reached, the best clique found
+        so far is returned
+
+    :return: a list of vertices comprising a maximum clique
+
+    Example:
+        .. code-block::
+
+            G = imp_nx.read(mis_to_networkx("brock200_2.clq"))
+            clique = max_clique_branch_bound.get_max_clique(G)
+    """
+    start_time = perf_counter()
+
+    degree = dict(G.G.degree())
+    node_list = sorted(G.G.nodes(), key=lambda node: -degree[node])
+
+    # neighbourhoods as bitsets
+    adj = BitsetAdjacency(G.G, node_list).rows
+
+    best = []
+    clique = []
+    all_vertices = (1 << len(node_list)) - 1
+    stack = [[all_vertices, *_colour_classes(all_vertices, adj, 1)]]
+    steps = 0
+
+    while stack:
+        frame = stack[-1]
+        candidates, order, colours = frame
+
+        if len(order) == 0 or len(clique) + colours[-1] <= len(best):
+            stack.pop()
+            if len(stack) > 0:
+                clique.pop()
+            continue
+
+        steps += 1
+        if time_limit is not None and steps % 1000 == 0 and perf_counter() - start_time > time_limit:
+            break
+
+        v = order.pop()
+        colours.pop()
+        new_candidates = candidates & adj[v]
+        frame[0] = candidates ^ (1 << v)
+
+        if new_candidates == 0:
+            if len(clique) + 1 > len(best):
+                best = clique + [v]
+            continue
+
+        clique.append(v)
+        stack.append([new_candidates, *_colour_classes(new_candidates, adj, len(best) - len(clique) + 1)])
+
+    best = {node_list[v] for v in best}
+
+    return [node for node in G.G.nodes() if node in best]
@@ -1,11 +1,17 @@
 from gurobipy import Model, GRB, quicksum
-from itertools import combinations
 
+from graphilp.sub_super.heuristics import clique_greedy
 
-def create_model(G):
+
+def create_model(G, warmstart=[], prune=False):
     r""" Create an ILP for the maximum clique problem
 
     :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param warmstart: a list of vertices forming a clique
+    :param prune: build the ILP only on the :math:`(\omega' - 1)`-core of G, where :math:`\omega'` is the size of the
+        warmstart clique, or of a clique found by :py:func:`~graphilp.sub_super.heuristics.clique_greedy.get_heuristic`
+        if no warmstart is given (which is then used as warmstart); the objective value then counts the
+        excluded vertices of the core only
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -38,21 +44,33 @@ def create_model(G):
     # Create model
     m = Model("graphilp_max_clique")
 
+    # only vertices of the (omega' - 1)-core can be in a clique larger than the heuristic one
+    if prune:
+        graph, warmstart = clique_greedy.prune(G, warmstart)
+    else:
+        graph = G.G
+
     # Add variables for edges and nodes
-    G.set_node_vars(m.addVars(G.G.nodes(), vtype=GRB.BINARY))
+    G.set_node_vars(m.addVars(graph.nodes(), vtype=GRB.BINARY))
     m.update()
 
     nodes = G.node_variables
 
     # Create constraints
     # for every pair of nodes, at least one node must cover the edge
-    for (u, v) in combinations(G.G.nodes(), 2):
-        if (u, v) not in G.G.edges():
-            m.addConstr(nodes[u] + nodes[v] >= 1)
+    for (u, v) in G.get_bitsets().non_edges(graph.nodes()):
+        m.addConstr(nodes[u] + nodes[v] >= 1)
 
     # set optimisation objective: minimum vertex cover
     m.setObjective(quicksum(nodes), GRB.MINIMIZE)
 
+    # set warmstart
+    if len(warmstart) > 0:
+        warmstart = set(warmstart)
+        for node in nodes:
+            nodes[node].Start = node not in warmstart
+        m.update()
+
     return m
 
 
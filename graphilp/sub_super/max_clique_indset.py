@@ -0,0 +1,125 @@
+from gurobipy import Model, GRB, quicksum
+import numpy as np
+
+from graphilp.sub_super.heuristics import clique_greedy
+
+
+def independent_set_cover(graph):
+    """ Cover all non-adjacent pairs of vertices by maximal independent sets
+
+    The complement adjacency is kept as a NumPy boolean matrix together with the matrix of the pairs that
+    are not covered yet. Each independent set is grown greedily from the vertex with the most uncovered
+    pairs by repeatedly adding the non-adjacent candidate that covers the most uncovered pairs with the
+    vertices already chosen, until no candidate is left. The independent sets are colour classes of a
+    colouring of G which overlap where necessary so that every non-edge lies inside some class.
+
+    :param graph: a `NetworkX graph <https://networkx.org/documentation/stable/reference/introduction.html#graphs>`__
+        (self-loops are ignored)
+
+    :return: a list of lists of vertices, each forming an independent set with at least two vertices
+    """
+    node_list = list(graph.nodes())
+    node_index = {node: pos for pos, node in enumerate(node_list)}
+    n = len(node_list)
+
+    non_adjacent = np.ones((n, n), dtype=bool)
+    for node in node_list:
+        non_adjacent[node_index[node], [node_index[nb] for nb in graph.adj[node]]] = False
+    np.fill_diagonal(non_adjacent, False)
+
+    uncovered = non_adjacent.copy()
+    num_uncovered = uncovered.sum(axis=1)
+
+    independent_sets = []
+    while num_uncovered.any():
+        v = int(np.argmax(num_uncovered))
+        chosen = [v]
+        candidates = non_adjacent[v].copy()
+        score = uncovered[v].astype(np.int64)
+
+        while candidates.any():
+            # candidate covering the most uncovered pairs with the chosen vertices
+            v = int(np.argmax(np.where(candidates, score, -1)))
+            chosen.append(v)
+            candidates &= non_adjacent[v]
+            score += uncovered[v]
+
+        block = np.ix_(chosen, chosen)
+        num_uncovered[chosen] -= uncovered[block].sum(axis=1)
+        uncovered[block] = False
+        independent_sets.append([node_list[v] for v in chosen])
+
+    return independent_sets
+
+
+def create_model(G, warmstart=[], prune=False):
+    r""" Create an ILP for the maximum clique problem with independent set constraints
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param warmstart: a list of vertices forming a clique
+    :param prune: build the ILP only on the :math:`(\omega' - 1)`-core of G, where :math:`\omega'` is the size of the
+        warmstart clique, or of a clique found by :py:func:`~graphilp.sub_super.heuristics.clique_greedy.get_heuristic`
+        if no warmstart is given (which is then used as warmstart)
+
+    :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
+
+    ILP:
+        A clique contains at most one vertex of every independent set. Instead of one constraint for each pair of
+        non-adjacent vertices as in :py:mod:`~graphilp.sub_super.max_clique_pack`, the non-adjacent pairs are
+        covered by a family :math:`\mathcal{I}` of independent sets computed by :py:func:`independent_set_cover`.
+        This needs far fewer constraints and gives a much tighter LP relaxation: its optimum is at most the
+        number of colours of any colouring formed by sets of :math:`\mathcal{I}`.
+
+        .. math::
+            :nowrap:
+
+            \begin{align*}
+            \max \sum_{v \in V} x_v\\
+            \text{s.t.} &&\\
+            \forall I \in \mathcal{I}: \sum_{v \in I} x_v \leq 1 && \text{(at most one vertex of each independent set)}\\
+            \end{align*}
+    """
+    # Create model
+    m = Model("graphilp_max_clique_indset")
+
+    # only vertices of the (omega' - 1)-core can be in a clique larger than the heuristic one
+    if prune:
+        graph, warmstart = clique_greedy.prune(G, warmstart)
+    else:
+        graph = G.G
+
+    # Add variables for nodes
+    G.set_node_vars(m.addVars(graph.nodes(), vtype=GRB.BINARY))
+    m.update()
+
+    nodes = G.node_variables
+
+    # Create constraints
+    # a clique contains at most one vertex of each independent set
+    for ind_set in independent_set_cover(graph):
+        m.addConstr(quicksum(nodes[node] for node in ind_set) <= 1)
+
+    # set optimisation objective: maximum number of vertices
+    m.setObjective(quicksum(nodes.values()), GRB.MAXIMIZE)
+
+    # set warmstart
+    if len(warmstart) > 0:
+        warmstart = set(warmstart)
+        for node in nodes:
+            nodes[node].Start = node in warmstart
+        m.update()
+
+    return m
+
+
+def extract_solution(G, model):
+    """ Get a list of vertices comprising a maximum clique
+
+    :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param model: a solved Gurobi model for maximum clique
+
+    :return: a list of vertices comprising a maximum clique
+    """
+    clique_nodes = [node for node, node_var in G.node_variables.items() if node_var.X > 0.5]
+
+    return clique_nodes
@@ -1,11 +1,16 @@
 from gurobipy import Model, GRB, quicksum
-from itertools import combinations
 
+from graphilp.sub_super.heuristics import clique_greedy
 
-def create_model(G):
+
+def create_model(G, warmstart=[], prune=False):
     r""" Create an ILP for the maximum clique problem
 
     :param G: an :py:class:`~graphilp.imports.ilpgraph.ILPGraph`
+    :param warmstart: a list of vertices forming a clique
+    :param prune: build the ILP only on the :math:`(\omega' - 1)`-core of G, where :math:`\omega'` is the size of the
+        warmstart clique, or of a clique found by :py:func:`~graphilp.sub_super.heuristics.clique_greedy.get_heuristic`
+        if no warmstart is given (which is then used as warmstart)
 
     :return: a `gurobipy model <https://www.gurobi.com/documentation/9.1/refman/py_model.html>`_
 
@@ -22,21 +27,33 @@ def create_model(G):
     # Create model
     m = Model("graphilp_max_clique")
 
+    # only vertices of the (omega' - 1)-core can be in a clique larger than the heuristic one
+    if prune:
+        graph, warmstart = clique_greedy.prune(G, warmstart)
+    else:
+        graph = G.G
+
     # Add variables for edges and nodes
-    G.set_node_vars(m.addVars(G.G.nodes(), vtype=GRB.BINARY))
+    G.set_node_vars(m.addVars(graph.nodes(), vtype=GRB.BINARY))
     m.update()
 
     nodes = G.node_variables
 
     # Create constraints
     # for every pair of nodes, they can only be in the max clique when there is an edge between them
-    for (u, v) in combinations(G.G.nodes(), 2):
-        if (u, v) not in G.G.edges():
-            m.addConstr(nodes[u] + nodes[v] <= 1)
+    for (u, v) in G.get_bitsets().non_edges(graph.nodes()):
+        m.addConstr(nodes[u] + nodes[v] <= 1)
 
     # set optimisation objective: maximum weight matching (sum of weights of chosen edges)
     m.setObjective(quicksum(nodes), GRB.MAXIMIZE)
 
+    # set warmstart
+    if len(warmstart) > 0:
+        warmstart = set(warmstart)
+        for node in nodes:
+            nodes[node].Start = node in warmstart
+        m.update()
+
     return m
 
 
@@ -0,0 +1,23 @@
+# +
+from numpy import array
+
+from graphilp.covering import set_cover as sc
+from graphilp.covering.heuristics import setcover_lagrangian
+from graphilp.imports import ilpsetsystem as ilpss
+
+
+def test_heuristic_set_cover_lagrangian():
+    S = ilpss.ILPSetSystem()
+    S.set_universe([0, 1, 2, 3, 4])
+    S.set_system({'a': {'weight': 3}, 'b': {'weight': 1}, 'c': {'weight': 1}, 'd': {'weight': 2}})
+    M = array([[1, 1, 1, 1, 1], [1, 1, 0, 0, 0], [0, 0, 1, 1, 0], [0, 0, 0, 1, 1]])
+    S.set_inc_matrix(M.transpose())
+
+    cover, lower_bound = setcover_lagrangian.get_heuristic(S)
+
+    m = sc.create_model(S, warmstart=cover)
+    m.optimize()
+
+    assert sorted(cover) == ['a']
+    assert lower_bound <= m.objVal
+    assert m.objVal == 3
@@ -0,0 +1,46 @@
+# +
+from numpy import array, ones
+from numpy.random import default_rng
+
+from graphilp.covering.heuristics import setcover_greedy
+from graphilp.imports import ilpsetsystem as ilpss
+
+
+def test_heuristic_set_cover_lazy():
+    # all sets have the same ratio, ties are broken by the smaller index
+    S = _set_system(array([[1, 1, 0, 0], [0, 0, 1, 1], [1, 0, 1, 0], [0, 1, 0, 1]]), [1, 1, 1, 1])
+    assert setcover_greedy.get_heuristic(S) == [0, 1]
+
+    # at most k sets are chosen even if elements remain uncovered
+    assert setcover_greedy.get_heuristic(S, k=1) == [0]
+
+    # the lazy updates pick the same sets as recomputing all ratios in every step
+    rng = default_rng(0)
+    for _ in range(50):
+        M = (rng.random((8, 30)) < 0.3).astype(int)
+        weights = rng.integers(1, 4, size=8)
+        S = _set_system(M, weights)
+        for k in (None, 3):
+            assert setcover_greedy.get_heuristic(S, k) == _greedy_reference(M, weights, k)
+
+
+def _set_system(M, weights):
+    S = ilpss.ILPSetSystem()
+    S.set_system({_set: {'weight': weight} for _set, weight in enumerate(weights)})
+    S.set_universe({element: {'weight': 1} for element in range(M.shape[1])})
+    S.set_inc_matrix(M.transpose())
+    return S
+
+
+def _greedy_reference(M, weights, k):
+    not_covered = ones(M.shape[1], dtype=int)
+    result = []
+    while not_covered.any() and (k is None or len(result) < k):
+        sizes = M @ not_covered
+        candidates = [(weights[_set] / sizes[_set], _set) for _set in range(M.shape[0]) if sizes[_set] > 0]
+        if len(candidates) == 0:
+            break
+        chosen_set = min(candidates)[1]
+        result.append(chosen_set)
+        not_covered *= 1 - M[chosen_set]
+    return result
@@ -0,0 +1,26 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nximp
+from graphilp.covering import min_vertexcover
+from graphilp.covering.heuristics import vertexcover_lp_rounding
+
+
+def test_heuristic_vertex_cover_lp_rounding():
+    G = nx.disjoint_union(nx.star_graph(4), nx.complete_graph(3))
+
+    zero, half, one = vertexcover_lp_rounding.crown_decomposition(G.adj)
+    assert sorted(zero) == [1, 2, 3, 4]
+    assert sorted(half) == [5, 6, 7]
+    assert sorted(one) == [0]
+
+    optG = nximp.read(G)
+    assert sorted(vertexcover_lp_rounding.get_heuristic(optG)) == [0, 5, 6, 7]
+
+    m = min_vertexcover.create_model(optG, lp_reduction=True)
+    m.optimize()
+    cover = min_vertexcover.extract_solution(optG, m)
+
+    assert m.NumVars == 3
+    assert len(cover) == 3
+    assert all(u in cover or v in cover for u, v in G.edges())
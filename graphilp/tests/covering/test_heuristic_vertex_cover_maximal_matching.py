@@ -0,0 +1,18 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nximp
+from graphilp.covering.heuristics import vertexcover_maximal_matching
+
+
+def test_heuristic_vertex_cover_maximal_matching():
+    optG = nximp.read(nx.star_graph(5))
+
+    assert vertexcover_maximal_matching.get_heuristic(optG) == [0, 1]
+    assert vertexcover_maximal_matching.get_heuristic(optG, order='degree') == [0, 1]
+    assert vertexcover_maximal_matching.get_heuristic(optG, prune=True) == [0]
+
+    optG = nximp.read(nx.petersen_graph())
+    for order in [None, 'degree']:
+        cover = vertexcover_maximal_matching.get_heuristic(optG, order=order, prune=True)
+        assert all(u in cover or v in cover for u, v in optG.G.edges())
@@ -0,0 +1,26 @@
+import numpy as np
+import scipy.sparse as sp
+from graphilp.imports import ilpsetsystem as ilpss
+from graphilp.covering import k_cover as kc
+
+def test_k_cover_collapse_elements():
+    cover_matrix = np.array([[ 0.,  0.,   1, 1],
+            [ 1,  0.,  0., 1],
+            [ 0.,  0,  1, 1],
+            [ 0., 1, 1, 0],
+            [ 1, 0, 0, 1]])
+
+    A = sp.csr_matrix(cover_matrix)
+    sets = {0:{'weight': 4},1:{'weight': 2},2:{'weight': 1}, 3:{'weight':3}}
+    universe = {0:{'weight': 4},1:{'weight': 2},2:{'weight': 1}, 3:{'weight':3}, 4:{'weight': 2}}
+    SetCover = ilpss.ILPSetSystem()
+    SetCover.set_system(sets)
+    SetCover.set_inc_matrix(A)
+    SetCover.set_universe(universe)
+    m = kc.create_model(SetCover, 1, collapse_elements=True)
+    m.optimize()
+
+    assert(list(SetCover.element_classes) == [0, 1, 0, 2, 1])
+    assert(m.NumVars == 4 + 3)
+    assert(m.objVal == 9)
+    assert(kc.extract_solution(SetCover, m) == [3])
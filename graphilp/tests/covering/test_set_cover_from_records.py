@@ -0,0 +1,18 @@
+# +
+from graphilp.imports.ilpsetsystem import ILPSetSystem
+from graphilp.covering import set_cover as sc
+
+def test_set_cover_from_records():
+    records = [('a', [0, 1], 4), ('b', [2], 2), ('c', [0, 3], 1), (('d', 1), [1, 2, 3], 5)]
+    SetCover = ILPSetSystem.from_records(iter(records))
+
+    assert(SetCover.M.shape == (4, 4))
+    assert(SetCover.M.indices.dtype == 'int32')
+    assert(list(SetCover.get_set_names()) == ['a', 'b', 'c', ('d', 1)])
+    assert(SetCover.S['c'] == {'weight': 1})
+
+    m = sc.create_model(SetCover)
+    m.optimize()
+
+    assert(m.objVal == 6)
+    assert(sc.extract_solution(SetCover, m) == ['c', ('d', 1)])
@@ -0,0 +1,42 @@
+# +
+from numpy import array, zeros
+from scipy.sparse import csc_matrix
+from graphilp.imports import ilpsetsystem as ilpss
+from graphilp.covering import set_cover as sc
+from graphilp.covering import set_cover_presolve as scp
+
+def test_set_cover_presolve():
+    cover_matrix = array(
+          [[ 1,  0,  0,  0],
+           [ 1,  1,  0,  1],
+           [ 0,  1,  1,  1],
+           [ 0,  1,  1,  1],
+           [ 0,  0,  1,  1]])
+
+    sets = {'a': {'weight': 1}, 'b': {'weight': 2}, 'c': {'weight': 3}, 'd': {'weight': 2}}
+    universe = [0, 1, 2, 3, 4]
+    SetCover = ilpss.ILPSetSystem()
+    SetCover.set_system(sets)
+    SetCover.set_inc_matrix(cover_matrix)
+    SetCover.set_universe(universe)
+
+    # 'a' is forced, 'b' and 'c' are dominated by 'd' which is forced afterwards
+    remaining_sets, remaining_elements, forced = scp.presolve(SetCover)
+    assert(list(forced) == [0, 3])
+    assert(list(remaining_sets) == [])
+
+    m = sc.create_model(SetCover, presolve=True)
+    m.optimize()
+
+    assert(m.objVal == 3)
+    assert(sc.extract_solution(SetCover, m) == ['a', 'd'])
+
+    # three identical columns keep only the first one, containment of larger columns is found
+    M = csc_matrix(array(
+          [[1, 1, 1, 1, 0],
+           [1, 1, 1, 1, 1],
+           [0, 0, 0, 1, 1],
+           [0, 0, 0, 0, 1]], dtype=bool))
+    assert(list(scp._duplicates(M, zeros(5))) == [False, True, True, False, False])
+    contained = scp._dominated(M[:, [0, 3, 4]], chunk_size=1)
+    assert(sorted(zip(contained.row, contained.col)) == [(0, 1)])
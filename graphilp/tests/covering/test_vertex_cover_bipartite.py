@@ -0,0 +1,31 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nximp
+from graphilp.covering import min_vertexcover, vertexcover_bipartite
+from graphilp.packing import max_indset
+
+
+def test_vertex_cover_bipartite():
+    G = nx.complete_bipartite_graph(2, 3)
+
+    assert vertexcover_bipartite.bipartition(G) == ([0, 1], [2, 3, 4])
+    assert vertexcover_bipartite.bipartition(nx.petersen_graph()) is None
+
+    optG = nximp.read(G)
+    assert min_vertexcover.solve(optG) == [0, 1]
+    assert max_indset.solve(optG) == [2, 3, 4]
+
+    # heavy vertices on the small side make the large side the cheaper cover
+    nx.set_node_attributes(G, {0: 5, 1: 5, 2: 1, 3: 1, 4: 1}, 'weight')
+    optG = nximp.read(G)
+    assert min_vertexcover.solve(optG) == [2, 3, 4]
+
+    # the independent set ignores the weights
+    assert vertexcover_bipartite.get_vertex_cover(optG, weighted=False) == [0, 1]
+    assert max_indset.solve(optG) == [2, 3, 4]
+
+    # without edges, one side of the bipartition is empty
+    G = nx.empty_graph(3)
+    G.nodes[0]['weight'] = 2
+    assert min_vertexcover.solve(nximp.read(G)) == []
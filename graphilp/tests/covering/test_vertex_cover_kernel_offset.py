@@ -0,0 +1,32 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nximp
+from graphilp.covering import min_vertexcover
+from graphilp.packing import max_indset
+from graphilp.packing.indset_reductions import IndependentSetKernel, FoldedVertex
+
+
+def test_vertex_cover_kernel_offset():
+    G = nx.gnp_random_graph(20, 0.2, seed=9)
+
+    # the kernel keeps a folded vertex
+    reduction = IndependentSetKernel(G)
+    assert any(isinstance(node, FoldedVertex) for node in reduction.kernel.nodes())
+
+    min_cover = G.number_of_nodes() - nx.max_weight_clique(nx.complement(G), weight=None)[1]
+
+    optG = nximp.read(G)
+    m = min_vertexcover.create_model(optG, kernelize=True)
+    m.optimize()
+    cover = min_vertexcover.extract_solution(optG, m)
+
+    assert m.objVal == min_cover
+    assert len(cover) == min_cover
+    assert all(u in cover or v in cover for u, v in G.edges())
+
+    m = max_indset.create_model(optG, kernelize=True)
+    m.optimize()
+
+    assert m.objVal == min_cover
+    assert len(max_indset.extract_solution(optG, m)) == G.number_of_nodes() - min_cover
@@ -0,0 +1,25 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nxi
+from graphilp.cuts_flows import min_uncut
+
+
+def test_bitset_adjacency():
+    G = nx.gnp_random_graph(20, 0.5, seed=1)
+    G.add_edge(3, 3)
+    oG = nxi.read(G)
+
+    bitsets = oG.get_bitsets()
+    assert bitsets is oG.get_bitsets()
+    assert {frozenset(e) for e in bitsets.non_edges()} == {frozenset(e) for e in nx.non_edges(G) if e[0] != e[1]}
+    assert list(bitsets.non_edges([0, 1, 2])) == [(u, v) for u, v in [(0, 1), (0, 2), (1, 2)] if not G.has_edge(u, v)]
+    assert bitsets.non_neighbours(3) == [v for v in G.nodes() if v != 3 and not G.has_edge(3, v)]
+    assert bitsets.common_neighbours(0, 1) == len(list(nx.common_neighbors(G, 0, 1)))
+    assert bitsets.nodes(bitsets.neighbours(5)) == sorted(G.adj[5])
+
+    # min uncut builds its variables for the edges of the complement from the bitsets
+    oG = nxi.read(nx.path_graph(4))
+    m = min_uncut.create_model(oG)
+    m.optimize()
+    assert m.objVal == 3
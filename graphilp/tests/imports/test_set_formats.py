@@ -0,0 +1,30 @@
+# +
+from graphilp.imports import set_formats
+from graphilp.covering import knapsack, set_cover as sc
+
+
+def test_set_formats(tmp_path):
+    scp_file = tmp_path / "scp.txt"
+    scp_file.write_text("4 3\n 2 1 3\n2\n 1 3\n1 2\n2 2 3\n1\n 1\n")
+
+    S = set_formats.scp_to_ilpsetsystem(scp_file)
+    assert S.M.shape == (4, 3)
+    assert list(S.get_set_weights()) == [2, 1, 3]
+
+    m = sc.create_model(S)
+    m.optimize()
+    assert m.objVal == 3
+    assert sc.extract_solution(S, m) == [0, 1]
+
+    mknap_file = tmp_path / "mknap.txt"
+    mknap_file.write_text("1\n3 2 7\n5 4 3\n2 4 0\n3 0 1\n5 3\n")
+
+    problems = set_formats.mknap_to_ilpsetsystem(mknap_file)
+    assert len(problems) == 1
+    K, W, optimum = problems[0]
+    assert K.M.nnz == 4
+
+    m = knapsack.create_model(K, W)
+    m.optimize()
+    assert m.objVal == optimum
+    assert knapsack.extract_solution(K, m) == [1, 2]
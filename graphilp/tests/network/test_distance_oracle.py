@@ -0,0 +1,50 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as impnx
+from graphilp.network.distance_oracle import DistanceOracle, is_complete
+from graphilp.network.heuristics import tsp_christofides as CH
+from graphilp.network.heuristics import tsp_nearest_neighbour as NN
+
+
+def test_distance_oracle():
+    G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(5, 5))
+    for u, v in G.edges():
+        G.edges[(u, v)]['weight'] = 1 + (3 * u + v) % 4
+
+    optG = impnx.read(G)
+
+    # cache at most three shortest path trees
+    oracle = DistanceOracle(optG, memory_budget=3 * G.number_of_nodes())
+    alt_oracle = DistanceOracle(optG, landmarks=4)
+
+    for source in [0, 3, 7, 12, 24, 0]:
+        for target in [1, 18, 24]:
+            distance = nx.dijkstra_path_length(G, source, target)
+            assert oracle.distance(source, target) == distance
+            assert alt_oracle.distance(source, target) == distance
+
+            path = oracle.path(source, target)
+            assert path[0] == source and path[-1] == target
+            assert nx.path_weight(G, path, 'weight') == distance
+
+    assert len(oracle.trees) <= 3
+    assert len(alt_oracle.landmarks) == 4
+
+    # heuristics for the TSP work on the metric closure of non-complete graphs
+    tour, length = NN.get_heuristic(optG, oracle=oracle)
+    assert len(tour) == G.number_of_nodes()
+    assert length == sum(oracle.distance(u, v) for u, v in tour)
+
+    # self-loops do not make a graph complete, arcs are needed in both directions
+    P = nx.path_graph(4)
+    P.add_edges_from(((v, v) for v in P.nodes()), weight=0)
+    assert not is_complete(P)
+    assert is_complete(nx.complete_graph(3, nx.DiGraph))
+    assert not is_complete(nx.DiGraph([(0, 1), (1, 2), (2, 0)]))
+
+    optP = impnx.read(P)
+    for heuristic in [NN, CH]:
+        tour, _ = heuristic.get_heuristic(optP)
+        assert sorted(u for u, _ in tour) == [0, 1, 2, 3]
+        assert all(u != v for u, v in tour)
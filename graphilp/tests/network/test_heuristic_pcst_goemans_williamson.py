@@ -0,0 +1,29 @@
+# +
+from networkx import Graph, is_tree
+from graphilp.imports import networkx as impnx
+from graphilp.network.heuristics import pcst_goemans_williamson as gw
+from graphilp.network import pcst_linear
+
+
+def test_heuristic_pcst_goemans_williamson():
+    G = Graph()
+    G.add_weighted_edges_from([(0, 1, 1), (1, 2, 1), (2, 3, 10), (3, 4, 1), (1, 5, 4)])
+    for node, prize in [(0, 5), (1, 0), (2, 5), (3, 0), (4, 2), (5, 1)]:
+        G.nodes[node]['prize'] = prize
+
+    optG = impnx.read(G)
+
+    warmstart, net_worth = gw.get_heuristic(optG)
+
+    T = Graph()
+    T.add_edges_from(warmstart)
+
+    assert is_tree(T)
+    assert set(T.nodes()) == {0, 1, 2}
+    assert net_worth == 8
+
+    # the heuristic solution is optimal and can be used as a warmstart
+    m = pcst_linear.create_model(optG, warmstart=warmstart)
+    m.optimize()
+
+    assert m.objVal == 8
@@ -0,0 +1,32 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as impnx
+from graphilp.network.parallel_paths import ParallelShortestPaths
+from graphilp.network.heuristics import steiner_metric_closure
+
+
+def test_parallel_paths():
+    G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(6, 6))
+    for u, v in G.edges():
+        G.edges[(u, v)]['weight'] = (u + 2 * v) % 4
+
+    optG = impnx.read(G)
+    terminals = [0, 5, 17, 30, 35]
+
+    with ParallelShortestPaths(optG, processes=2, chunk_size=2) as engine:
+        closure_graph = engine.metric_closure(terminals)
+        path_map = engine.paths([(0, 35), (17, 5)])
+
+    for u, v in closure_graph.edges():
+        assert closure_graph.edges[(u, v)]['weight'] == nx.dijkstra_path_length(G, u, v)
+
+    for (u, v), path in path_map.items():
+        assert path[0] == u and path[-1] == v
+        assert nx.path_weight(G, path, 'weight') == nx.dijkstra_path_length(G, u, v)
+
+    # the parallel metric closure heuristic gives the same bound as the sequential one
+    _, lower_bound = steiner_metric_closure.get_heuristic(optG, terminals)
+    _, parallel_lower_bound = steiner_metric_closure.get_heuristic(optG, terminals, processes=2)
+
+    assert lower_bound == parallel_lower_bound
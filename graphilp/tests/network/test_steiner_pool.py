@@ -0,0 +1,28 @@
+# +
+from networkx import grid_2d_graph, convert_node_labels_to_integers
+from graphilp.imports import networkx as impnx
+from graphilp.network import steiner_linear
+from graphilp.network.steiner_pool import SteinerPool
+
+
+def test_steiner_pool():
+    G = convert_node_labels_to_integers(grid_2d_graph(4, 4))
+    for u, v in G.edges():
+        G.edges[(u, v)]['weight'] = 1 + (u * v) % 5
+
+    pool = SteinerPool(impnx.read(G))
+
+    for terminals in [[0, 15], [0, 3, 12, 15], [5, 6, 9], [0, 15]]:
+        tree = pool.solve(terminals)
+        tree_nodes = {u for e in tree for u in e}
+
+        # compare to a model built from scratch
+        optG = impnx.read(G)
+        m = steiner_linear.create_model(optG, terminals)
+        m.optimize()
+
+        assert set(terminals).issubset(tree_nodes)
+        assert pool.model.objVal == m.objVal
+
+    # shortest path trees are only computed for terminals
+    assert set(pool.oracle.trees.keys()).issubset({0, 3, 5, 6, 9, 12, 15})
@@ -0,0 +1,25 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as imp_nx
+from graphilp.packing import clique_packing as cp
+
+
+def test_clique_packing():
+    # two triangles sharing a vertex and a third triangle attached by an edge
+    G = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2), (4, 5), (5, 6), (6, 7), (7, 5)])
+    oG = imp_nx.read(G)
+
+    assert len(cp.k_cliques(oG, 3)) == 3
+
+    m = cp.create_model(oG, 3, enumerate_cliques=True)
+    m.optimize()
+    assert m.objVal == 2
+    cliques = cp.extract_solution(oG, m)
+    assert cliques[5] == cliques[6] == cliques[7] > 0
+    assert sorted(cliques.values()).count(0) == 2
+
+    m = cp.create_model(oG, 3)
+    m.optimize()
+    assert m.objVal == 2
+    assert cp.extract_solution(oG, m)[5] > 0
@@ -0,0 +1,29 @@
+# +
+import networkx as nx
+import pytest
+
+from graphilp.imports import networkx as imp_nx
+from graphilp.packing import max_indset
+from graphilp.packing.heuristics import indset_local_search
+
+
+def test_heuristic_indset_local_search():
+    G_init = nx.cycle_graph(9)
+    G_init.add_edge(0, 0)
+    G = imp_nx.read(G_init)
+
+    # start from a poor solution, the local search has to find four vertices avoiding the self-loop
+    ind_set = indset_local_search.get_heuristic(G, max_iter=100, warmstart=[1, 4])
+    assert len(ind_set) == 4
+    assert 0 not in ind_set
+    assert all(not G_init.has_edge(u, v) for u in ind_set for v in ind_set)
+
+    # duplicates in the warmstart are ignored, adjacent vertices are rejected
+    assert len(indset_local_search.get_heuristic(G, max_iter=100, warmstart=[1, 1, 4])) == 4
+    for warmstart in ([1, 2], [0]):
+        with pytest.raises(ValueError):
+            indset_local_search.get_heuristic(G, max_iter=100, warmstart=warmstart)
+
+    m = max_indset.create_model(G, warmstart=ind_set)
+    m.optimize()
+    assert m.objVal == 5
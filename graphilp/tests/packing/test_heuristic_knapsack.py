@@ -0,0 +1,27 @@
+# +
+import numpy as np
+import scipy.sparse as sp
+from graphilp.imports import ilpsetsystem as ilpss
+from graphilp.covering import knapsack as kp
+from graphilp.covering.heuristics import knapsack_greedy
+
+
+def test_heuristic_knapsack():
+    weight_matrix = np.array([[5, 4, 3, 2], [1, 4, 4, 2]])
+    sets = {0: {'value': 6}, 1: {'value': 5}, 2: {'value': 4}, 3: {'value': 2}}
+
+    S = ilpss.ILPSetSystem()
+    S.set_system(sets)
+    S.set_inc_matrix(sp.csr_matrix(weight_matrix))
+    S.set_universe([0, 1])
+
+    items = knapsack_greedy.get_heuristic(S, np.array([8, 6]))
+    assert items == [0, 2]
+
+    m = kp.create_model(S, np.array([8, 6]), warmstart=items, fix_variables=True)
+    m.optimize()
+    assert m.objVal == 10
+
+    # a single dimension is solved by dynamic programming
+    S.set_inc_matrix(sp.csr_matrix(weight_matrix[:1]))
+    assert knapsack_greedy.get_heuristic(S, 7) == [1, 2]
@@ -0,0 +1,18 @@
+# +
+from numpy import array
+from graphilp.imports import ilpsetsystem as ilpss
+from graphilp.packing.heuristics import setpacking_greedy
+
+
+def test_heuristic_set_packing():
+    S = ilpss.ILPSetSystem()
+    S.set_universe({0: {'weight': 1}, 1: {'weight': 1}, 2: {'weight': 1}, 3: {'weight': 1}})
+    S.set_system({0: {'weight': 1}, 1: {'weight': 1}, 2: {'weight': 3}, 3: {'weight': 1}})
+    M = array([[1, 1, 0, 0], [0, 1, 1, 0], [0, 0, 1, 1], [1, 1, 1, 1]])
+    S.set_inc_matrix(M.transpose())
+
+    packing = setpacking_greedy.get_heuristic(S)
+
+    # sets in the packing are disjoint
+    assert max(sum(M[packing])) <= 1
+    assert packing == [2, 0], "Expected: [2, 0]"
@@ -0,0 +1,23 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nximp
+from graphilp.packing import max_indset
+from graphilp.packing.indset_reductions import IndependentSetKernel
+
+
+def test_indset_reductions():
+    G = nx.disjoint_union(nx.petersen_graph(), nx.path_graph(5))
+    G.add_edges_from([(0, 10), (5, 10)])
+
+    reduction = IndependentSetKernel(G)
+    assert reduction.kernel.number_of_nodes() <= 10
+
+    optG = nximp.read(G)
+    m = max_indset.create_model(optG, kernelize=True)
+    m.optimize()
+
+    ind_set = max_indset.extract_solution(optG, m)
+
+    assert len(ind_set) == 7
+    assert all(not G.has_edge(u, v) for u in ind_set for v in ind_set)
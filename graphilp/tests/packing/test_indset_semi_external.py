@@ -0,0 +1,26 @@
+# +
+from graphilp.imports import networkx as imp_nx
+from graphilp.packing import max_indset
+from graphilp.packing.indset_semi_external import SemiExternalGraph
+
+
+def test_indset_semi_external(tmp_path):
+    # a path 1-2 attached to a 5-cycle 3-7 and a vertex 8 with a self-loop attached to 7
+    edges_file = tmp_path / "graph.edges"
+    edges_file.write_text("% comment\n1 2\n2 3\n3 4\n4 5\n5 6\n6 7\n7 3\n7 8\n8 8\n")
+
+    S = SemiExternalGraph(edges_file, chunk_size=8)
+    ind_set = S.greedy_independent_set()
+    assert len(ind_set) == 3 and 8 not in ind_set
+    cover = set(S.matching_vertex_cover().tolist())
+    assert 8 in cover and all(u in cover or v in cover for u, v in [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7)])
+
+    # vertex 1 is taken and 2 excluded, the 5-cycle remains
+    assert S.reduce() == 5
+    G = imp_nx.read(S.residual_graph())
+    m = max_indset.create_model(G, warmstart=S.greedy_independent_set(residual=True).tolist())
+    m.optimize()
+
+    ind_set = S.lift_independent_set(max_indset.extract_solution(G, m))
+    assert len(ind_set) == 3
+    assert 1 in ind_set and 8 not in ind_set
@@ -0,0 +1,28 @@
+import networkx as nx
+
+from graphilp.imports import networkx as imp_nx
+from graphilp.partitioning import components
+from graphilp.partitioning import min_vertex_coloring
+from graphilp.covering import min_vertexcover
+from graphilp.packing import max_indset
+
+
+def test_components():
+    # three Petersen graphs, an odd cycle, a single edge and an isolated vertex
+    G_init = nx.disjoint_union_all([nx.petersen_graph()] * 3 + [nx.cycle_graph(5), nx.path_graph(2), nx.empty_graph(1)])
+    G = imp_nx.read(G_init)
+
+    cover = components.solve(G, min_vertexcover, processes=2, chunk_size=1)
+    assert len(cover) == 3 * 6 + 3 + 1
+    assert all(u in cover or v in cover for u, v in G_init.edges())
+
+    ind_set = components.solve(G, max_indset, processes=1)
+    assert len(ind_set) == 3 * 4 + 2 + 1 + 1
+
+    color_to_node, node_to_color = components.solve(G, min_vertex_coloring, processes=1)
+    assert len(color_to_node) == 3
+    assert all(node_to_color[u] != node_to_color[v] for u, v in G_init.edges())
+
+    # the heuristic colouring of a bipartite component is optimal, the Petersen graph needs the ILP
+    assert len(components._direct_coloring(imp_nx.read(nx.cycle_graph(6)))[0]) == 2
+    assert components._direct_coloring(imp_nx.read(nx.petersen_graph())) is None
@@ -0,0 +1,46 @@
+import networkx as nx
+from gurobipy import GRB
+
+from graphilp.imports import networkx as imp_nx
+from graphilp.partitioning import min_vertex_coloring
+from graphilp.partitioning.heuristics import vertex_coloring_dsatur, vertex_coloring_greedy
+
+
+def test_heuristic_vertex_coloring_dsatur():
+    # the crown graph is coloured with n/2 colours by the greedy heuristic in this node order, but with two by DSATUR
+    G_init = nx.Graph()
+    G_init.add_nodes_from(range(10))
+    G_init.add_edges_from((2 * i, 2 * j + 1) for i in range(5) for j in range(5) if i != j)
+    G = imp_nx.read(G_init)
+    assert len(vertex_coloring_greedy.get_heuristic(G)[0]) == 5
+
+    col_to_node, node_to_col = vertex_coloring_dsatur.get_heuristic(G)
+    assert len(col_to_node) == 2
+    assert all(node_to_col[u] != node_to_col[v] for u, v in G_init.edges())
+
+    # heuristic colouring and clique have the same size, no ILP needed
+    col_to_node, _ = min_vertex_coloring.solve(G)
+    assert len(col_to_node) == 2
+
+    # the Petersen graph needs three colours and contains no triangle
+    G = imp_nx.read(nx.petersen_graph())
+    m = min_vertex_coloring.create_model(G)
+    assert m.NumVars == 10 * 3 + 3
+    m.optimize()
+    assert m.objVal == 3
+
+    col_to_node, node_to_col = min_vertex_coloring.solve(G)
+    assert len(col_to_node) == 3
+
+    # a bound below the clique size gives an infeasible model
+    m = min_vertex_coloring.create_model(imp_nx.read(nx.complete_graph(5)), bound_num_colors=3)
+    m.optimize()
+    assert m.Status == GRB.INFEASIBLE
+
+    # a partial warmstart does not need to colour the clique
+    m = min_vertex_coloring.create_model(imp_nx.read(nx.complete_graph(4)), bound_num_colors=4, warmstart={0: 0})
+    m.optimize()
+    assert m.objVal == 4
+    m = min_vertex_coloring.create_model(imp_nx.read(nx.cycle_graph(5)), warmstart={0: 0, 1: 1, 2: 2})
+    m.optimize()
+    assert m.objVal == 3
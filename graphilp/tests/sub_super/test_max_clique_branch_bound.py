@@ -0,0 +1,19 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nxi
+from graphilp.sub_super import max_clique_pack as mcp
+from graphilp.sub_super import max_clique_branch_bound
+
+
+def test_max_clique_branch_bound():
+    G = nx.gnp_random_graph(30, 0.5, seed=1)
+    G.add_edge(0, 0)
+    oG = nxi.read(G)
+
+    clique = max_clique_branch_bound.get_max_clique(oG)
+    assert all(G.has_edge(u, v) for u in clique for v in clique if u != v)
+
+    m = mcp.create_model(oG)
+    m.optimize()
+    assert len(clique) == m.objVal
@@ -0,0 +1,28 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nxi
+from graphilp.sub_super import max_clique_indset as mci
+
+
+def test_max_clique_indset():
+    # complete graph with two edges removed
+    graph_size = 10
+    G = nx.complete_graph(graph_size)
+    G.remove_edges_from([(1, 2), (4, 5)])
+
+    independent_sets = mci.independent_set_cover(G)
+    assert sorted(map(sorted, independent_sets)) == [[1, 2], [4, 5]]
+
+    # the non-edges of the 5-cycle form a 5-cycle as well and need five independent sets
+    oG = nxi.read(nx.cycle_graph(5))
+    m = mci.create_model(oG)
+    m.optimize()
+    assert m.NumConstrs == 5
+    assert m.objVal == 2
+    assert len(mci.extract_solution(oG, m)) == 2
+
+    oG = nxi.read(G)
+    m = mci.create_model(oG, prune=True)
+    m.optimize()
+    assert m.objVal == graph_size - 2
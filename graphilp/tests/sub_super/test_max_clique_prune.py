@@ -0,0 +1,28 @@
+# +
+import networkx as nx
+
+from graphilp.imports import networkx as nxi
+from graphilp.sub_super import max_clique_cover as mcc
+from graphilp.sub_super import max_clique_pack as mcp
+from graphilp.sub_super.heuristics import clique_greedy
+
+
+def test_max_clique_prune():
+    # sparse graph with a planted 6-clique
+    G = nx.barabasi_albert_graph(200, 2, seed=1)
+    G.add_edges_from((u, v) for u in range(100, 106) for v in range(u + 1, 106))
+    oG = nxi.read(G)
+
+    clique = clique_greedy.get_heuristic(oG)
+    assert sorted(clique) == list(range(100, 106))
+    assert clique_greedy.core_vertices(oG, 5) == list(range(100, 106))
+
+    m_pack = mcp.create_model(oG, prune=True)
+    assert m_pack.NumVars < 200
+    m_pack.optimize()
+    assert m_pack.objVal == 6
+    assert mcp.extract_solution(oG, m_pack) == list(range(100, 106))
+
+    m_cover = mcc.create_model(oG, warmstart=clique, prune=True)
+    m_cover.optimize()
+    assert mcc.extract_solution(oG, m_cover) == list(range(100, 106))